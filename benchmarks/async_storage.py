@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""async_storage benchmark
+Compares the async storage facade with the blocking methods.
+
+DB mode: concurrent all(State) reads on a SQLite file, run one after the
+other through the sync session, then awaited together through aall(), and
+the longest event loop stall during one read of each kind.
+File mode: the longest event loop stall while saving the store, with the
+sync save() against asave().
+
+Usage: python3 -m benchmarks.async_storage [rows] [concurrent reads]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+from models.engine.db_storage import DBStorage
+from models.engine.file_storage import FileStorage
+from models.state import State
+
+
+async def longest_stall(save):
+    """returns the longest gap between ticks of a 1ms heartbeat task
+    while save() runs
+    """
+    gaps = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    await save()
+    done.set()
+    await task
+    return max(gaps)
+
+
+def db_benchmark(rows, count):
+    """times count reads of rows states, sync and async"""
+    tmp_dir = tempfile.mkdtemp()
+    url = "sqlite:///{}".format(os.path.join(tmp_dir, "bench.db"))
+    with patch.dict(os.environ, {"HBNB_DB_URL": url}):
+        storage = DBStorage()
+    storage.reload()
+    for i in range(rows):
+        storage.new(State(name="State{}".format(i)))
+    storage.save()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        storage.all(State)
+        storage.close()
+    sync_time = time.perf_counter() - start
+
+    async def run():
+        await storage.aall(State)
+        start = time.perf_counter()
+        await asyncio.gather(*[storage.aall(State) for _ in range(count)])
+        return time.perf_counter() - start
+    async_time = asyncio.run(run())
+    print("db: {} x all({} states): sync {:.3f}s, async {:.3f}s".format(
+        count, rows, sync_time, async_time))
+
+    async def sync_all():
+        storage.all(State)
+    sync_stall = asyncio.run(longest_stall(sync_all))
+    async_stall = asyncio.run(longest_stall(lambda: storage.aall(State)))
+    print("db: longest loop stall reading {} states: "
+          "all {:.3f}s, aall {:.3f}s".format(rows, sync_stall, async_stall))
+
+
+def file_benchmark(rows):
+    """measures the event loop stall of save() and asave()"""
+    os.chdir(tempfile.mkdtemp())
+    storage = FileStorage()
+    for i in range(rows):
+        storage.new(State(name="State{}".format(i)))
+
+    async def sync_save():
+        storage.save()
+    sync_stall = asyncio.run(longest_stall(sync_save))
+    async_stall = asyncio.run(longest_stall(storage.asave))
+    print("file: longest loop stall saving {} objects: "
+          "save {:.3f}s, asave {:.3f}s".format(rows, sync_stall, async_stall))
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    db_benchmark(rows, count)
+    file_benchmark(rows)
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""compact_memory benchmark
+Reloads the same file.json of Place objects into a regular FileStorage
+and into one using the compact representation (HBNB_FILE_COMPACT=1), and
+prints the memory each keeps after the reload, the reload time and the
+time of a full scan of the objects.
+
+Usage: python3 -m benchmarks.compact_memory [records]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from benchmarks.from_record import make_records
+from models.engine.file_storage import FileStorage
+
+
+def measure(path, compact):
+    """reloads path and returns (bytes kept, reload s, scan s)"""
+    env = {"HBNB_FILE_COMPACT": "1" if compact else "0"}
+    with patch.object(FileStorage, "_FileStorage__objects", {}), \
+            patch.dict(os.environ, env):
+        storage = FileStorage()
+        storage._FileStorage__file_path = path
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        storage.reload()
+        loaded = time.perf_counter() - start
+        gc.collect()
+        kept = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        total = sum(obj.price_by_night for obj in storage.iter("Place"))
+        scanned = time.perf_counter() - start
+        assert total > 0
+        del storage
+    return kept, loaded, scanned
+
+
+def main(count):
+    """prints the measures of both representations"""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    with open(path, "w") as f:
+        json.dump({"Place.{}".format(r["id"]): r
+                   for r in make_records(count)}, f)
+    results = {}
+    for compact in (False, True):
+        results[compact] = measure(path, compact)
+        kept, loaded, scanned = results[compact]
+        print("{:8} {:>8.1f} MiB {:>6.0f} B/object  reload {:>6.2f}s  "
+              "scan {:>5.2f}s".format(
+                  "compact" if compact else "regular", kept / 2 ** 20,
+                  kept / count, loaded, scanned))
+    print("compact keeps {:.1f}x less memory".format(
+        results[False][0] / results[True][0]))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""compression benchmark
+Saves and reloads the same Place objects with every compression format
+of HBNB_FILE_COMPRESSION at a low, the default and a high level, and
+prints the size of the file and the save and reload times next to the
+uncompressed file. The objects are saved once beforehand so that every
+format is measured with the serialized objects cached.
+
+Usage: python3 -m benchmarks.compression [records]
+"""
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+from benchmarks.from_record import make_records
+from models.engine import compression
+from models.engine.compression import CODECS
+from models.engine.file_storage import FileStorage
+from models.place import Place
+
+LEVELS = {"gzip": (1, 9), "bz2": (1, 9), "xz": (0, 9), "zstd": (1, 19)}
+
+
+def measure(storage, codec, level):
+    """saves and reloads storage, returns (bytes, save s, reload s)"""
+    env = {"HBNB_FILE_COMPRESSION": codec or "none",
+           "HBNB_FILE_COMPRESSION_LEVEL": "" if level is None else
+           str(level)}
+    with patch.dict(os.environ, env):
+        start = time.perf_counter()
+        storage.save()
+        saved = time.perf_counter() - start
+        path = storage._FileStorage__file_path + compression.suffix(
+            compression.codec_of(codec))
+        size = os.path.getsize(path)
+        objects = storage._FileStorage__objects
+        start = time.perf_counter()
+        storage.reload()
+        loaded = time.perf_counter() - start
+        storage._FileStorage__objects = objects
+    return size, saved, loaded
+
+
+def main(count):
+    """prints the measures of every format and level"""
+    with patch.object(FileStorage, "_FileStorage__objects", {}):
+        storage = FileStorage()
+        tmp = tempfile.TemporaryDirectory()
+        storage._FileStorage__file_path = os.path.join(tmp.name, "file.json")
+        for record in make_records(count):
+            storage.new(Place.from_record(record))
+        measure(storage, None, None)
+        plain = measure(storage, None, None)
+        print("{:>9} records".format(count))
+        print("{:14} {:>9} {:>6} {:>8} {:>8}".format(
+            "format", "KiB", "ratio", "save s", "reload s"))
+        runs = [(None, None)]
+        for codec, (low, high) in LEVELS.items():
+            if compression.codec_of(codec) != codec:
+                print("{:14} skipped, zstandard is not installed".format(
+                    codec))
+                continue
+            runs += [(codec, level) for level in (low, None, high)
+                     if level != CODECS[codec][1]]
+        for codec, level in runs:
+            size, saved, loaded = plain if codec is None else \
+                measure(storage, codec, level)
+            name = codec or "none"
+            if codec is not None:
+                name += "-{}".format(
+                    CODECS[codec][1] if level is None else level)
+            print("{:14} {:>9.0f} {:>5.1f}x {:>8.2f} {:>8.2f}".format(
+                name, size / 1024, plain[0] / size, saved, loaded))
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+"""from_record benchmark
+Compares building objects from file.json records with the kwargs
+constructor and with BaseModel.from_record, then times FileStorage.reload
+of a file holding the same records.
+
+Usage: python3 -m benchmarks.from_record [records]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from models.engine.file_storage import FileStorage
+from models.ids import batch_ids
+from models.place import Place
+
+
+def make_records(count):
+    """returns count Place records as to_dict makes them, created over
+    a few hours so that timestamps repeat like in a bulk import
+    """
+    start = datetime(2024, 1, 1)
+    records = []
+    for i, id in enumerate(batch_ids(count)):
+        date = (start + timedelta(seconds=i // 100)).isoformat()
+        records.append({
+            "id": id, "created_at": date, "updated_at": date,
+            "name": "Place {}".format(i), "city_id": "c", "user_id": "u",
+            "number_rooms": 2, "price_by_night": 100 + i % 50,
+            "__class__": "Place",
+        })
+    return records
+
+
+def timed(build, records):
+    """returns the records per second of build over records"""
+    start = time.perf_counter()
+    for record in records:
+        build(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main(count):
+    """prints the throughput of both constructors and of reload"""
+    records = make_records(count)
+    print("{:>9} records".format(count))
+    print("kwargs      {:>10.0f} records/s".format(
+        timed(lambda r: Place(**r), records)))
+    print("from_record {:>10.0f} records/s".format(
+        timed(Place.from_record, records)))
+
+    storage = FileStorage()
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    storage._FileStorage__file_path = path
+    storage._FileStorage__objects = {}
+    for record in records:
+        storage.new(Place.from_record(record))
+    storage.save()
+    start = time.perf_counter()
+    storage.reload()
+    print("reload      {:>10.0f} records/s".format(
+        count / (time.perf_counter() - start)))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
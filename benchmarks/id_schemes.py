@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+"""id_schemes benchmark
+Compares the id schemes of models.ids: generation speed one at a time and
+in batches, insert throughput into a SQLite table clustered on its id
+(WITHOUT ROWID, like an InnoDB primary key), the size of that primary key
+index, and the size of a file.json holding the ids.
+
+Usage: python3 -m benchmarks.id_schemes [rows]
+"""
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from models import ids
+
+
+def insert_rows(id_list):
+    """inserts one row per id, 1000 per transaction, and returns the
+    elapsed seconds and the size in bytes of the table
+    """
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE places (id VARCHAR(60) PRIMARY KEY, "
+                 "created_at DATETIME, name VARCHAR(128)) WITHOUT ROWID")
+    now = datetime.utcnow().isoformat()
+    start = time.perf_counter()
+    for i in range(0, len(id_list), 1000):
+        conn.executemany("INSERT INTO places VALUES (?, ?, ?)",
+                         [(id, now, "place") for id in id_list[i:i + 1000]])
+        conn.commit()
+    elapsed = time.perf_counter() - start
+    size = conn.execute(
+        "SELECT SUM(pgsize) FROM dbstat WHERE name = 'places'").fetchone()[0]
+    conn.close()
+    return elapsed, size
+
+
+def file_size(id_list):
+    """returns the size of a file.json holding one object per id"""
+    now = datetime.utcnow().isoformat()
+    objs = {"Place.{}".format(id): {"id": id, "created_at": now,
+                                    "updated_at": now, "__class__": "Place"}
+            for id in id_list}
+    return len(json.dumps(objs))
+
+
+def main(rows):
+    """prints the measures of every scheme"""
+    for scheme in ids.SCHEMES:
+        start = time.perf_counter()
+        for _ in range(rows):
+            ids.new_id(scheme)
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        id_list = ids.batch_ids(rows, scheme)
+        batch = time.perf_counter() - start
+        elapsed, size = insert_rows(id_list)
+        print("{:6} new_id {:>9.0f}/s  batch_ids {:>9.0f}/s  "
+              "insert {:>8.0f} rows/s  pk index {:>6.1f} MiB  "
+              "file.json {:>6.1f} MiB".format(
+                  scheme, rows / single, rows / batch, rows / elapsed,
+                  size / 2 ** 20, file_size(id_list) / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+"""mapped_reads benchmark
+Saves the same Place objects as file.json and as a record file
+(HBNB_FILE_MAPPED=1), then, for both, prints the time from reload() to
+the first get() of one object, the memory kept by the process and the
+time of further get() calls, as console show and /states/<id> do.
+
+Usage: python3 -m benchmarks.mapped_reads [records]
+"""
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from benchmarks.from_record import make_records
+from models.engine import mapped_store
+from models.engine.file_storage import FileStorage
+
+
+def measure(path, mapped, ids):
+    """reloads path, returns (bytes kept, first get s, get us)"""
+    env = {"HBNB_FILE_MAPPED": "1" if mapped else "0"}
+    with patch.object(FileStorage, "_FileStorage__objects", {}), \
+            patch.dict(os.environ, env):
+        storage = FileStorage()
+        storage._FileStorage__file_path = path
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        storage.reload()
+        assert storage.get("Place", ids[0]) is not None
+        first = time.perf_counter() - start
+        gc.collect()
+        kept = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for id in ids:
+            storage.get("Place", id)
+        each = (time.perf_counter() - start) / len(ids)
+        del storage
+    return kept, first, each * 1e6
+
+
+def main(count):
+    """prints the measures of both formats"""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    records = make_records(count)
+    with open(path, "w") as f:
+        json.dump({"Place.{}".format(r["id"]): r for r in records}, f)
+    mapped_store.write(path + mapped_store.SUFFIX, (
+        ("Place.{}".format(r["id"]), json.dumps(r).encode())
+        for r in records))
+    ids = [r["id"] for r in random.sample(records, min(count, 1000))]
+    del records
+    for mapped in (False, True):
+        kept, first, each = measure(path, mapped, ids)
+        print("{:8} reload + first get {:>7.3f}s  kept {:>8.1f} MiB  "
+              "get {:>5.1f}us".format("mapped" if mapped else "json",
+                                      first, kept / 2 ** 20, each))
+    os.remove(path)
+    os.remove(path + mapped_store.SUFFIX)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -5,8 +5,8 @@ import sys
 import re
 import os
 from datetime import datetime
-import uuid
 from models.base_model import BaseModel
+from models.ids import new_id
 from models.__init__ import storage
 from models.user import User
 from models.place import Place
@@ -160,7 +160,7 @@ class HBNBCommand(cmd.Cmd):
             return
         if os.getenv('HBNB_TYPE_STORAGE') == 'db':
             if not hasattr(obj_kwargs, 'id'):
-                obj_kwargs['id'] = str(uuid.uuid4())
+                obj_kwargs['id'] = new_id()
             if not hasattr(obj_kwargs, 'created_at'):
                 obj_kwargs['created_at'] = str(datetime.now())
             if not hasattr(obj_kwargs, 'updated_at'):
@@ -203,11 +203,11 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
 
-        key = c_name + "." + c_id
-        try:
-            print(storage._FileStorage__objects[key])
-        except KeyError:
+        obj = storage.get(c_name, c_id)
+        if obj is None:
             print("** no instance found **")
+        else:
+            print(obj)
 
     def help_show(self):
         """ Help information for the show command """
@@ -234,13 +234,12 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
 
-        key = c_name + "." + c_id
-
-        try:
-            del(storage.all()[key])
-            storage.save()
-        except KeyError:
+        obj = storage.get(c_name, c_id)
+        if obj is None:
             print("** no instance found **")
+            return
+        storage.delete(obj)
+        storage.save()
 
     def help_destroy(self):
         """ Help information for the destroy command """
@@ -282,6 +281,44 @@ class HBNBCommand(cmd.Cmd):
         """ """
         print("Usage: count <class_name>")
 
+    def do_stats(self, args):
+        """ Prints the SQL statement statistics of the storage engine """
+        if not hasattr(storage, 'query_stats'):
+            print("** no query stats for this storage **")
+            return
+        report = storage.query_stats()
+        for method, histogram in report['methods'].items():
+            print("{}: {} statements, avg {:.2f} ms, max {:.2f} ms, {}".format(
+                method, histogram['count'], histogram['avg_ms'],
+                histogram['max_ms'], histogram['buckets']))
+        for query in report['slow']:
+            print("slow: {} {:.2f} ms {}".format(
+                query['method'], query['ms'], query['statement']))
+
+    def help_stats(self):
+        """ Help information for the stats command """
+        print("Prints SQL statement timings of the database storage")
+        print("[Usage]: stats\n")
+
+    def do_rebuild_aggregates(self, args):
+        """ Recomputes the aggregates and reports the inconsistent ones """
+        if not hasattr(storage, 'rebuild_aggregates'):
+            print("** no aggregates for this storage **")
+            return
+        wrong = storage.rebuild_aggregates()
+        if not wrong:
+            print("aggregates are consistent")
+            return
+        print("rebuilt {} inconsistent aggregates:".format(len(wrong)))
+        for key in wrong:
+            print(key)
+
+    def help_rebuild_aggregates(self):
+        """ Help information for the rebuild_aggregates command """
+        print("Recomputes the place and review counts and average prices")
+        print("and lists the maintained ones that were wrong")
+        print("[Usage]: rebuild_aggregates\n")
+
     def do_update(self, args):
         """ Updates a certain object with new info """
         c_name = c_id = att_name = att_val = kwargs = ''
@@ -309,7 +346,7 @@ class HBNBCommand(cmd.Cmd):
         key = c_name + "." + c_id
 
         # determine if key is present
-        if key not in storage.all():
+        if key not in storage.snapshot():
             print("** no instance found **")
             return
 
@@ -343,7 +380,7 @@ class HBNBCommand(cmd.Cmd):
             args = [att_name, att_val]
 
         # retrieve dictionary of current objects
-        new_dict = storage.all()[key]
+        new_dict = storage.snapshot()[key]
 
         # iterate through attr names and values
         for i, att_name in enumerate(args):
@@ -361,7 +398,7 @@ class HBNBCommand(cmd.Cmd):
                     att_val = HBNBCommand.types[att_name](att_val)
 
                 # update dictionary with name, value pair
-                new_dict.__dict__.update({att_name: att_val})
+                setattr(new_dict, att_name, att_val)
 
         new_dict.save()  # save updates to file
 
@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+"""explain_storage module
+Runs EXPLAIN on the queries issued by the storage engine and the web pages
+and reports the ones that scan a whole table instead of using an index.
+
+Usage: ./explain_storage.py [database url]
+The url defaults to the one DBStorage builds from the environment.
+Supports MySQL and SQLite databases.
+"""
+import sys
+from datetime import datetime
+
+from sqlalchemy import and_, create_engine, func, or_, select
+
+from models.amenity import Amenity
+from models.base_model import Base
+from models.city import City
+from models.engine.db_storage import db_url
+from models.place import Place, place_amenity
+from models.review import Review
+from models.state import State
+
+SAMPLE_ID = "00000000-0000-0000-0000-000000000000"
+SAMPLE_DATE = datetime(2020, 1, 1)
+
+queries = {
+    "states by name": select(State).order_by(State.name),
+    "cities of a state": select(City).where(
+        City.state_id == SAMPLE_ID).order_by(City.name),
+    "amenities by name": select(Amenity).order_by(Amenity.name),
+    "places by name": select(Place).order_by(Place.name),
+    "places of a city by price": select(Place).where(
+        Place.city_id == SAMPLE_ID).order_by(Place.price_by_night),
+    "places of a user": select(Place).where(Place.user_id == SAMPLE_ID),
+    "reviews of a place": select(Review).where(
+        Review.place_id == SAMPLE_ID),
+    "reviews of a user": select(Review).where(Review.user_id == SAMPLE_ID),
+    "places with an amenity": select(place_amenity).where(
+        place_amenity.c.amenity_id == SAMPLE_ID),
+    "places with all amenities": select(Place).where(Place.id.in_(
+        select(place_amenity.c.place_id).where(
+            place_amenity.c.amenity_id.in_([SAMPLE_ID, SAMPLE_ID[::-1]]),
+        ).group_by(place_amenity.c.place_id).having(func.count() == 2))),
+    "places of a city in a price range": select(Place).where(
+        Place.city_id == SAMPLE_ID, Place.price_by_night.between(50, 150),
+    ).order_by(Place.price_by_night, Place.id),
+    "cheapest places": select(Place).order_by(
+        Place.price_by_night, Place.id).limit(10),
+    "price percentile of a city": select(Place.price_by_night).where(
+        Place.city_id == SAMPLE_ID).order_by(
+        Place.price_by_night).offset(10).limit(1),
+    "places in a box": select(Place).where(
+        Place.latitude.between(6.0, 7.0),
+        Place.longitude.between(3.0, 4.0)),
+    "page of places by name": select(Place).where(or_(
+        Place.name > "m", and_(Place.name == "m", Place.id > SAMPLE_ID),
+    )).order_by(Place.name, Place.id).limit(25),
+    "page of reviews by date": select(Review).where(or_(
+        Review.created_at > SAMPLE_DATE,
+        and_(Review.created_at == SAMPLE_DATE, Review.id > SAMPLE_ID),
+    )).order_by(Review.created_at, Review.id).limit(25),
+}
+
+
+def is_full_scan(dialect, row):
+    """tells whether an EXPLAIN output row reads a whole table
+    Args:
+        dialect (str): sqlalchemy dialect name, "mysql" or "sqlite"
+        row (dict): one row of the EXPLAIN output
+    """
+    if dialect == "sqlite":
+        detail = row["detail"]
+        return detail.startswith("SCAN") and "INDEX" not in detail
+    return row.get("type") == "ALL"
+
+
+def explain_queries(engine):
+    """runs EXPLAIN on every query of the queries dictionary
+    Returns:
+        list: (name, sql, plan rows, full scan) tuples
+    """
+    dialect = engine.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    report = []
+    with engine.connect() as conn:
+        for name, query in queries.items():
+            sql = str(query.compile(
+                engine, compile_kwargs={"literal_binds": True}))
+            rows = [dict(r._mapping)
+                    for r in conn.exec_driver_sql(prefix + sql)]
+            full_scan = any(is_full_scan(dialect, r) for r in rows)
+            report.append((name, sql, rows, full_scan))
+    return report
+
+
+def main(url):
+    """prints the EXPLAIN report for the database at url"""
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    full_scans = 0
+    for name, sql, rows, full_scan in explain_queries(engine):
+        full_scans += full_scan
+        print("[{}] {}".format("FULL SCAN" if full_scan else "ok", name))
+        for row in rows:
+            print("    {}".format(row))
+    return full_scans
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main(sys.argv[1] if len(sys.argv) > 1 else db_url()) else 0)
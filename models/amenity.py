@@ -3,7 +3,7 @@
 This Module contains a definition for Amenity Class
 """
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlalchemy.orm import relationship
 
 from models.base_model import Base, BaseModel
@@ -17,5 +17,9 @@ class Amenity(BaseModel, Base):
     """
 
     __tablename__ = "amenities"
+    __table_args__ = (
+        Index("ix_amenities_created_at_id", "created_at", "id"),
+        Index("ix_amenities_name_id", "name", "id"),
+    )
     name = Column(String(128), nullable=False)
     place_amenities = relationship("Place", secondary=place_amenity)
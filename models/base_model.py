@@ -3,16 +3,67 @@
 This Module contains a definition for BaseModel Class
 """
 
-import uuid
+import json
+import weakref
 from datetime import datetime
+from functools import lru_cache
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, String, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import configure_mappers
 
 import models
+from models import ids
+from models.engine import events
 
 Base = declarative_base()
 
+# serialized forms of the objects, as (attribute count, dict, json bytes)
+_serialized = weakref.WeakKeyDictionary()
+_IMMUTABLE = frozenset((str, int, float, bool, type(None)))
+# names of the attributes set since the storage last took them, only
+# recorded while an event stream gathers changes
+_changed = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value):
+    """parses an isoformat timestamp, remembering the recent ones"""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=None)
+def instance_factory(cls):
+    """returns a function making a bare instance of cls, with the state
+    SQLAlchemy needs for mapped classes but without calling __init__
+    """
+    mapper = inspect(cls, raiseerr=False)
+    if mapper is None:
+        return lambda: cls.__new__(cls)
+    # __init__ would configure the relationships on first use
+    configure_mappers()
+    return mapper.class_manager.new_instance
+
+
+def forget_serialized(obj, *args):
+    """drops the cached serialized forms of obj"""
+    _serialized.pop(obj, None)
+
+
+def changed_fields(obj):
+    """returns the sorted names of the attributes of obj set since the
+    last call, None for objects that do not track them, like the RowProxy
+    stand-ins of compact storage, which only claim the class of a model
+    """
+    if not issubclass(type(obj), BaseModel):
+        return None
+    return tuple(sorted(_changed.pop(obj, ())))
+
+
+# SQLAlchemy writes reloaded column values straight into __dict__
+for _name in ("refresh", "refresh_flush", "expire"):
+    event.listen(Base, _name, forget_serialized, propagate=True)
+
 
 class BaseModel:
     """BaseModel Class"""
@@ -29,7 +80,7 @@ class BaseModel:
             *args.
             **kwargs (dict): Key/value pairs
         """
-        self.id = str(uuid.uuid4())
+        self.id = ids.new_id()
         self.created_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
 
@@ -42,6 +93,38 @@ class BaseModel:
                 else:
                     setattr(self, k, v)
 
+    @classmethod
+    def from_record(cls, record):
+        """builds an instance from a trusted dictionary made by to_dict,
+        assigning it as is instead of generating a default id and dates
+        and setting the attributes one by one
+        Args:
+            record (dict): Key/value pairs, dates in isoformat
+        """
+        obj = instance_factory(cls)()
+        attrs = obj.__dict__
+        attrs.update(record)
+        attrs.pop("__class__", None)
+        for k in ("created_at", "updated_at"):
+            v = attrs.get(k)
+            if isinstance(v, str):
+                attrs[k] = parse_datetime(v)
+        return obj
+
+    def __setattr__(self, name, value):
+        """sets an attribute, forgets the cached serialized forms and,
+        while an event stream gathers changes, records the attribute as
+        changed
+        """
+        _serialized.pop(self, None)
+        if events.gathering:
+            changed = _changed.get(self)
+            if changed is None:
+                _changed[self] = {name}
+            else:
+                changed.add(name)
+        super().__setattr__(name, value)
+
     def save(self):
         """Update updated_at with the current datetime."""
         self.updated_at = datetime.now()
@@ -57,16 +140,37 @@ class BaseModel:
         returns a dictionary containing all
         keys/values of __dict__ of the instance
         """
-        bs_dict = (
-            {
-                k: (v.isoformat() if isinstance(v, datetime) else v)
-                for (k, v) in self.__dict__.items()
-            }
-        )
+        return dict(self.__serialized()[1])
+
+    def to_json(self):
+        """returns the dictionary of to_dict encoded as JSON bytes"""
+        entry = self.__serialized()
+        if entry[2] is None:
+            entry = entry[:2] + (json.dumps(entry[1]).encode(),)
+            if self in _serialized:
+                _serialized[self] = entry
+        return entry[2]
+
+    def __serialized(self):
+        """returns the cached (attribute count, dict, json bytes) entry of
+        the instance, building it if an attribute changed since. Objects
+        holding anything but strings and numbers are not cached, since
+        lists and the like can change in place
+        """
+        attrs = self.__dict__
+        entry = _serialized.get(self)
+        # lazy loads and expiry add and remove keys without __setattr__
+        if entry is not None and entry[0] == len(attrs):
+            return entry
+        bs_dict = {
+            k: (v.isoformat() if isinstance(v, datetime) else v)
+            for (k, v) in attrs.items() if k != "_sa_instance_state"
+        }
         bs_dict["__class__"] = self.__class__.__name__
-        if "_sa_instance_state" in list(bs_dict.keys()):
-            del bs_dict["_sa_instance_state"]
-        return bs_dict
+        entry = (len(attrs), bs_dict, None)
+        if _IMMUTABLE.issuperset(map(type, bs_dict.values())):
+            _serialized[self] = entry
+        return entry
 
     def __str__(self) -> str:
         """should print/str representation of the BaseModel instance."""
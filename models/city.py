@@ -3,7 +3,7 @@
 This Module contains a definition for City Class
 """
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
 from models.base_model import Base, BaseModel
@@ -16,6 +16,11 @@ class City(BaseModel, Base):
         state_id (str): the state id
     """
     __tablename__ = "cities"
+    __table_args__ = (
+        Index("ix_cities_state_id_name", "state_id", "name"),
+        Index("ix_cities_created_at_id", "created_at", "id"),
+        Index("ix_cities_name_id", "name", "id"),
+    )
     state_id = Column(String(60), ForeignKey("states.id"), nullable=False)
     name = Column(String(128), nullable=False)
     places = relationship(
@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+"""Module aggregates
+This Module contains a definition for Aggregates Class, the place and
+review counts and average prices per city and per state both storage
+engines keep up to date
+"""
+
+CLASSES = ("State", "City", "Place")
+
+
+class Aggregates:
+    """Totals of the places and reviews of every city and state, and the
+    review count of every place, updated one object at a time so reading
+    them never walks the relationships. A city counts its places, the sum
+    of their prices and their reviews, a state adds up its cities
+    """
+
+    def __init__(self):
+        """Initializes Aggregates Class"""
+        self.__places = {}
+        self.__reviews = {}
+        self.__place_reviews = {}
+        self.__states = {}
+        self.__totals = {"City": {}, "State": {}}
+
+    def add(self, obj):
+        """counts a Place or a Review, or records the state of a City,
+        other objects are ignored
+        """
+        name = obj.__class__.__name__
+        if name == "Place":
+            self.add_place(obj)
+        elif name == "Review":
+            self.add_review(obj)
+        elif name == "City":
+            self.set_city(obj.id, obj.state_id)
+
+    def remove(self, obj):
+        """removes a Place, a Review or a City"""
+        name = obj.__class__.__name__
+        if name == "Place":
+            self.remove_place(obj.id)
+        elif name == "Review":
+            self.remove_review(obj.id)
+        elif name == "City":
+            self.set_city(obj.id, None)
+
+    def add_place(self, place):
+        """counts place in its city, moving it if its city or price
+        changed
+        """
+        entry = (place.city_id, place.price_by_night)
+        old = self.__places.get(place.id)
+        if old == entry:
+            return
+        if old is not None:
+            self.remove_place(place.id)
+        self.__places[place.id] = entry
+        self.__bump(entry[0], 1, entry[1],
+                    self.__place_reviews.get(place.id, 0))
+
+    def remove_place(self, id):
+        """removes the place with the given id from its city"""
+        entry = self.__places.pop(id, None)
+        if entry is not None:
+            self.__bump(entry[0], -1, entry[1],
+                        -self.__place_reviews.get(id, 0))
+
+    def add_review(self, review):
+        """counts review for its place, moving it if its place changed"""
+        old = self.__reviews.get(review.id)
+        if old == review.place_id:
+            return
+        if old is not None:
+            self.remove_review(review.id)
+        self.__reviews[review.id] = review.place_id
+        self.__count_review(review.place_id, 1)
+
+    def remove_review(self, id):
+        """removes the review with the given id from its place"""
+        place_id = self.__reviews.pop(id, None)
+        if place_id is not None:
+            self.__count_review(place_id, -1)
+
+    def set_city(self, city_id, state_id):
+        """records the state of a city, None to forget the city, moving
+        the totals of the city to its new state
+        """
+        old = self.__states.get(city_id)
+        if old == state_id:
+            return
+        totals = self.__totals["City"].get(city_id)
+        if totals is not None:
+            self.__add(self.__totals["State"], old,
+                       [-total for total in totals])
+            self.__add(self.__totals["State"], state_id, totals)
+        if state_id is None:
+            del self.__states[city_id]
+        else:
+            self.__states[city_id] = state_id
+
+    def get(self, cls, id):
+        """returns the aggregates of an object: the reviews of a Place,
+        the places, reviews and average price of a City or a State
+        """
+        if cls not in CLASSES:
+            raise ValueError("no aggregates for {}".format(cls))
+        if cls == "Place":
+            return {"reviews": self.__place_reviews.get(id, 0)}
+        places, price, priced, reviews = \
+            self.__totals[cls].get(id, (0, 0, 0, 0))
+        return {"places": places, "reviews": reviews,
+                "average_price": price / priced if priced else None}
+
+    def totals(self):
+        """returns every non-zero aggregate by (class name, id), for
+        comparing two Aggregates
+        """
+        found = {("Place", id): count
+                 for id, count in self.__place_reviews.items()}
+        for cls, totals in self.__totals.items():
+            found.update(((cls, id), tuple(total))
+                         for id, total in totals.items())
+        return found
+
+    def __count_review(self, place_id, count):
+        """adds count reviews to a place and to its city"""
+        reviews = self.__place_reviews.get(place_id, 0) + count
+        if reviews:
+            self.__place_reviews[place_id] = reviews
+        else:
+            self.__place_reviews.pop(place_id, None)
+        entry = self.__places.get(place_id)
+        if entry is not None:
+            self.__bump(entry[0], 0, None, count)
+
+    def __bump(self, city_id, places, price, reviews):
+        """adds places places of the given price and reviews reviews to a
+        city and its state
+        """
+        priced = 0 if price is None else places
+        delta = [places, priced and price * places, priced, reviews]
+        self.__add(self.__totals["City"], city_id, delta)
+        self.__add(self.__totals["State"], self.__states.get(city_id), delta)
+
+    @staticmethod
+    def __add(totals, id, delta):
+        """adds delta to the totals of id, dropping totals back to zero"""
+        if id is None:
+            return
+        total = [a + b for a, b in zip(totals.get(id, (0, 0, 0, 0)), delta)]
+        if any(total):
+            totals[id] = total
+        else:
+            totals.pop(id, None)
+
+
+def differences(maintained, rebuilt):
+    """returns the sorted "<class name>.<id>" keys of the aggregates that
+    differ between two Aggregates
+    """
+    old, new = maintained.totals(), rebuilt.totals()
+    return sorted("{}.{}".format(*key) for key in old.keys() | new.keys()
+                  if old.get(key) != new.get(key))
@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+"""Module backup
+This Module contains the checkpoints the storage engines write with
+checkpoint() and the functions rebuilding a store from them. A backup
+directory holds numbered checkpoints: a full one, either every object as
+gzip compressed JSON lines or, for SQLite, a copy of the database made
+with its backup API, followed by increments holding only the objects
+stored or deleted since the checkpoint before. restore() replays the
+last full checkpoint and the increments after it
+"""
+
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+from models.engine import compression, fulltext
+
+FULL = "full"
+INCREMENT = "incr"
+# columns of place_amenity pointing to the objects of each class
+LINKS = {"Place": "place_id", "Amenity": "amenity_id"}
+
+_NAME = re.compile(r"^(\d+)-({}|{})\.(jsonl\.gz|sqlite)$".format(
+    FULL, INCREMENT))
+
+
+def checkpoints(directory):
+    """returns the (number, kind, path) of the checkpoints of directory,
+    in the order they were taken
+    """
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in os.listdir(directory):
+        match = _NAME.match(name)
+        if match:
+            found.append((int(match.group(1)), match.group(2),
+                          os.path.join(directory, name)))
+    return sorted(found)
+
+
+def next_path(directory, kind, sqlite=False):
+    """returns the path of the next checkpoint of directory, creating the
+    directory if needed
+    Args:
+        directory (str): backup directory
+        kind (str): FULL or INCREMENT
+        sqlite (bool): whether it is a copy of a SQLite database
+    """
+    os.makedirs(directory, exist_ok=True)
+    taken = checkpoints(directory)
+    number = taken[-1][0] + 1 if taken else 1
+    return os.path.join(directory, "{:06d}-{}.{}".format(
+        number, kind, "sqlite" if sqlite else "jsonl.gz"))
+
+
+def entry(key, record=None, **fields):
+    """returns the JSON bytes of a checkpoint line: the record of the
+    object stored under key, given as JSON bytes, or its deletion when
+    record is None. fields are added to the line as they are
+    """
+    if record is None:
+        return json.dumps(dict(fields, key=key, deleted=True)).encode()
+    fields = b"".join(b", %s: %s" % (json.dumps(k).encode(),
+                                     json.dumps(v).encode())
+                      for k, v in fields.items())
+    return b'{"key": %s, "record": %s%s}' % (
+        json.dumps(key).encode(), record, fields)
+
+
+def write(path, engine, lines):
+    """writes a checkpoint of JSON lines and returns its path
+    Args:
+        path (str): path from next_path()
+        engine (str): "file" or "sqlite", the engine the lines come from
+        lines (iterable): JSON bytes made by entry()
+    """
+    kind = _NAME.match(os.path.basename(path)).group(2)
+    header = {"kind": kind, "engine": engine,
+              "taken_at": datetime.utcnow().isoformat()}
+    tmp_path = "{}.tmp".format(path)
+    with compression.open_file(tmp_path, "wb", "gzip") as f:
+        f.write(json.dumps(header).encode() + b"\n")
+        for line in lines:
+            f.write(line + b"\n")
+    os.replace(tmp_path, path)
+    return path
+
+
+def copy_sqlite(source, path):
+    """copies a SQLite database with its online backup API, which reads a
+    consistent state even while others write, and returns path
+    Args:
+        source (sqlite3.Connection): connection to the database
+        path (str): path of the copy
+    """
+    tmp_path = "{}.tmp".format(path)
+    target = sqlite3.connect(tmp_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+def read(path):
+    """returns the header of a JSON lines checkpoint and an iterator over
+    its lines, as dictionaries
+    """
+    f = compression.open_file(path, "rb", "gzip")
+    header = json.loads(f.readline())
+
+    def lines():
+        """yields the lines after the header, then closes the file"""
+        with f:
+            for line in f:
+                yield json.loads(line)
+    return header, lines()
+
+
+def chain(directory, upto=None):
+    """returns the paths of the checkpoints restoring the store as of
+    checkpoint number upto, by default the last one: the last full
+    checkpoint up to it and the increments following it
+    """
+    taken = [c for c in checkpoints(directory)
+             if upto is None or c[0] <= upto]
+    fulls = [i for i, (_, kind, _) in enumerate(taken) if kind == FULL]
+    if not fulls:
+        raise ValueError("no full checkpoint in {}".format(directory))
+    return [path for _, _, path in taken[fulls[-1]:]]
+
+
+def restore_records(paths):
+    """returns the records by key of a JSON lines chain of checkpoints"""
+    records = {}
+    for path in paths:
+        for line in read(path)[1]:
+            if line.get("deleted"):
+                records.pop(line["key"], None)
+            else:
+                records[line["key"]] = line["record"]
+    return records
+
+
+def restore_sqlite(paths, target):
+    """rebuilds a SQLite database at target from a chain starting with a
+    database copy: the increments replace the rows of the objects they
+    hold, and of their place_amenity links, and delete the others. The
+    FTS5 tables of the full-text fields are rebuilt last
+    """
+    source = sqlite3.connect(paths[0])
+    try:
+        copy_sqlite(source, target)
+    finally:
+        source.close()
+    db = sqlite3.connect(target)
+    try:
+        with db:
+            for path in paths[1:]:
+                for line in read(path)[1]:
+                    apply_row(db, line)
+            for table, _ in fulltext.FIELDS.values():
+                if db.execute("SELECT 1 FROM sqlite_master WHERE name = ?",
+                              ("{}_fts".format(table),)).fetchone():
+                    db.execute(fulltext.sqlite_rebuild(table))
+    finally:
+        db.close()
+
+
+def apply_row(db, line):
+    """applies a line of a SQLite increment to the database db"""
+    name, _, id = line["key"].partition(".")
+    table = line["table"]
+    db.execute("DELETE FROM {} WHERE id = ?".format(table), (id,))
+    if name in LINKS and (line.get("deleted") or "amenity_ids" in line):
+        db.execute("DELETE FROM place_amenity WHERE {} = ?".format(
+            LINKS[name]), (id,))
+    if line.get("deleted"):
+        return
+    row = line["record"]
+    db.execute("INSERT INTO {} ({}) VALUES ({})".format(
+        table, ", ".join(row), ", ".join("?" * len(row))),
+        list(row.values()))
+    db.executemany(
+        "INSERT INTO place_amenity (place_id, amenity_id) VALUES (?, ?)",
+        [(id, amenity_id) for amenity_id in line.get("amenity_ids", ())])
+
+
+def restore(directory, target, upto=None):
+    """rebuilds a store at target from the checkpoints of directory, as
+    of checkpoint number upto, by default the last one: a JSON file for
+    a file storage backup, a SQLite database otherwise. Returns the paths
+    of the checkpoints replayed
+    """
+    paths = chain(directory, upto)
+    if paths[0].endswith(".sqlite"):
+        restore_sqlite(paths, target)
+        return paths
+    records = restore_records(paths)
+    tmp_path = "{}.tmp".format(target)
+    with open(tmp_path, "w") as f:
+        json.dump(records, f)
+    os.replace(tmp_path, target)
+    return paths
@@ -0,0 +1,285 @@
+#!/usr/bin/python3
+"""Module compact_store
+This Module contains the compact object store FileStorage uses when
+HBNB_FILE_COMPACT is set: the attributes of the objects of each class are
+kept in columns, one list per attribute, and objects are handed out as
+RowProxy instances reading and writing those columns
+"""
+
+import json
+from collections.abc import MutableMapping
+from datetime import datetime
+
+from sqlalchemy.orm.attributes import QueryableAttribute
+
+from models.base_model import BaseModel, parse_datetime
+
+MISSING = object()
+
+
+class Table:
+    """Columns of the attributes of the objects of one class
+    Attributes:
+        cls (type): class of the objects
+        columns (dict): list of values by attribute name, MISSING where an
+            object does not have the attribute
+        rows (dict): row number by object id
+    """
+
+    def __init__(self, cls):
+        """Initializes Table Class
+        Args:
+            cls (type): class of the objects
+        """
+        self.cls = cls
+        self.columns = {"id": []}
+        self.rows = {}
+        self.__free = []
+        self.__size = 0
+
+    def insert(self, attrs):
+        """stores the attributes of an object, replacing the ones of the
+        object with the same id
+        Args:
+            attrs (dict): attribute values, including the id
+        """
+        row = self.rows.get(attrs["id"])
+        if row is None:
+            row = self.__free.pop() if self.__free else self.__grow()
+            self.rows[attrs["id"]] = row
+        else:
+            for column in self.columns.values():
+                column[row] = MISSING
+        for name, value in attrs.items():
+            self.__column(name)[row] = value
+
+    def delete(self, id):
+        """removes the object with the given id, its row is reused"""
+        row = self.rows.pop(id)
+        for column in self.columns.values():
+            column[row] = MISSING
+        self.__free.append(row)
+
+    def get(self, id, name):
+        """returns an attribute of an object, or MISSING"""
+        column = self.columns.get(name)
+        if column is None:
+            return MISSING
+        return column[self.rows[id]]
+
+    def set(self, id, name, value):
+        """sets an attribute of an object"""
+        self.__column(name)[self.rows[id]] = value
+
+    def record(self, id):
+        """returns the attributes of an object as a dictionary"""
+        row = self.rows[id]
+        return {name: column[row] for name, column in self.columns.items()
+                if column[row] is not MISSING}
+
+    def __column(self, name):
+        """returns the column of an attribute, adding it if needed"""
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = [MISSING] * self.__size
+        return column
+
+    def __grow(self):
+        """adds an empty row at the end and returns its number"""
+        for column in self.columns.values():
+            column.append(MISSING)
+        self.__size += 1
+        return self.__size - 1
+
+
+class RowProxy:
+    """Stand-in for an object stored in a Table, with the attributes and
+    methods of the object. Properties and methods of the class run with
+    the proxy as self, and isinstance() sees the class of the object
+    """
+    __slots__ = ("_table", "_id")
+
+    def __init__(self, table, id):
+        """Initializes RowProxy Class
+        Args:
+            table (Table): table of the object
+            id (str): id of the object
+        """
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_id", id)
+
+    @property
+    def __class__(self):
+        """returns the class of the object"""
+        return self._table.cls
+
+    def __getattr__(self, name):
+        """reads an attribute from the table, falling back to the class"""
+        if name in RowProxy.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+        if self._id not in self._table.rows:
+            raise AttributeError("{}.{} was deleted".format(
+                self._table.cls.__name__, self._id))
+        value = self._table.get(self._id, name)
+        if value is not MISSING:
+            return value
+        attr = getattr(self._table.cls, name)
+        if isinstance(attr, QueryableAttribute):
+            return None
+        if hasattr(attr, "__get__"):
+            return attr.__get__(self, self._table.cls)
+        return attr
+
+    def __setattr__(self, name, value):
+        """writes an attribute to the table, or through a class property"""
+        attr = getattr(self._table.cls, name, None)
+        if isinstance(attr, property):
+            attr.__set__(self, value)
+        elif name == "id":
+            raise AttributeError("the id of a stored object is read-only")
+        else:
+            self._table.set(self._id, name, value)
+
+    def __repr__(self):
+        """returns the default representation of an object of the class"""
+        cls = self._table.cls
+        return "<{}.{} object at {:#x}>".format(
+            cls.__module__, cls.__name__, id(self))
+
+    def __eq__(self, other):
+        """tells whether other stands for the same object"""
+        return isinstance(other, RowProxy) and \
+            (self._table, self._id) == (other._table, other._id)
+
+    def __hash__(self):
+        """hashes the table and the id of the object"""
+        return hash((id(self._table), self._id))
+
+    def to_dict(self):
+        """returns the attributes of the object like BaseModel.to_dict"""
+        bs_dict = {
+            k: (v.isoformat() if isinstance(v, datetime) else v)
+            for (k, v) in self._table.record(self._id).items()
+        }
+        bs_dict["__class__"] = self._table.cls.__name__
+        return bs_dict
+
+    def to_json(self):
+        """returns the dictionary of to_dict encoded as JSON bytes"""
+        return json.dumps(self.to_dict()).encode()
+
+    def detach(self):
+        """returns a regular instance holding the attributes"""
+        return self._table.cls.from_record(self._table.record(self._id))
+
+    __str__ = BaseModel.__str__
+    save = BaseModel.save
+    delete = BaseModel.delete
+
+
+class CompactStore(MutableMapping):
+    """Mapping of "<class name>.<id>" keys to objects keeping the objects
+    in one Table per class. Instances stored with new() stay as they are,
+    so later changes to them are seen, until compact() moves them into
+    the tables; afterwards they are served as RowProxy objects
+    """
+
+    def __init__(self):
+        """Initializes CompactStore Class"""
+        self.__tables = {}
+        self.__pending = {}
+
+    def load(self, cls, record):
+        """stores a record made by to_dict without building an instance
+        Args:
+            cls (type): class of the object
+            record (dict): attributes, dates in isoformat
+        """
+        record.pop("__class__", None)
+        for k in ("created_at", "updated_at"):
+            v = record.get(k)
+            if isinstance(v, str):
+                record[k] = parse_datetime(v)
+        self.__table(cls).insert(record)
+
+    def compact(self):
+        """moves the instances stored since the last call into the tables
+        """
+        for key, obj in self.__pending.items():
+            self.__table(obj.__class__).insert({
+                k: v for k, v in vars(obj).items()
+                if k != "_sa_instance_state"
+            })
+        self.__pending.clear()
+
+    def __getitem__(self, key):
+        """returns the object stored under key"""
+        obj = self.__pending.get(key)
+        if obj is not None:
+            return obj
+        name, _, id = key.partition(".")
+        table = self.__tables.get(name)
+        if table is None or id not in table.rows:
+            raise KeyError(key)
+        return RowProxy(table, id)
+
+    def __setitem__(self, key, obj):
+        """stores obj under key"""
+        if isinstance(obj, RowProxy):
+            table = self.__table(obj.__class__)
+            if obj._table is not table:
+                table.insert(obj._table.record(obj._id))
+            self.__pending.pop(key, None)
+        else:
+            self.__pending[key] = obj
+
+    def __delitem__(self, key):
+        """removes the object stored under key"""
+        found = self.__pending.pop(key, None) is not None
+        name, _, id = key.partition(".")
+        table = self.__tables.get(name)
+        if table is not None and id in table.rows:
+            table.delete(id)
+            found = True
+        if not found:
+            raise KeyError(key)
+
+    def pop(self, key, *default):
+        """removes the object stored under key and returns it as a
+        regular instance, since a RowProxy can not outlive its row
+        """
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        obj = self[key]
+        if isinstance(obj, RowProxy):
+            obj = obj.detach()
+        del self[key]
+        return obj
+
+    def __iter__(self):
+        """yields the keys of the stored objects, class by class"""
+        yield from list(self.__pending)
+        for name, table in list(self.__tables.items()):
+            for id in list(table.rows):
+                key = "{}.{}".format(name, id)
+                if key not in self.__pending:
+                    yield key
+
+    def __len__(self):
+        """returns the number of stored objects"""
+        stored = sum(len(table.rows) for table in self.__tables.values())
+        for key in self.__pending:
+            name, _, id = key.partition(".")
+            table = self.__tables.get(name)
+            if table is None or id not in table.rows:
+                stored += 1
+        return stored
+
+    def __table(self, cls):
+        """returns the table of cls, creating it if needed"""
+        table = self.__tables.get(cls.__name__)
+        if table is None:
+            table = self.__tables[cls.__name__] = Table(cls)
+        return table
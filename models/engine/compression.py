@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""Module compression
+This Module contains the compressed file formats FileStorage can save to,
+chosen with HBNB_FILE_COMPRESSION (gzip, bz2, xz or zstd) at the level of
+HBNB_FILE_COMPRESSION_LEVEL. zstd needs the zstandard package and falls
+back to gzip without it. Files are read in whatever format they were
+written, recognized by their first bytes
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# suffix, default level and first bytes of every format
+CODECS = {
+    "gzip": (".gz", 6, b"\x1f\x8b"),
+    "bz2": (".bz2", 9, b"BZh"),
+    "xz": (".xz", 6, b"\xfd7zXZ\x00"),
+    "zstd": (".zst", 3, b"\x28\xb5\x2f\xfd"),
+}
+
+BUFFER_SIZE = 1 << 16
+
+
+def codec_of(name):
+    """returns the codec to use for name, None for no compression.
+    zstd falls back to gzip when zstandard is not installed
+    """
+    if not name or name == "none":
+        return None
+    if name not in CODECS:
+        raise ValueError("unknown compression: {}".format(name))
+    if name == "zstd" and zstandard is None:
+        return "gzip"
+    return name
+
+
+def suffix(codec):
+    """returns the file name suffix of codec"""
+    return CODECS[codec][0] if codec else ""
+
+
+def detect(path):
+    """returns the codec a file was written with, None for a plain file
+    """
+    with open(path, "rb") as f:
+        head = f.read(8)
+    for codec, (_, _, magic) in CODECS.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def open_file(path, mode, codec=None, level=None):
+    """opens path for binary reading ("rb") or writing ("wb") through a
+    streaming (de)compressor, buffered so small writes stay cheap
+    Args:
+        path (str): file path
+        mode (str): "rb" or "wb"
+        codec (str): name of the format, None for a plain file
+        level (int): compression level, the default of codec for None
+    """
+    if codec is None:
+        return open(path, mode)
+    if level is None:
+        level = CODECS[codec][1]
+    if codec == "gzip":
+        stream = gzip.open(path, mode, compresslevel=level)
+    elif codec == "bz2":
+        stream = bz2.open(path, mode, compresslevel=level)
+    elif codec == "xz":
+        stream = lzma.open(path, mode,
+                           preset=level if mode == "wb" else None)
+    elif zstandard is None:
+        raise ValueError("reading {} needs the zstandard package".format(
+            path))
+    else:
+        stream = zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(
+            level=level) if mode == "wb" else None)
+    if mode == "wb":
+        return io.BufferedWriter(stream, BUFFER_SIZE)
+    return stream
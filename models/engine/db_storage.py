@@ -3,57 +3,817 @@
 This Module contains a definition for DBStorage Class
 """
 
+import asyncio
+import json
+import time
+from math import ceil
 from os import getenv
+from types import MappingProxyType
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import (and_, create_engine, event, func, inspect, or_,
+                        select, text)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import object_session, scoped_session, sessionmaker
 
 from models.amenity import Amenity
 from models.base_model import Base
 from models.city import City
-from models.place import Place
+from models.engine import aggregates, backup, fulltext, geo, pagination
+from models.engine.events import EventStream
+from models.engine.object_cache import ObjectCache
+from models.engine.query_cache import QueryCache
+from models.engine.query_stats import QueryStats
+from models.engine.read_model import HbnbReadModel
+from models.engine.search import RANGES, PlaceSearch
+from models.place import Place, place_amenity
 from models.review import Review
 from models.state import State
 from models.user import User
 
+classes = {
+    "Amenity": Amenity, "City": City, "Place": Place,
+    "Review": Review, "State": State, "User": User,
+}
+
+
+def related_classes():
+    """maps every class name to the names of the classes holding a
+    relationship to it, whose cached objects go stale when it changes
+    """
+    related = {name: {name} for name in classes}
+    for name, cls in classes.items():
+        for rel in inspect(cls).relationships:
+            related.setdefault(rel.mapper.class_.__name__, set()).add(name)
+    return related
+
+
+def db_url(host=None):
+    """returns the database url built from the environment variables,
+    HBNB_DB_URL takes precedence over the HBNB_MYSQL_* settings
+    Args:
+        host (str): MySQL host to use instead of HBNB_MYSQL_HOST
+    """
+    user = getenv("HBNB_MYSQL_USER")
+    pwd = getenv("HBNB_MYSQL_PWD")
+    db = getenv("HBNB_MYSQL_DB")
+    if host is None:
+        if getenv("HBNB_DB_URL"):
+            return getenv("HBNB_DB_URL")
+        host = getenv("HBNB_MYSQL_HOST")
+    return "mysql+mysqldb://{}:{}@{}:3306/{}".format(user, pwd, host, db)
+
+
+def changed_columns(obj, created):
+    """returns the attributes of obj a flush writes: the loaded ones of
+    a created object, the ones with pending changes otherwise
+    """
+    state = inspect(obj)
+    if created:
+        return [attr.key for attr in state.attrs
+                if attr.key in state.dict and attr.key in
+                state.mapper.column_attrs]
+    return [attr.key for attr in state.attrs if attr.history.has_changes()]
+
+
+def async_url(url):
+    """returns url with its driver replaced by the asyncio driver of the
+    same database: aiomysql for MySQL and aiosqlite for SQLite
+    """
+    url = make_url(url)
+    drivers = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+    driver = drivers.get(url.get_backend_name())
+    if driver is None or url.get_dialect().is_async:
+        return url
+    return url.set(drivername=driver)
+
+
+def replica_urls():
+    """returns the urls of the read replicas, taken from HBNB_DB_REPLICA_URLS
+    or from the comma separated hosts of HBNB_MYSQL_REPLICAS
+    """
+    urls = getenv("HBNB_DB_REPLICA_URLS")
+    if urls:
+        return [url.strip() for url in urls.split(",") if url.strip()]
+    hosts = getenv("HBNB_MYSQL_REPLICAS", "")
+    return [db_url(host.strip()) for host in hosts.split(",") if host.strip()]
+
 
 class DBStorage:
     """FileStorage Class
     """
     __engine = None
     __session = None
+    __replica_engines = []
+    __replica_sessions = []
+    __replica_makers = []
+    __next_replica = 0
+    __wrote = False
+    __session_maker = None
+    __cache = None
+    __related = {}
+    __async_engines = None
+    __async_loop = None
+    __stats = None
+    __objects = None
+    __search = None
+    __search_stale = None
+    __search_ttl = 0
+    __search_built = 0
+    __aggregates = None
+    __read_model = None
+    __read_model_ttl = 0
+    __read_model_built = 0
+    __events = None
+    __changed = None
+    __flushed = None
 
     def __init__(self):
         """Initializes DBStorage Class
         using the environment variables
         """
-        user = getenv("HBNB_MYSQL_USER")
-        pwd = getenv("HBNB_MYSQL_PWD")
-        host = getenv("HBNB_MYSQL_HOST")
-        db = getenv("HBNB_MYSQL_DB")
-
-        self.__engine = create_engine(
-            "mysql+mysqldb://{}:{}@{}:3306/{}".format(user, pwd, host, db),
-            pool_pre_ping=True,
+        self.__engine = create_engine(db_url(), pool_pre_ping=True)
+        self.__replica_engines = [
+            create_engine(url, pool_pre_ping=True) for url in replica_urls()
+        ]
+        self.__cache = QueryCache(
+            ttl=float(getenv("HBNB_CACHE_TTL", "0")),
+            max_size=int(getenv("HBNB_CACHE_SIZE", "128")),
+            on_evict=lambda entry: entry[1].close(),
+        )
+        self.__related = related_classes()
+        self.__read_model_ttl = float(getenv("HBNB_READ_MODEL_TTL", "0"))
+        self.__search_ttl = float(getenv("HBNB_SEARCH_TTL", "0"))
+        self.__events = EventStream(getenv("HBNB_EVENTS_FILE"))
+        self.__flushed = set()
+        self.__stats = QueryStats(
+            DBStorage, slow_ms=float(getenv("HBNB_SLOW_QUERY_MS", "100")))
+        for engine in [self.__engine] + self.__replica_engines:
+            self.__stats.attach(engine)
+        self.__objects = ObjectCache(
+            max_objects=int(getenv("HBNB_OBJECT_CACHE_SIZE", "0")),
+            max_bytes=int(getenv("HBNB_OBJECT_CACHE_BYTES", "0")),
+            ttl=float(getenv("HBNB_OBJECT_CACHE_TTL", "300")),
+            pinned=getenv("HBNB_OBJECT_CACHE_PINNED",
+                          "State,Amenity").split(","),
+            on_evict=self.__expunge,
         )
 
         if getenv("HBNB_ENV", "") == "test":
             Base.metadata.drop_all(self.__engine)
+            if self.__engine.dialect.name == "sqlite":
+                with self.__engine.begin() as conn:
+                    for table, _ in fulltext.FIELDS.values():
+                        conn.exec_driver_sql(
+                            "DROP TABLE IF EXISTS {}_fts".format(table))
 
     def all(self, cls=None):
         """returns the dictionary all or filtered objects"""
-        all_objs = []
-        _all_cls = [cls] if cls is not None else [
+        _all_cls = self.__classes(cls)
+
+        def query(session):
+            all_objs = []
+            for _cls in _all_cls:
+                all_objs += session.query(_cls)
+            return {"{}.{}".format(type(v).__name__, v.id): v
+                    for v in all_objs}
+        all_objs = dict(self.__cached(("all",) + tuple(
+            _cls.__name__ for _cls in _all_cls), _all_cls, query))
+        self.__track(all_objs.values())
+        return all_objs
+
+    def snapshot(self, cls=None):
+        """returns a read-only view of all or filtered objects, keyed like
+        all(), which already builds a new dictionary per call
+        """
+        return MappingProxyType(self.all(cls))
+
+    def iter(self, cls=None, batch_size=1000):
+        """yields all or filtered objects, batch_size rows at a time,
+        streaming them through a server-side cursor
+        """
+        _all_cls = self.__classes(cls)
+        for session in self.__read_sessions():
+            streamed = False
+            try:
+                for _cls in _all_cls:
+                    query = session.query(_cls).execution_options(
+                        stream_results=True).yield_per(batch_size)
+                    for obj in query:
+                        streamed = True
+                        self.__track([obj])
+                        yield obj
+            except DBAPIError:
+                if streamed or session is self.__session:
+                    raise
+                session.rollback()
+                continue
+            if session is not self.__session:
+                session.commit()
+            return
+
+    def get(self, cls, id):
+        """returns the object of class cls with the given id, or None"""
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is None or id is None:
+            return None
+        obj = self.__resident(cls, id)
+        if obj is None:
+            obj = self.__cached(("get", cls.__name__, id), [cls],
+                                lambda session: session.get(cls, id))
+            self.__track([obj] if obj is not None else [])
+        return obj
+
+    def count(self, cls=None):
+        """returns the number of all or filtered objects"""
+        _all_cls = self.__classes(cls)
+        return self.__cached(
+            ("count",) + tuple(_cls.__name__ for _cls in _all_cls),
+            _all_cls,
+            lambda session: sum(
+                session.query(_cls).count() for _cls in _all_cls))
+
+    def page(self, cls, limit=25, cursor=None, order_by="created_at"):
+        """returns a (objects, cursor) tuple holding up to limit objects of
+        class cls sorted by (order_by, id), starting after cursor. The
+        returned cursor fetches the next page and is None on the last one.
+        The (order_by, id) indexes make every page cost the same
+        Raises:
+            ValueError: if order_by is not an indexed order or cls has no
+                column of that name
+        """
+        if isinstance(cls, str):
+            cls = classes[cls]
+        pagination.check_order(order_by, cls)
+        column = getattr(cls, order_by)
+        after = pagination.decode_cursor(cursor, order_by)
+
+        def query(session):
+            q = session.query(cls)
+            if after is not None:
+                value, id = after
+                q = q.filter(or_(column > value,
+                                 and_(column == value, cls.id > id)))
+            return q.order_by(column, cls.id).limit(limit + 1).all()
+        objs = self.__read(query)
+        self.__track(objs)
+        if len(objs) <= limit:
+            return objs, None
+        objs = objs[:limit]
+        return objs, pagination.encode_cursor(objs[-1], order_by)
+
+    def places_with_amenities(self, amenities):
+        """returns the list of the places having every one of amenities,
+        given as Amenity objects or ids. The place_amenity rows of the
+        amenities are grouped by place, keeping the places found for all
+        """
+        ids = {getattr(amenity, "id", amenity) for amenity in amenities}
+
+        def query(session):
+            q = session.query(Place)
+            if ids:
+                having_all = select(place_amenity.c.place_id).where(
+                    place_amenity.c.amenity_id.in_(ids),
+                ).group_by(place_amenity.c.place_id).having(
+                    func.count() == len(ids))
+                q = q.filter(Place.id.in_(having_all))
+            return q.all()
+        objs = self.__read(query)
+        self.__track(objs)
+        return objs
+
+    def places_in_box(self, south, west, north, east):
+        """returns the list of the places whose coordinates lie in the
+        box, west is greater than east for boxes crossing the antimeridian.
+        The (latitude, longitude) index covers the filter
+        """
+        def query(session):
+            q = session.query(Place).filter(
+                Place.latitude.between(south, north))
+            if west <= east:
+                q = q.filter(Place.longitude.between(west, east))
+            else:
+                q = q.filter(or_(Place.longitude >= west,
+                                 Place.longitude <= east))
+            return q.all()
+        objs = self.__read(query)
+        self.__track(objs)
+        return objs
+
+    def places_within(self, lat, lon, radius_km):
+        """returns the list of the places within radius_km of (lat, lon),
+        nearest first: the bounding box of the circle is read from the
+        index, then trimmed to the circle
+        """
+        found = []
+        for place in self.places_in_box(
+                *geo.bounding_box(lat, lon, radius_km)):
+            distance = geo.distance_km(
+                lat, lon, place.latitude, place.longitude)
+            if distance <= radius_km:
+                found.append((distance, place.id, place))
+        found.sort(key=lambda entry: entry[:2])
+        return [place for _, _, place in found]
+
+    def places_by_price(self, city_id=None, low=None, high=None,
+                        limit=None, descending=False):
+        """returns the list of up to limit places of city_id, of every
+        city for None, priced from low to high included, cheapest first or
+        most expensive first when descending. The (city_id, price_by_night)
+        index, or (price_by_night, id) for every city, serves the range in
+        order
+        """
+        def query(session):
+            q = self.__priced(session.query(Place), city_id)
+            if low is not None:
+                q = q.filter(Place.price_by_night >= low)
+            if high is not None:
+                q = q.filter(Place.price_by_night <= high)
+            order = (Place.price_by_night, Place.id)
+            if descending:
+                order = [column.desc() for column in order]
+            return q.order_by(*order).limit(limit).all()
+        objs = self.__read(query)
+        self.__track(objs)
+        return objs
+
+    def price_stats(self, city_id=None, percentiles=(50,)):
+        """returns the count, min and max price_by_night of the places of
+        city_id, of every city for None, and its nearest-rank percentiles
+        as a {"count", "min", "max", "percentiles": {q: price}} dictionary.
+        Each percentile is one offset into the price index
+        """
+        def query(session):
+            count = self.__priced(
+                session.query(func.count(Place.id)), city_id).scalar()
+            prices = self.__priced(
+                session.query(Place.price_by_night), city_id).order_by(
+                Place.price_by_night)
+
+            def percentile(q):
+                if not count:
+                    return None
+                rank = max(1, ceil(q / 100 * count))
+                return prices.offset(rank - 1).limit(1).scalar()
+            return {
+                "count": count,
+                "min": percentile(0),
+                "max": percentile(100),
+                "percentiles": {q: percentile(q) for q in percentiles},
+            }
+        return self.__read(query)
+
+    @staticmethod
+    def __priced(q, city_id):
+        """filters a query on the places of city_id, if not None"""
+        return q if city_id is None else q.filter(Place.city_id == city_id)
+
+    def search_places(self, filters=None):
+        """returns the (places, facets) of a faceted search, see
+        PlaceSearch.search for the filters and facet counts. The postings
+        are read from the database by the first search, then the places
+        flushed by this storage since the last search are read again.
+        The writes of other processes are not seen: close() drops the
+        postings once they are HBNB_SEARCH_TTL seconds old, by default
+        on every close()
+        """
+        if self.__search is None or self.__search_stale is None:
+            self.__search = PlaceSearch()
+            self.__search_built = time.monotonic()
+            self.__load_search(None)
+        elif self.__search_stale:
+            self.__load_search(self.__search_stale)
+        self.__search_stale = set()
+        ids, facets = self.__search.search(filters)
+        if not ids:
+            return [], facets
+
+        def query(session):
+            found = {}
+            for i in range(0, len(ids), 1000):
+                found.update((place.id, place) for place in session.query(
+                    Place).filter(Place.id.in_(ids[i:i + 1000])))
+            return [found[id] for id in ids if id in found]
+        objs = self.__read(query)
+        self.__track(objs)
+        return objs, facets
+
+    def __load_search(self, place_ids):
+        """indexes the places with the given ids, or every place and city
+        when place_ids is None
+        """
+        columns = [Place.id, Place.city_id] + \
+            [getattr(Place, facet) for facet in RANGES]
+
+        def query(session):
+            places = select(*columns)
+            links = select(place_amenity)
+            if place_ids is not None:
+                places = places.where(Place.id.in_(place_ids))
+                links = links.where(place_amenity.c.place_id.in_(place_ids))
+            cities = [] if place_ids is not None else \
+                session.execute(select(City.id, City.state_id)).all()
+            return (session.execute(places).all(),
+                    session.execute(links).all(), cities)
+        places, links, cities = self.__read(query)
+        amenity_ids = {}
+        for place_id, amenity_id in links:
+            amenity_ids.setdefault(place_id, []).append(amenity_id)
+        found = set()
+        for place in places:
+            self.__search.add(place, amenity_ids.get(place.id, ()))
+            found.add(place.id)
+        for place_id in set(place_ids or ()) - found:
+            self.__search.remove(place_id)
+        for city_id, state_id in cities:
+            self.__search.set_city(city_id, state_id)
+
+    def aggregate(self, cls, id):
+        """returns the maintained aggregates of the State, City or Place
+        with the given id, see Aggregates.get. They are read from the
+        database by the first call, then follow the flushes of this
+        storage; rebuild_aggregates() picks up the writes of others
+        """
+        name = cls if isinstance(cls, str) else cls.__name__
+        if self.__aggregates is None:
+            self.__aggregates = self.__load_aggregates()
+        return self.__aggregates.get(name, id)
+
+    def rebuild_aggregates(self):
+        """reads the aggregates from the database again and returns the
+        keys of the maintained ones that were wrong
+        """
+        rebuilt = self.__load_aggregates()
+        wrong = [] if self.__aggregates is None else \
+            aggregates.differences(self.__aggregates, rebuilt)
+        self.__aggregates = rebuilt
+        return wrong
+
+    def __load_aggregates(self):
+        """returns the aggregates of the rows of the database, reading
+        only the columns they depend on
+        """
+        def query(session):
+            return [session.execute(select(*columns)).all() for columns in (
+                (City.id, City.state_id),
+                (Place.id, Place.city_id, Place.price_by_night),
+                (Review.id, Review.place_id))]
+        cities, places, reviews = self.__read(query)
+        totals = aggregates.Aggregates()
+        for city_id, state_id in cities:
+            totals.set_city(city_id, state_id)
+        for place in places:
+            totals.add_place(place)
+        for review in reviews:
+            totals.add_review(review)
+        return totals
+
+    def hbnb_read_model(self):
+        """returns the read model of the /hbnb page, kept up to date by
+        the flushes of this storage. It does not see the writes of other
+        processes: close() drops it once it is HBNB_READ_MODEL_TTL
+        seconds old, by default on every close(), so those writes show
+        up at the latest after that many seconds
+        """
+        if self.__read_model is None:
+            self.__read_model = HbnbReadModel(self)
+            self.__read_model_built = time.monotonic()
+        return self.__read_model
+
+    def events(self):
+        """returns the stream of the changes, published when the session
+        commits and dropped when it rolls back
+        """
+        return self.__events
+
+    def checkpoint(self, directory=None, full=False):
+        """writes a checkpoint of the database to directory, by default
+        HBNB_BACKUP_DIR or "backups", and returns its path. SQLite only:
+        the first checkpoint, or one with full set, is a copy made with
+        the SQLite backup API; the next ones are increments holding the
+        rows of the objects this storage committed or deleted since the
+        last checkpoint, read in one transaction
+        """
+        if self.__engine.dialect.name != "sqlite":
+            raise ValueError("checkpoint() needs a SQLite database, back "
+                             "up MySQL with its own tools")
+        directory = directory or getenv("HBNB_BACKUP_DIR", "backups")
+        changed, self.__changed = self.__changed, set()
+        raw = self.__engine.raw_connection()
+        try:
+            db = raw.driver_connection
+            if full or changed is None:
+                return backup.copy_sqlite(db, backup.next_path(
+                    directory, backup.FULL, sqlite=True))
+            db.execute("BEGIN")
+            try:
+                lines = [self.__row_entry(db, key) for key in changed]
+            finally:
+                db.rollback()
+        finally:
+            raw.close()
+        return backup.write(backup.next_path(directory, backup.INCREMENT),
+                            "sqlite", lines)
+
+    @staticmethod
+    def __row_entry(db, key):
+        """returns the increment line of the object stored under key,
+        read from the SQLite connection db, with the amenity ids of places
+        """
+        name, _, id = key.partition(".")
+        table = classes[name].__tablename__
+        cursor = db.execute(
+            "SELECT * FROM {} WHERE id = ?".format(table), (id,))
+        row = cursor.fetchone()
+        if row is None:
+            return backup.entry(key, None, table=table)
+        record = dict(zip([column[0] for column in cursor.description], row))
+        fields = {"table": table}
+        if name == "Place":
+            fields["amenity_ids"] = [link[0] for link in db.execute(
+                "SELECT amenity_id FROM place_amenity WHERE place_id = ?",
+                (id,))]
+        return backup.entry(key, json.dumps(record).encode(), **fields)
+
+    def search_text(self, cls, query, limit=10):
+        """returns the limit objects of cls, Place or Review, whose
+        description or text best match the words of query, best first.
+        The ids are ranked by the FULLTEXT indexes on MySQL and by the
+        FTS5 tables on SQLite, only the matching objects are loaded
+        """
+        name = cls if isinstance(cls, str) else cls.__name__
+        if name not in fulltext.FIELDS:
+            raise ValueError("{} has no full-text field".format(name))
+        model = classes[name]
+        table, field = fulltext.FIELDS[name]
+        dialect = self.__engine.dialect.name
+        if dialect == "sqlite":
+            words = fulltext.fts_query(query)
+        elif dialect == "mysql":
+            words = " ".join(fulltext.tokenize(query)) or None
+        else:
+            raise ValueError("full-text search needs MySQL or SQLite")
+        if words is None:
+            return []
+        if dialect == "sqlite":
+            ranked = text(
+                "SELECT {0}.id FROM {0}_fts JOIN {0} "
+                "ON {0}.rowid = {0}_fts.rowid WHERE {0}_fts MATCH :words "
+                "ORDER BY bm25({0}_fts) LIMIT :limit".format(table),
+            ).bindparams(words=words, limit=limit)
+        else:
+            score = match(getattr(model, field), against=words)
+            ranked = select(model.id).where(score).order_by(
+                score.desc()).limit(limit)
+
+        def query_ids(session):
+            ids = session.scalars(ranked).all()
+            if not ids:
+                return []
+            found = {obj.id: obj for obj in session.query(model).filter(
+                model.id.in_(ids))}
+            return [found[id] for id in ids if id in found]
+        objs = self.__read(query_ids)
+        self.__track(objs)
+        return objs
+
+    async def aall(self, cls=None):
+        """returns the dictionary all or filtered objects, read without
+        blocking the event loop through the asyncio engine. The objects
+        are detached: relationships must be loaded by their own queries
+        """
+        _all_cls = self.__classes(cls)
+
+        async def query(session):
+            all_objs = []
+            for _cls in _all_cls:
+                all_objs += (await session.execute(select(_cls))).scalars()
+            return {"{}.{}".format(type(v).__name__, v.id): v
+                    for v in all_objs}
+        return await self.__aread(query)
+
+    async def aget(self, cls, id):
+        """returns the object of class cls with the given id, or None,
+        read through the asyncio engine
+        """
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls is None or id is None:
+            return None
+        return await self.__aread(lambda session: session.get(cls, id))
+
+    async def acount(self, cls=None):
+        """returns the number of all or filtered objects, read through the
+        asyncio engine
+        """
+        _all_cls = self.__classes(cls)
+
+        async def query(session):
+            count = 0
+            for _cls in _all_cls:
+                count += await session.scalar(
+                    select(func.count()).select_from(_cls))
+            return count
+        return await self.__aread(query)
+
+    async def asave(self):
+        """commits all pending operations from a worker thread, the
+        session must not be used until the commit is awaited
+        """
+        await asyncio.to_thread(self.save)
+
+    async def __aread(self, query):
+        """awaits query(session) on an asyncio session of the first
+        engine of __read_order() that answers, like __read.
+        The asyncio engines pool connections bound to the event loop
+        they were opened on, so another loop gets engines of its own and
+        disposes of the previous ones
+        """
+        loop = asyncio.get_running_loop()
+        if self.__async_loop is not loop:
+            stale = self.__async_engines or []
+            self.__async_loop = loop
+            self.__async_engines = [
+                create_async_engine(async_url(engine.url))
+                for engine in self.__replica_engines + [self.__engine]
+            ]
+            for engine in self.__async_engines:
+                self.__stats.attach(engine.sync_engine)
+            for engine in stale:
+                await engine.dispose()
+        *replicas, primary = self.__async_engines
+        for engine in self.__read_order(replicas, primary):
+            try:
+                async with AsyncSession(
+                        engine, expire_on_commit=False) as session:
+                    return await query(session)
+            except DBAPIError:
+                if engine is primary:
+                    raise
+
+    def cache_stats(self):
+        """returns the hit/miss counters and settings of the query cache"""
+        return self.__cache.stats()
+
+    def query_stats(self):
+        """returns the latency histograms of the SQL statements, grouped
+        by storage method, and the statements slower than
+        HBNB_SLOW_QUERY_MS milliseconds
+        """
+        return self.__stats.report()
+
+    def reset_query_stats(self):
+        """clears the SQL statement statistics"""
+        self.__stats.reset()
+
+    def __cached(self, key, _all_cls, query):
+        """answers a read from the query cache when it is enabled.
+        On a miss the query runs in a session of its own, on the first
+        database of __read_order() that answers, kept with the cache
+        entry so lazy relationships of cached objects still load. The
+        session commits after the query and after every lazy load, so it
+        holds no pooled connection in between
+        """
+        if not self.__cache.enabled:
+            return self.__read(query)
+        found, entry = self.__cache.lookup(key)
+        if found:
+            return entry[0]
+        for maker in self.__read_order(self.__replica_makers,
+                                       self.__session_maker):
+            session = maker()
+            event.listen(session, "do_orm_execute", self.__load_and_release)
+            try:
+                result = query(session)
+                session.commit()
+                break
+            except DBAPIError:
+                session.close()
+                if maker is self.__session_maker:
+                    raise
+        self.__cache.put(key, [_cls.__name__ for _cls in _all_cls],
+                         (result, session))
+        return result
+
+    @staticmethod
+    def __load_and_release(orm_execute_state):
+        """runs the lazy load of a relationship of a cached object and
+        commits its session, giving the connection back to the pool
+        """
+        if not orm_execute_state.is_relationship_load:
+            return None
+        result = orm_execute_state.invoke_statement().freeze()
+        orm_execute_state.session.commit()
+        return result()
+
+    def __invalidate(self, objs):
+        """drops the cached results touching the classes of objs"""
+        names = set()
+        for obj in objs:
+            names |= self.__related.get(type(obj).__name__, set())
+        if names:
+            self.__cache.invalidate(names)
+
+    def object_cache_stats(self):
+        """returns the size, approximate memory use and evictions of the
+        object cache, with the size of the session identity maps
+        """
+        stats = self.__objects.stats()
+        stats["identity_map"] = sum(
+            len(session.identity_map)
+            for session in [self.__session] + self.__replica_sessions)
+        return stats
+
+    def __track(self, objs):
+        """records objs loaded by the storage sessions in the object
+        cache, which expunges the least recently used ones
+        """
+        if self.__objects.enabled:
+            sessions = [self.__session] + self.__replica_sessions
+            self.__objects.touch(
+                obj for obj in objs if object_session(obj) in sessions)
+
+    def __resident(self, cls, id):
+        """returns the object cached for cls and id, attached to the
+        primary session if close() detached it, or None
+        """
+        obj = self.__objects.lookup(cls.__name__, id)
+        if obj is None or object_session(obj) is not None:
+            return obj
+        current = self.__session.identity_map.get(inspect(obj).key)
+        if current is not None:
+            self.__objects.touch([current])
+            return current
+        self.__session.add(obj)
+        return obj
+
+    def __expunge(self, obj):
+        """removes an evicted object from its session, unless it holds
+        changes still to be written
+        """
+        session = object_session(obj)
+        sessions = [self.__session] + self.__replica_sessions
+        if session in sessions and obj not in session.new and \
+                not session.is_modified(obj):
+            session.expunge(obj)
+
+    def __classes(self, cls=None):
+        """returns the list of classes an operation on cls covers"""
+        if isinstance(cls, str):
+            cls = classes[cls]
+        return [cls] if cls is not None else [
             State, City, User, Place, Review, Amenity
         ]
-        for _cls in _all_cls:
-            all_objs += self.__session.query(_cls)
-        return {"{}.{}".format(type(v).__name__, v.id): v for v in all_objs}
+
+    def __read_sessions(self):
+        """yields the sessions a read may use, see __read_order"""
+        return self.__read_order(self.__replica_sessions, self.__session)
+
+    def __read_order(self, replicas, primary):
+        """yields what a read may use, in order: the replicas round-robin,
+        then the primary. Reads stick to the primary once this session
+        has written, so they see their own writes
+        """
+        if replicas and not self.__wrote:
+            start = self.__next_replica
+            self.__next_replica += 1
+            for i in range(len(replicas)):
+                yield replicas[(start + i) % len(replicas)]
+        yield primary
+
+    def __read(self, query):
+        """runs query(session) on the first session that answers,
+        falling back from a failing replica to the next one
+        """
+        for session in self.__read_sessions():
+            if session is self.__session:
+                return query(session)
+            try:
+                result = query(session)
+                session.commit()
+                return result
+            except DBAPIError:
+                session.rollback()
+
+    def __attach(self, obj):
+        """moves an object loaded from a replica to the primary session
+        and sends the following reads to the primary
+        """
+        session = object_session(obj)
+        if session is not None and session is not self.__session:
+            session.expunge(obj)
+            self.__session.add(obj)
+        self.__wrote = True
 
     def new(self, obj):
         """adds the object to the current database session"""
         if obj is not None:
+            self.__attach(obj)
             self.__session.add(obj)
+            self.__invalidate([obj])
 
     def save(self):
         """commits all pending operations"""
@@ -62,17 +822,149 @@ class DBStorage:
     def delete(self, obj=None):
         """deletes a row from the database"""
         if obj is not None:
+            self.__attach(obj)
+            self.__objects.discard(obj)
             self.__session.delete(obj)
+            self.__invalidate([obj])
             self.save()
 
     def reload(self):
         """reloads the memory values form database"""
         Base.metadata.create_all(self.__engine)
+        if self.__engine.dialect.name == "sqlite":
+            self.__create_fts()
         session_maker = sessionmaker(bind=self.__engine,
                                      expire_on_commit=False)
         Session = scoped_session(session_maker)
         self.__session = Session()
+        self.__session_maker = session_maker
+        self.__cache.clear()
+        event.listen(self.__session, "after_flush", self.__after_flush)
+        event.listen(self.__session, "after_commit", self.__after_commit)
+        event.listen(self.__session, "after_rollback", self.__after_rollback)
+        self.__replica_makers = [
+            sessionmaker(bind=engine, expire_on_commit=False)
+            for engine in self.__replica_engines
+        ]
+        self.__replica_sessions = [
+            maker() for maker in self.__replica_makers]
+
+    def __create_fts(self):
+        """creates the FTS5 tables of the full-text fields and their
+        triggers, filling the tables created from the existing rows
+        """
+        with self.__engine.begin() as conn:
+            for table, field in fulltext.FIELDS.values():
+                fts = "{}_fts".format(table)
+                exists = conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE name = ?",
+                    (fts,)).first()
+                for statement in fulltext.sqlite_ddl(table, field):
+                    conn.exec_driver_sql(statement)
+                if exists is None:
+                    conn.exec_driver_sql(fulltext.sqlite_rebuild(table))
+
+    def vacuum(self):
+        """commits the session, runs VACUUM on a SQLite database, then
+        rebuilds the FTS5 tables, whose rowids VACUUM may renumber
+        """
+        if self.__engine.dialect.name != "sqlite":
+            raise ValueError("vacuum() needs a SQLite database")
+        self.__session.commit()
+        with self.__engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM")
+        with self.__engine.begin() as conn:
+            for table, _ in fulltext.FIELDS.values():
+                conn.exec_driver_sql(fulltext.sqlite_rebuild(table))
+
+    def __after_flush(self, session, context):
+        """drops the cached queries, objects and search postings a flush
+        made stale, applies it to the aggregates and the read model and
+        records its changes for the event stream and checkpoint()
+        """
+        changed = list(session.new) + list(session.dirty) + \
+            list(session.deleted)
+        if self.__events.active:
+            for obj in changed:
+                name = obj.__class__.__name__
+                if obj in session.deleted:
+                    self.__events.record("delete", name, obj.id)
+                    continue
+                fields = changed_columns(obj, obj in session.new)
+                if fields:
+                    self.__events.record(
+                        "create" if obj in session.new else "update",
+                        name, obj.id, fields)
+        if self.__changed is not None:
+            self.__flushed.update("{}.{}".format(
+                obj.__class__.__name__, obj.id) for obj in changed)
+        self.__invalidate(changed)
+        for obj in session.deleted:
+            self.__objects.discard(obj)
+        if self.__aggregates is not None:
+            for obj in list(session.new) + list(session.dirty):
+                self.__aggregates.add(obj)
+            for obj in session.deleted:
+                self.__aggregates.remove(obj)
+        if self.__read_model is not None:
+            for obj in changed:
+                self.__read_model.changed(obj, obj in session.deleted)
+        if self.__search_stale is not None:
+            for obj in changed:
+                if isinstance(obj, Place):
+                    self.__search_stale.add(obj.id)
+                elif isinstance(obj, (City, Amenity)):
+                    self.__search_stale = None
+                    break
+
+    def __after_commit(self, session):
+        """publishes the changes of the committed transaction and keeps
+        them for the next checkpoint
+        """
+        if self.__changed is not None:
+            self.__changed |= self.__flushed
+        self.__flushed = set()
+        self.__events.publish()
+
+    def __after_rollback(self, session):
+        """drops the changes of the rolled back transaction"""
+        self.__flushed = set()
+        self.__events.discard()
+
+    def __close_async_engines(self):
+        """disposes of the asyncio engines on an event loop of their own.
+        Called from a running loop it keeps them, the next read from
+        another loop disposes of them
+        """
+        engines = self.__async_engines
+        if not engines:
+            return
+        try:
+            asyncio.get_running_loop()
+            return
+        except RuntimeError:
+            pass
+        self.__async_engines = self.__async_loop = None
+
+        async def dispose():
+            for engine in engines:
+                await engine.dispose()
+        asyncio.run(dispose())
 
     def close(self):
         """cleanup method"""
+        self.__objects.sweep()
         self.__session.close()
+        for session in self.__replica_sessions:
+            session.close()
+        for _, session in self.__cache.values():
+            session.commit()
+        if self.__read_model is not None and time.monotonic() - \
+                self.__read_model_built >= self.__read_model_ttl:
+            self.__read_model = None
+        if self.__search is not None and time.monotonic() - \
+                self.__search_built >= self.__search_ttl:
+            self.__search = None
+        self.__close_async_engines()
+        self.__wrote = False
@@ -0,0 +1,218 @@
+#!/usr/bin/python3
+"""Module events
+This Module contains the change data capture stream of the storage
+engines: the changes of a transaction are gathered into one batch of
+(seq, op, cls, id, changed_fields) events, published once it is committed
+to the in-process subscribers and, with HBNB_EVENTS_FILE, appended to a
+JSON lines file other processes can follow with read_events()
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+Event = namedtuple("Event", ("seq", "op", "cls", "id", "changed_fields"))
+Event.__doc__ = """A committed change: op is create, update or delete,
+changed_fields the sorted names of the attributes written, None when they
+are not known"""
+
+OPS = ("create", "update", "delete")
+
+# number of streams gathering changes: models only record the attributes
+# they set while there is one
+gathering = 0
+_gathering_lock = threading.Lock()
+
+
+def to_line(event):
+    """returns the JSON line of an event, as bytes"""
+    return json.dumps({
+        "seq": event.seq, "op": event.op, "class": event.cls,
+        "id": event.id, "fields": event.changed_fields,
+    }).encode() + b"\n"
+
+
+def from_line(line):
+    """returns the event of a JSON line"""
+    record = json.loads(line)
+    fields = record["fields"]
+    return Event(record["seq"], record["op"], record["class"], record["id"],
+                 None if fields is None else tuple(fields))
+
+
+def read_events(path, offset=0):
+    """returns the (events, offset) of the complete lines of an event file
+    from the byte offset on. Passing the returned offset back reads the
+    events appended since, which is how another process tails the file
+    """
+    if not os.path.isfile(path):
+        return [], offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    events = [from_line(line) for line in data[:end].splitlines() if line]
+    return events, offset + end
+
+
+def last_seq(path):
+    """returns the seq of the last event of an event file, 0 without one
+    """
+    if not os.path.isfile(path):
+        return 0
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        chunk = 4096
+        while True:
+            start = max(0, size - chunk)
+            f.seek(start)
+            lines = f.read().splitlines()
+            if len(lines) > 1 or start == 0:
+                break
+            chunk *= 2
+    for line in reversed(lines):
+        if line.strip():
+            return json.loads(line)["seq"]
+    return 0
+
+
+class EventStream:
+    """Gathers the changes of the current transaction and publishes them
+    as one batch when it commits. Several changes of one object within a
+    batch are merged into one event: an update of a created object stays
+    a create, a created then deleted object is dropped, and the changed
+    fields add up. Nothing is gathered until there is a subscriber or a
+    file, so idle streams cost one attribute check per write
+    """
+
+    def __init__(self, path=None):
+        """Initializes EventStream Class
+        Args:
+            path (str): file the events are appended to, or None
+        """
+        self.__path = path
+        self.__seq = 0 if path is None else last_seq(path)
+        self.__subscribers = []
+        self.__pending = {}
+        self.__lock = threading.Lock()
+        self.__counted = False
+        self.__count()
+
+    def __del__(self):
+        """stops counting the stream among the gathering ones"""
+        if self.__counted:
+            self.__subscribers = []
+            self.__path = None
+            self.__count()
+
+    def __count(self):
+        """keeps the module count of gathering streams up to date"""
+        global gathering
+        active = self.active
+        with _gathering_lock:
+            if active != self.__counted:
+                gathering += 1 if active else -1
+                self.__counted = active
+
+    @property
+    def active(self):
+        """tells whether the changes are gathered"""
+        return bool(self.__subscribers) or self.__path is not None
+
+    @property
+    def seq(self):
+        """returns the seq of the last published event"""
+        return self.__seq
+
+    def subscribe(self, callback):
+        """calls callback(events) with every published batch, in seq
+        order, and returns callback
+        """
+        self.__subscribers.append(callback)
+        self.__count()
+        return callback
+
+    def unsubscribe(self, callback):
+        """stops calling callback"""
+        if callback in self.__subscribers:
+            self.__subscribers.remove(callback)
+        self.__count()
+
+    def record(self, op, cls, id, changed_fields=None):
+        """adds a change to the pending batch
+        Args:
+            op (str): create, update or delete
+            cls (str): class name of the object
+            id (str): id of the object
+            changed_fields (iterable): attributes written, None if unknown
+        """
+        if op not in OPS:
+            raise ValueError("unknown event op: {}".format(op))
+        if not self.active:
+            return
+        fields = None if changed_fields is None else set(changed_fields)
+        with self.__lock:
+            key = (cls, id)
+            old = self.__pending.pop(key, None)
+            if old is not None:
+                op, fields = self.__merge(old, op, fields)
+                if op is None:
+                    return
+            self.__pending[key] = (op, fields)
+
+    def take(self):
+        """returns the pending batch and starts a new one, for engines
+        committing the batch later, see publish
+        """
+        with self.__lock:
+            batch, self.__pending = self.__pending, {}
+        return batch
+
+    def publish(self, batch=None):
+        """numbers the changes of batch, by default the pending ones,
+        appends them to the file and hands them to the subscribers, returns
+        the published events
+        """
+        if batch is None:
+            batch = self.take()
+        if not batch:
+            return []
+        with self.__lock:
+            events = []
+            for (cls, id), (op, fields) in batch.items():
+                self.__seq += 1
+                events.append(Event(self.__seq, op, cls, id, None if
+                                    fields is None else tuple(sorted(fields))))
+            if self.__path is not None:
+                with open(self.__path, "ab") as f:
+                    f.write(b"".join(to_line(event) for event in events))
+        for callback in list(self.__subscribers):
+            try:
+                callback(events)
+            except Exception:
+                logger.exception("event subscriber %r failed", callback)
+        return events
+
+    def discard(self):
+        """drops the pending changes of a rolled back transaction"""
+        with self.__lock:
+            self.__pending = {}
+
+    @staticmethod
+    def __merge(old, op, fields):
+        """returns the (op, fields) of two changes of an object, op None
+        when they cancel out
+        """
+        old_op, old_fields = old
+        if op == "delete":
+            return (None, None) if old_op == "create" else ("delete", None)
+        if old_op == "delete":
+            return "update", fields
+        if old_fields is None or fields is None:
+            return old_op, None
+        return old_op, old_fields | fields
@@ -3,10 +3,42 @@
 This Module contains a definition for FileStorage Class
 """
 
+import asyncio
+import gc
 import importlib
 import json
 import os
 import re
+import threading
+import weakref
+from os import getenv
+from types import MappingProxyType
+
+from models.base_model import changed_fields
+from models.engine import (aggregates, backup, compression, fulltext,
+                           geo, mapped_store, pagination)
+from models.engine.compact_store import CompactStore, RowProxy
+from models.engine.events import EventStream
+from models.engine.indexes import (AmenityIndex, ForeignKeyIndex, GridIndex,
+                                   PriceIndex, SortedIndex)
+from models.engine.mapped_store import MappedStore, RecordFile
+from models.engine.read_model import HbnbReadModel
+from models.engine.search import PlaceSearch
+
+# the (class name, foreign key) of the objects deleted with an object of
+# each class, like the cascade="all, delete, delete-orphan" relationships
+CASCADES = {
+    "State": (("City", "state_id"),),
+    "City": (("Place", "city_id"),),
+    "User": (("Place", "user_id"), ("Review", "user_id")),
+    "Place": (("Review", "place_id"),),
+}
+
+
+class SnapshotDict(dict):
+    """Dictionary behind a snapshot() view, weakly referenceable so the
+    storage can find the views still in use
+    """
 
 
 class FileStorage:
@@ -14,47 +46,638 @@ class FileStorage:
     Attributes:
         __file_path (str): string - path to the JSON file
         __objects (dict): A dictionary of instantiated objects.
+        __sorted (dict): SortedIndex of (class name, attribute) pairs,
+            built by the first page() over them
+        __amenities (AmenityIndex): places by amenity, built by the first
+            places_with_amenities()
+        __grid (GridIndex): places by coordinates, built by the first
+            geographic query, with cells of HBNB_GEO_CELL_DEG degrees
+        __prices (PriceIndex): places by city and price_by_night, built
+            by the first places_by_price() or price_stats()
+        __search (PlaceSearch): facets of the places, built by the first
+            search_places()
+        __aggregates (Aggregates): place and review totals of the cities
+            and states, built by the first aggregate()
+        __read_model (HbnbReadModel): data of the /hbnb page, made by the
+            first hbnb_read_model()
+        __frozen (tuple): the __objects the snapshot() views were taken
+            from and the views by class name, None for every class
+        __views (WeakValueDictionary): the SnapshotDict of the views
+            still in use in compact mode, by id
+        __thaws (int): number of __thaw() calls, a view built while it
+            changed may miss a write and is not kept
+        __foreign (dict): ForeignKeyIndex of the (class name, foreign key)
+            pairs of CASCADES, built by the first delete() needing them
+        __texts (dict): InvertedIndex of the full-text fields by class
+            name, built by the first search_text() on them
+        __changed (set): keys of the objects stored or deleted since the
+            last checkpoint(), None until a full one is taken
+    The changes are published to the EventStream of events() when save()
+    has written them, appended to HBNB_EVENTS_FILE if set.
+    With HBNB_FILE_COMPRESSION set to gzip, bz2, xz or zstd the file is
+    written compressed, at HBNB_FILE_COMPRESSION_LEVEL, with the suffix of
+    the format appended to __file_path; see the compression module.
+    With HBNB_FILE_COMPACT=1, __objects is a CompactStore keeping the
+    attributes in columns, saved and reloaded objects are then served as
+    lightweight proxies instead of full instances.
+    With HBNB_FILE_MAPPED=1, the file is a record file saved at
+    __file_path with .rec appended, and __objects a MappedStore reading it
+    through mmap: an object is only read from the file and built when it
+    is looked up, see the mapped_store module
     """
     __file_path = "file.json"
     __objects = {}
+    __sorted = {}
+    __amenities = None
+    __grid = None
+    __prices = None
+    __search = None
+    __texts = {}
+    __aggregates = None
+    __read_model = None
+    __events = None
+    __foreign = {}
+    __frozen = None
+    __views = weakref.WeakValueDictionary()
+    __thaws = 0
+    __changed = None
+    __write_lock = threading.Lock()
+    __generation = 0
+    __written = 0
+
+    def __init__(self):
+        """Initializes FileStorage Class"""
+        compact = isinstance(FileStorage.__objects, CompactStore)
+        mapped = isinstance(FileStorage.__objects, MappedStore)
+        if getenv("HBNB_FILE_MAPPED") == "1":
+            if not mapped:
+                FileStorage.__objects = MappedStore(self.get_class)
+        elif getenv("HBNB_FILE_COMPACT") == "1" and not compact:
+            FileStorage.__objects = CompactStore()
+        if FileStorage.__events is None:
+            FileStorage.__events = EventStream(getenv("HBNB_EVENTS_FILE"))
 
     def all(self, cls=None):
         """returns the dictionary __objects"""
+        if isinstance(cls, str):
+            cls = self.get_class(cls)
         if cls is None:
             return {k: v for k, v in self.__objects.items()}
-        return {k: v for k, v in self.__objects.items() if type(v) == cls}
+        return {k: v for k, v in self.__objects.items()
+                if v.__class__ is cls}
+
+    def snapshot(self, cls=None):
+        """returns a read-only view of all or filtered objects, keyed like
+        all(). Views are never modified: a write that adds, replaces or
+        deletes an object makes the next snapshot() copy the objects again,
+        so a view can be iterated while others write, and taking it again
+        without writes in between costs nothing. The objects themselves
+        are shared, not copied; in compact mode, the proxy of an object
+        deleted since is replaced by a detached instance, since proxies
+        can not outlive their row
+        """
+        name = cls if cls is None or isinstance(cls, str) else cls.__name__
+        frozen = FileStorage.__frozen
+        if frozen is None or frozen[0] is not self.__objects:
+            frozen = FileStorage.__frozen = (self.__objects, {})
+        view = frozen[1].get(name)
+        if view is None:
+            thaws = FileStorage.__thaws
+            objects = SnapshotDict(self.all(name))
+            if isinstance(self.__objects, CompactStore):
+                self.__views[id(objects)] = objects
+            view = MappingProxyType(objects)
+            if thaws == FileStorage.__thaws:
+                frozen[1][name] = view
+        return view
+
+    def __thaw(self, name):
+        """drops the snapshot views holding the objects of class name,
+        called once the write is made
+        """
+        FileStorage.__thaws += 1
+        frozen = FileStorage.__frozen
+        if frozen is not None:
+            frozen[1].pop(None, None)
+            frozen[1].pop(name, None)
+
+    def iter(self, cls=None, batch_size=1000):
+        """yields all or filtered objects without building a dictionary
+        batch_size is accepted for compatibility with DBStorage
+        """
+        if isinstance(cls, str):
+            cls = self.get_class(cls)
+        for obj in list(self.__objects.values()):
+            if cls is None or obj.__class__ is cls:
+                yield obj
+
+    def get(self, cls, id):
+        """returns the object of class cls with the given id, or None"""
+        name = cls if isinstance(cls, str) else cls.__name__
+        return self.__objects.get("{}.{}".format(name, id))
+
+    def count(self, cls=None):
+        """returns the number of all or filtered objects"""
+        if cls is None:
+            return len(self.__objects)
+        return sum(1 for _ in self.iter(cls))
+
+    def page(self, cls, limit=25, cursor=None, order_by="created_at"):
+        """returns a (objects, cursor) tuple holding up to limit objects of
+        class cls sorted by (order_by, id), starting after cursor. The
+        returned cursor fetches the next page and is None on the last one
+        Raises:
+            ValueError: if order_by is not an indexed order or cls has no
+                column of that name
+        """
+        if isinstance(cls, str):
+            cls = self.get_class(cls)
+        pagination.check_order(order_by, cls)
+        name = cls.__name__
+        index = self.__sorted.get((name, order_by))
+        if index is None:
+            index = SortedIndex(order_by)
+            for obj in self.iter(name):
+                index.add(obj)
+            self.__sorted[(name, order_by)] = index
+        after = pagination.decode_cursor(cursor, order_by)
+        position = None if after is None else index.position(*after)
+        ids = index.after(position, limit + 1)
+        objs = [self.__objects["{}.{}".format(name, id)]
+                for id in ids[:limit]]
+        if len(ids) <= limit:
+            return objs, None
+        return objs, pagination.encode_cursor(objs[-1], order_by)
+
+    def places_with_amenities(self, amenities):
+        """returns the list of the places having every one of amenities,
+        given as Amenity objects or ids. Places are indexed when they are
+        passed to new(), which save() does
+        """
+        ids = {getattr(amenity, "id", amenity) for amenity in amenities}
+        index = self.__amenity_index()
+        if not ids:
+            return list(self.iter("Place"))
+        return [self.__objects["Place.{}".format(id)]
+                for id in index.places(ids)]
+
+    def __amenity_index(self):
+        """returns the amenity index of the places, building it if needed
+        """
+        if self.__amenities is None:
+            self.__amenities = AmenityIndex()
+            for place in self.iter("Place"):
+                self.__amenities.add(place)
+        return self.__amenities
+
+    def places_in_box(self, south, west, north, east):
+        """returns the list of the places whose coordinates lie in the
+        box, west is greater than east for boxes crossing the antimeridian
+        """
+        return [self.__objects["Place.{}".format(id)]
+                for id, _, _ in self.__geo().within(
+                    (south, west, north, east))]
+
+    def places_within(self, lat, lon, radius_km):
+        """returns the list of the places within radius_km of (lat, lon),
+        nearest first. Places are indexed when they are passed to new()
+        """
+        found = []
+        box = geo.bounding_box(lat, lon, radius_km)
+        for id, place_lat, place_lon in self.__geo().within(box):
+            distance = geo.distance_km(lat, lon, place_lat, place_lon)
+            if distance <= radius_km:
+                found.append((distance, id))
+        found.sort()
+        return [self.__objects["Place.{}".format(id)] for _, id in found]
+
+    def __geo(self):
+        """returns the grid index of the places, building it if needed"""
+        if self.__grid is None:
+            self.__grid = GridIndex(float(getenv("HBNB_GEO_CELL_DEG", "0.1")))
+            for place in self.iter("Place"):
+                self.__grid.add(place)
+        return self.__grid
+
+    def places_by_price(self, city_id=None, low=None, high=None,
+                        limit=None, descending=False):
+        """returns the list of up to limit places of city_id, of every
+        city for None, priced from low to high included, cheapest first or
+        most expensive first when descending
+        """
+        return [self.__objects["Place.{}".format(id)]
+                for id in self.__price_index().range(
+                    city_id, low, high, limit, descending)]
+
+    def price_stats(self, city_id=None, percentiles=(50,)):
+        """returns the count, min and max price_by_night of the places of
+        city_id, of every city for None, and its nearest-rank percentiles
+        as a {"count", "min", "max", "percentiles": {q: price}} dictionary
+        """
+        index = self.__price_index()
+        return {
+            "count": index.count(city_id),
+            "min": index.percentile(0, city_id),
+            "max": index.percentile(100, city_id),
+            "percentiles": {q: index.percentile(q, city_id)
+                            for q in percentiles},
+        }
+
+    def __price_index(self):
+        """returns the price index of the places, building it if needed"""
+        if self.__prices is None:
+            self.__prices = PriceIndex()
+            for place in self.iter("Place"):
+                self.__prices.add(place)
+        return self.__prices
+
+    def search_places(self, filters=None):
+        """returns the (places, facets) of a faceted search, see
+        PlaceSearch.search for the filters and facet counts
+        """
+        if self.__search is None:
+            self.__search = PlaceSearch()
+            for place in self.iter("Place"):
+                self.__search.add(place)
+            for city in self.iter("City"):
+                self.__search.set_city(city.id, city.state_id)
+        ids, facets = self.__search.search(filters)
+        return [self.__objects["Place.{}".format(id)] for id in ids], facets
+
+    def search_text(self, cls, query, limit=10):
+        """returns the limit objects of cls, Place or Review, whose
+        description or text best match the words of query, best first
+        """
+        name = cls if isinstance(cls, str) else cls.__name__
+        if name not in fulltext.FIELDS:
+            raise ValueError("{} has no full-text field".format(name))
+        index = self.__texts.get(name)
+        if index is None:
+            index = self.__texts[name] = fulltext.InvertedIndex()
+            field = fulltext.FIELDS[name][1]
+            for obj in self.iter(name):
+                index.add(obj.id, getattr(obj, field, None))
+        return [self.__objects["{}.{}".format(name, id)]
+                for id in index.search(query, limit)]
+
+    def aggregate(self, cls, id):
+        """returns the maintained aggregates of the State, City or Place
+        with the given id, see Aggregates.get
+        """
+        name = cls if isinstance(cls, str) else cls.__name__
+        if self.__aggregates is None:
+            self.__aggregates = self.__build_aggregates()
+        return self.__aggregates.get(name, id)
+
+    def rebuild_aggregates(self):
+        """recomputes the aggregates from the stored objects and returns
+        the keys of the maintained ones that were wrong
+        """
+        rebuilt = self.__build_aggregates()
+        wrong = [] if self.__aggregates is None else \
+            aggregates.differences(self.__aggregates, rebuilt)
+        self.__aggregates = rebuilt
+        return wrong
+
+    def __build_aggregates(self):
+        """returns the aggregates of the stored objects"""
+        totals = aggregates.Aggregates()
+        for name in ("City", "Place", "Review"):
+            for obj in self.iter(name):
+                totals.add(obj)
+        return totals
+
+    def hbnb_read_model(self):
+        """returns the read model of the /hbnb page, kept up to date by
+        new() and delete()
+        """
+        if self.__read_model is None:
+            self.__read_model = HbnbReadModel(self)
+        return self.__read_model
+
+    def events(self):
+        """returns the stream of the changes, shared by every FileStorage
+        """
+        return self.__events
+
+    def checkpoint(self, directory=None, full=False):
+        """writes a checkpoint of the objects to directory, by default
+        HBNB_BACKUP_DIR or "backups", and returns its path. It is a full
+        one the first time, after a reload() or when full is set, and an
+        increment holding the objects stored or deleted since the last
+        checkpoint otherwise. It is taken under __write_lock, so
+        checkpoints taken at once get numbers in the order of the changes
+        they hold and never the same one; save() waits for it, writers of
+        objects do not
+        """
+        directory = directory or getenv("HBNB_BACKUP_DIR", "backups")
+        with self.__write_lock:
+            changed, self.__changed = self.__changed, set()
+            if full or changed is None:
+                path = backup.next_path(directory, backup.FULL)
+                lines = [backup.entry(k, v)
+                         for k, v in self.__snapshot()[0]]
+            else:
+                path = backup.next_path(directory, backup.INCREMENT)
+                lines = []
+                for key in changed:
+                    obj = self.__objects.get(key)
+                    lines.append(backup.entry(
+                        key, None if obj is None else obj.to_json()))
+            return backup.write(path, "file", lines)
 
     def new(self, obj):
         """Set in __objects obj with key <obj_class_name>.id"""
-        self.__objects["{}.{}".format(obj.__class__.__name__, obj.id)] = obj
+        name = obj.__class__.__name__
+        key = "{}.{}".format(name, obj.id)
+        if self.__changed is not None:
+            self.__changed.add(key)
+        if self.__events.active:
+            changed = changed_fields(obj)
+            if key not in self.__objects:
+                self.__events.record("create", name, obj.id, [
+                    k for k in obj.to_dict() if k != "__class__"])
+            elif changed != ():
+                self.__events.record("update", name, obj.id, changed)
+        replaced = self.__objects.get(key) is not obj
+        self.__objects[key] = obj
+        if replaced:
+            self.__thaw(name)
+        for (cls_name, _), index in self.__sorted.items():
+            if cls_name == name:
+                index.add(obj)
+        for (cls_name, _), index in self.__foreign.items():
+            if cls_name == name:
+                index.add(obj)
+        if name == "Place" and self.__amenities is not None:
+            self.__amenities.add(obj)
+        if name == "Place" and self.__grid is not None:
+            self.__grid.add(obj)
+        if name == "Place" and self.__prices is not None:
+            self.__prices.add(obj)
+        if name in self.__texts:
+            self.__texts[name].add(
+                obj.id, getattr(obj, fulltext.FIELDS[name][1], None))
+        if self.__aggregates is not None:
+            self.__aggregates.add(obj)
+        if self.__read_model is not None:
+            self.__read_model.changed(obj)
+        if self.__search is not None:
+            if name == "Place":
+                self.__search.add(obj)
+            elif name == "City":
+                self.__search.set_city(obj.id, obj.state_id)
 
     def save(self):
-        """Serialize __objects to the JSON file __file_path."""
-        with open(self.__file_path, 'w') as f:
-            json.dump({k: v.to_dict() for k, v in self.__objects.items()}, f)
+        """Serialize __objects to the JSON file __file_path, then publishes
+        the changes it holds
+        """
+        batch = self.__events.take()
+        self.__write(*self.__snapshot())
+        self.__events.publish(batch)
+
+    async def aall(self, cls=None):
+        """returns the dictionary __objects, objects live in memory so
+        this never blocks the event loop
+        """
+        return self.all(cls)
+
+    async def aget(self, cls, id):
+        """returns the object of class cls with the given id, or None"""
+        return self.get(cls, id)
+
+    async def acount(self, cls=None):
+        """returns the number of all or filtered objects"""
+        return self.count(cls)
+
+    async def asave(self):
+        """Serialize __objects to the JSON file __file_path, encoding and
+        writing the file in a worker thread
+        """
+        batch = self.__events.take()
+        await asyncio.to_thread(self.__write, *self.__snapshot())
+        self.__events.publish(batch)
+
+    def __snapshot(self):
+        """returns the (key, JSON bytes) pairs of the objects as they are
+        now, with a generation number ordering the snapshots
+        """
+        if isinstance(self.__objects, CompactStore):
+            self.__objects.compact()
+            FileStorage.__frozen = None
+        FileStorage.__generation += 1
+        if isinstance(self.__objects, MappedStore):
+            objs = list(self.__objects.json_items())
+        else:
+            objs = [(k, v.to_json()) for k, v in self.__objects.items()]
+        return objs, FileStorage.__generation
+
+    def __write(self, objs, generation):
+        """writes a snapshot to __file_path through a temporary file,
+        unless a newer snapshot was written already
+        """
+        with self.__write_lock:
+            if generation < FileStorage.__written:
+                return
+            codec = compression.codec_of(getenv("HBNB_FILE_COMPRESSION"))
+            level = getenv("HBNB_FILE_COMPRESSION_LEVEL")
+            mapped = isinstance(self.__objects, MappedStore)
+            path = self.__paths()[0]
+            tmp_path = "{}.tmp".format(path)
+            if mapped:
+                mapped_store.write(tmp_path, objs)
+            else:
+                with compression.open_file(
+                        tmp_path, 'wb', codec,
+                        int(level) if level else None) as f:
+                    f.write(b"{")
+                    for i, (k, v) in enumerate(objs):
+                        f.write(b"%s%s: %s" % (
+                            b", " if i else b"", json.dumps(k).encode(), v))
+                    f.write(b"}")
+            os.replace(tmp_path, path)
+            # the file saved in another format before is out of date now
+            for other in self.__paths():
+                if other != path and os.path.isfile(other):
+                    os.remove(other)
+            if mapped:
+                self.__objects.map(RecordFile(path))
+            FileStorage.__written = generation
+
+    def __paths(self):
+        """returns the paths the file may be saved at, the one of the
+        configured format first, then the plain one and the others
+        """
+        if isinstance(self.__objects, MappedStore):
+            paths = [self.__file_path + mapped_store.SUFFIX]
+        else:
+            codec = compression.codec_of(getenv("HBNB_FILE_COMPRESSION"))
+            paths = [self.__file_path + compression.suffix(codec)]
+        for other in [None] + list(compression.CODECS):
+            path = self.__file_path + compression.suffix(other)
+            if path not in paths:
+                paths.append(path)
+        if paths[0] != self.__file_path + mapped_store.SUFFIX:
+            paths.append(self.__file_path + mapped_store.SUFFIX)
+        return paths
 
     def reload(self):
-        """Deserialize the JSON file __file_path to __objects, if it exists."""
-        path = self.__file_path
+        """Deserialize the JSON file __file_path to __objects, if it exists.
+        A compressed file or a record file is read in the format it was
+        written in
+        """
+        path = next((path for path in self.__paths()
+                     if os.path.isfile(path)), self.__file_path)
         if (os.path.isfile(path) and os.path.getsize(path) > 0):
-            with open(self.__file_path, 'r') as f:
-                self.__objects = {
-                    k: self.get_class(k.split(".")[0])(**v)
-                    for k, v in json.load(f).items()
-                }
+            classes = {}
+            compact = isinstance(self.__objects, CompactStore)
+            mapped = isinstance(self.__objects, MappedStore)
+            # the loaded objects only reference each other, pausing the
+            # garbage collector saves it rescanning them as they pile up
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                if mapped:
+                    store = MappedStore(self.get_class)
+                    store.map(self.__read(path, mapped))
+                    records = {}
+                else:
+                    store = CompactStore() if compact else None
+                    records = self.__read(path, mapped)
+                for k, v in records.items():
+                    name = k.split(".")[0]
+                    if name not in classes:
+                        classes[name] = self.get_class(name)
+                    if compact:
+                        store.load(classes[name], v)
+                    else:
+                        records[k] = classes[name].from_record(v)
+            finally:
+                if collecting:
+                    gc.enable()
+            self.__objects = store if compact or mapped else records
+            self.__sorted = {}
+            self.__amenities = None
+            self.__grid = None
+            self.__prices = None
+            self.__search = None
+            self.__texts = {}
+            self.__aggregates = None
+            self.__read_model = None
+            self.__foreign = {}
+            self.__changed = None
+            self.__events.discard()
+
+    def __read(self, path, mapped):
+        """returns the records of the file at path: its RecordFile when
+        mapped, a dictionary of the attributes by key otherwise. A file
+        of another format read when mapped is converted to a record file
+        """
+        if mapped_store.is_record_file(path):
+            records = RecordFile(path)
+            if mapped:
+                return records
+            return {k: json.loads(v) for k, v in records.items()}
+        with compression.open_file(
+                path, 'rb', compression.detect(path)) as f:
+            records = json.load(f)
+        if not mapped:
+            return records
+        path = self.__paths()[0]
+        tmp_path = "{}.tmp".format(path)
+        mapped_store.write(tmp_path, ((k, json.dumps(v).encode())
+                                      for k, v in records.items()))
+        os.replace(tmp_path, path)
+        return RecordFile(path)
 
     def delete(self, obj=None):
-        """Deletes an object"""
+        """Deletes an object and, like the database cascades, the objects
+        depending on it: found through the foreign key indexes of CASCADES,
+        so the store is never scanned. Deleting an amenity removes it from
+        the amenity_ids of its places
+        """
         if obj is None:
             return None
-        key = "{}.{}".format(obj.__class__.__name__, obj.id)
-        return self.__objects.pop(key, None)
+        parents = [(obj.__class__.__name__, obj.id)]
+        removed = self.__remove(obj)
+        while parents:
+            name, id = parents.pop()
+            if name == "Amenity":
+                self.__unlink_amenity(id)
+            for child_name, key in CASCADES.get(name, ()):
+                for child_id in self.__children(child_name, key, id):
+                    child = self.__objects.get(
+                        "{}.{}".format(child_name, child_id))
+                    if child is not None:
+                        self.__remove(child)
+                        parents.append((child_name, child_id))
+        return removed
+
+    def __children(self, name, key, parent_id):
+        """returns the ids of the objects of class name whose foreign key
+        is parent_id, indexing the foreign key first if needed
+        """
+        index = self.__foreign.get((name, key))
+        if index is None:
+            index = self.__foreign[(name, key)] = ForeignKeyIndex(key)
+            for obj in self.iter(name):
+                index.add(obj)
+        return index.children(parent_id)
+
+    def __unlink_amenity(self, amenity_id):
+        """removes an amenity from the amenity_ids of its places"""
+        for place_id in self.__amenity_index().places([amenity_id]):
+            place = self.__objects["Place.{}".format(place_id)]
+            place.amenity_ids = [
+                id for id in place.amenity_ids if id != amenity_id]
+            self.new(place)
+
+    def __remove(self, obj):
+        """removes one object from __objects and the indexes"""
+        name = obj.__class__.__name__
+        if self.__changed is not None:
+            self.__changed.add("{}.{}".format(name, obj.id))
+        if self.__events.active:
+            self.__events.record("delete", name, obj.id)
+        for (cls_name, _), index in self.__sorted.items():
+            if cls_name == name:
+                index.remove(obj.id)
+        for (cls_name, _), index in self.__foreign.items():
+            if cls_name == name:
+                index.remove(obj.id)
+        if name == "Place" and self.__amenities is not None:
+            self.__amenities.remove(obj.id)
+        if name == "Place" and self.__grid is not None:
+            self.__grid.remove(obj.id)
+        if name == "Place" and self.__prices is not None:
+            self.__prices.remove(obj.id)
+        if name in self.__texts:
+            self.__texts[name].remove(obj.id)
+        if self.__aggregates is not None:
+            self.__aggregates.remove(obj)
+        if self.__read_model is not None:
+            self.__read_model.changed(obj, deleted=True)
+        if self.__search is not None:
+            if name == "Place":
+                self.__search.remove(obj.id)
+            elif name == "City":
+                self.__search.set_city(obj.id, None)
+        key = "{}.{}".format(name, obj.id)
+        removed = self.__objects.pop(key, None)
+        if isinstance(self.__objects, CompactStore):
+            # proxies read their row, the views taken before get the
+            # detached instance pop() returns in place of the deleted one
+            for view in list(self.__views.values()):
+                if isinstance(view.get(key), RowProxy):
+                    view[key] = removed
+        self.__thaw(name)
+        return removed
 
     def get_class(self, name):
         """ returns a class from models module using its name"""
         sub_module = re.sub('(?!^)([A-Z]+)', r'_\1', name).lower()
         module = importlib.import_module(
-            "models.{sub_module}".format(sub_module))
+            "models.{}".format(sub_module))
         return getattr(module, name)
 
     def close(self):
@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+"""Module fulltext
+This Module contains the full-text search of Place.description and
+Review.text: the tokenizer, the InvertedIndex FileStorage keeps in memory,
+and the SQLite FTS5 tables DBStorage keeps in sync with triggers. MySQL
+uses the FULLTEXT indexes declared on the models instead.
+The FTS5 tables index the implicit rowid of the tables, whose primary key
+is the String id: VACUUM may renumber it, so the tables are rebuilt after
+it with sqlite_rebuild(), as DBStorage.vacuum() and the SQLite restore of
+the backup module do
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+
+FIELDS = {"Place": ("places", "description"), "Review": ("reviews", "text")}
+
+TOKEN = re.compile(r"\w\w+")
+
+
+def tokenize(text):
+    """returns the lowercase words of two characters or more of text"""
+    return TOKEN.findall(text.lower()) if text else []
+
+
+def fts_query(query):
+    """returns an FTS5 query matching any word of query, or None when it
+    has no word
+    """
+    words = list(dict.fromkeys(tokenize(query)))
+    return " OR ".join('"{}"'.format(word) for word in words) or None
+
+
+def sqlite_ddl(table, column):
+    """returns the statements creating the external content FTS5 table
+    of table.column and the triggers keeping it in sync. The table is
+    named <table>_fts and indexes the rowid of table, see sqlite_rebuild()
+    """
+    fts = "{}_fts".format(table)
+    old = "INSERT INTO {0}({0}, rowid, {1}) VALUES ('delete', old.rowid, " \
+          "old.{1});".format(fts, column)
+    new = "INSERT INTO {0}(rowid, {1}) VALUES (new.rowid, new.{1});".format(
+        fts, column)
+    return [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS {0} USING fts5({1}, "
+        "content='{2}', content_rowid='rowid')".format(fts, column, table),
+        "CREATE TRIGGER IF NOT EXISTS {0}_ai AFTER INSERT ON {1} "
+        "BEGIN {2} END".format(fts, table, new),
+        "CREATE TRIGGER IF NOT EXISTS {0}_ad AFTER DELETE ON {1} "
+        "BEGIN {2} END".format(fts, table, old),
+        "CREATE TRIGGER IF NOT EXISTS {0}_au AFTER UPDATE ON {1} "
+        "BEGIN {2} {3} END".format(fts, table, old, new),
+    ]
+
+
+def sqlite_rebuild(table):
+    """returns the statement filling the FTS5 table of table again from
+    its rows, to run when it is created and after anything that may
+    renumber their rowids, like VACUUM
+    """
+    return "INSERT INTO {0}_fts({0}_fts) VALUES ('rebuild')".format(table)
+
+
+class InvertedIndex:
+    """Maps the words of a text field to the ids of the objects using
+    them, with their counts, and ranks the objects matching a query with
+    BM25
+    Attributes:
+        k1 (float): term frequency saturation of BM25
+        b (float): length normalization of BM25
+    """
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self):
+        """Initializes InvertedIndex Class"""
+        self.__postings = {}
+        self.__terms = {}
+        self.__lengths = {}
+        self.__total = 0
+
+    def __len__(self):
+        """returns the number of indexed texts"""
+        return len(self.__lengths)
+
+    def add(self, id, text):
+        """indexes the words of text for id, replacing its older text"""
+        self.remove(id)
+        tokens = tokenize(text)
+        if not tokens:
+            return
+        counts = Counter(tokens)
+        for term, count in counts.items():
+            self.__postings.setdefault(term, {})[id] = count
+        self.__terms[id] = tuple(counts)
+        self.__lengths[id] = len(tokens)
+        self.__total += len(tokens)
+
+    def remove(self, id):
+        """removes the text of id from the index"""
+        length = self.__lengths.pop(id, None)
+        if length is None:
+            return
+        self.__total -= length
+        for term in self.__terms.pop(id):
+            postings = self.__postings[term]
+            del postings[id]
+            if not postings:
+                del self.__postings[term]
+
+    def search(self, query, limit=10):
+        """returns the ids of the limit best texts matching any word of
+        query, best first
+        """
+        count = len(self.__lengths)
+        if not count:
+            return []
+        average = self.__total / count
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.__postings.get(term)
+            if postings is None:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) /
+                           (len(postings) + 0.5))
+            for id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b *
+                                  self.__lengths[id] / average)
+                scores[id] = scores.get(id, 0.0) + idf * \
+                    frequency * (self.k1 + 1) / (frequency + norm)
+        best = heapq.nlargest(limit, scores.items(),
+                              key=lambda entry: (entry[1], entry[0]))
+        return [id for id, _ in best]
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""Module geo
+This Module contains the distance and bounding box computations behind
+the places_within and places_in_box queries of the storage engines.
+Boxes are (south, west, north, east) tuples in degrees, west is greater
+than east when a box crosses the antimeridian
+"""
+
+from math import asin, cos, degrees, radians, sin, sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """returns the great circle distance between two points in km"""
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + \
+        cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def bounding_box(lat, lon, radius_km):
+    """returns the smallest box holding every point within radius_km of
+    (lat, lon). Boxes reaching a pole span every longitude
+    """
+    angle = radius_km / EARTH_RADIUS_KM
+    south = lat - degrees(angle)
+    north = lat + degrees(angle)
+    if south <= -90 or north >= 90:
+        return (max(south, -90.0), -180.0, min(north, 90.0), 180.0)
+    ratio = sin(angle) / cos(radians(lat))
+    if ratio >= 1:
+        return (south, -180.0, north, 180.0)
+    dlon = degrees(asin(ratio))
+    west, east = lon - dlon, lon + dlon
+    if west < -180:
+        west += 360
+    if east > 180:
+        east -= 360
+    return (south, west, north, east)
+
+
+def split_box(box):
+    """returns the boxes not crossing the antimeridian covering box"""
+    south, west, north, east = box
+    if west <= east:
+        return [box]
+    return [(south, west, north, 180.0), (south, -180.0, north, east)]
+
+
+def in_box(lat, lon, box):
+    """tells whether the point (lat, lon) lies in box"""
+    south, west, north, east = box
+    if not south <= lat <= north:
+        return False
+    if west <= east:
+        return west <= lon <= east
+    return lon >= west or lon <= east
@@ -0,0 +1,311 @@
+#!/usr/bin/python3
+"""Module indexes
+This Module contains the in-memory secondary indexes FileStorage keeps
+up to date as objects are added and deleted
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from math import ceil, floor
+
+from models.engine import geo
+from models.engine.pagination import sort_value
+
+
+class SortedIndex:
+    """Keeps the ids of one class sorted on (attribute, id)
+    Attributes:
+        attr (str): name of the attribute the ids are sorted on
+    """
+
+    def __init__(self, attr):
+        """Initializes SortedIndex Class
+        Args:
+            attr (str): name of the attribute the ids are sorted on
+        """
+        self.attr = attr
+        self.__entries = []
+        self.__positions = {}
+
+    def __len__(self):
+        """returns the number of indexed objects"""
+        return len(self.__entries)
+
+    def position(self, value, id):
+        """returns the sort position of an object given its values"""
+        return (sort_value(value), id)
+
+    def add(self, obj):
+        """indexes obj, moving it if its attribute changed"""
+        entry = self.position(getattr(obj, self.attr, None), obj.id)
+        old = self.__positions.get(obj.id)
+        if old == entry:
+            return
+        if old is not None:
+            self.remove(obj.id)
+        insort(self.__entries, entry)
+        self.__positions[obj.id] = entry
+
+    def remove(self, id):
+        """removes the object with the given id from the index"""
+        entry = self.__positions.pop(id, None)
+        if entry is not None:
+            del self.__entries[bisect_right(self.__entries, entry) - 1]
+
+    def after(self, position=None, limit=None):
+        """returns up to limit ids sorted after position, from the start
+        when position is None
+        """
+        start = 0 if position is None else bisect_right(
+            self.__entries, position)
+        stop = None if limit is None else start + limit
+        return [entry[1] for entry in self.__entries[start:stop]]
+
+
+class AmenityIndex:
+    """Maps amenity ids to the ids of the places having them, so that
+    the places having several amenities are a set intersection
+    """
+
+    def __init__(self):
+        """Initializes AmenityIndex Class"""
+        self.__places = {}
+        self.__amenities = {}
+
+    def __len__(self):
+        """returns the number of indexed places"""
+        return len(self.__amenities)
+
+    def add(self, place):
+        """indexes place under its amenity_ids, replacing the ids it was
+        indexed under before
+        """
+        ids = frozenset(place.amenity_ids or ())
+        old = self.__amenities.get(place.id, frozenset())
+        for amenity_id in old - ids:
+            self.__discard(amenity_id, place.id)
+        for amenity_id in ids - old:
+            self.__places.setdefault(amenity_id, set()).add(place.id)
+        self.__amenities[place.id] = ids
+
+    def remove(self, id):
+        """removes the place with the given id from the index"""
+        for amenity_id in self.__amenities.pop(id, ()):
+            self.__discard(amenity_id, id)
+
+    def places(self, amenity_ids):
+        """returns the set of the ids of the places having every amenity
+        of amenity_ids, which must not be empty
+        """
+        sets = sorted((self.__places.get(amenity_id, set())
+                       for amenity_id in set(amenity_ids)), key=len)
+        found = set(sets[0])
+        for ids in sets[1:]:
+            if not found:
+                break
+            found &= ids
+        return found
+
+    def __discard(self, amenity_id, id):
+        """removes one place id from the set of an amenity"""
+        ids = self.__places[amenity_id]
+        ids.discard(id)
+        if not ids:
+            del self.__places[amenity_id]
+
+
+class ForeignKeyIndex:
+    """Maps the values of a foreign key attribute, like City.state_id, to
+    the ids of the objects holding them
+    """
+
+    def __init__(self, attr):
+        """Initializes ForeignKeyIndex Class
+        Args:
+            attr (str): name of the foreign key attribute
+        """
+        self.__attr = attr
+        self.__children = {}
+        self.__parents = {}
+
+    def __len__(self):
+        """returns the number of indexed objects"""
+        return len(self.__parents)
+
+    def add(self, obj):
+        """indexes obj under its foreign key, moving it if it changed"""
+        parent_id = getattr(obj, self.__attr, None)
+        if obj.id in self.__parents:
+            if self.__parents[obj.id] == parent_id:
+                return
+            self.remove(obj.id)
+        self.__parents[obj.id] = parent_id
+        self.__children.setdefault(parent_id, set()).add(obj.id)
+
+    def remove(self, id):
+        """removes the object with the given id from the index"""
+        if id not in self.__parents:
+            return
+        parent_id = self.__parents.pop(id)
+        ids = self.__children[parent_id]
+        ids.discard(id)
+        if not ids:
+            del self.__children[parent_id]
+
+    def children(self, parent_id):
+        """returns the list of the ids of the objects referencing
+        parent_id
+        """
+        return list(self.__children.get(parent_id, ()))
+
+
+class GridIndex:
+    """Groups the places with coordinates by cells of a latitude and
+    longitude grid, so that a box only reads the cells it overlaps
+    Attributes:
+        cell_deg (float): side of the cells in degrees
+    """
+
+    def __init__(self, cell_deg=0.1):
+        """Initializes GridIndex Class
+        Args:
+            cell_deg (float): side of the cells in degrees
+        """
+        self.cell_deg = cell_deg
+        self.__cells = {}
+        self.__points = {}
+
+    def __len__(self):
+        """returns the number of indexed places"""
+        return len(self.__points)
+
+    def add(self, place):
+        """indexes place at its coordinates, moving it if they changed,
+        places without coordinates are removed
+        """
+        if place.latitude is None or place.longitude is None:
+            self.remove(place.id)
+            return
+        point = (place.latitude, place.longitude)
+        old = self.__points.get(place.id)
+        if old == point:
+            return
+        if old is not None:
+            self.remove(place.id)
+        self.__cells.setdefault(self.__cell(*point), set()).add(place.id)
+        self.__points[place.id] = point
+
+    def remove(self, id):
+        """removes the place with the given id from the index"""
+        point = self.__points.pop(id, None)
+        if point is None:
+            return
+        cell = self.__cell(*point)
+        self.__cells[cell].discard(id)
+        if not self.__cells[cell]:
+            del self.__cells[cell]
+
+    def within(self, box):
+        """returns the (id, latitude, longitude) of the places in box"""
+        found = []
+        for part in geo.split_box(box):
+            south, west, north, east = part
+            (row0, col0), (row1, col1) = \
+                self.__cell(south, west), self.__cell(north, east)
+            if (row1 - row0 + 1) * (col1 - col0 + 1) <= len(self.__cells):
+                cells = (self.__cells.get((row, col), ())
+                         for row in range(row0, row1 + 1)
+                         for col in range(col0, col1 + 1))
+            else:
+                cells = (ids for (row, col), ids in self.__cells.items()
+                         if row0 <= row <= row1 and col0 <= col <= col1)
+            for ids in cells:
+                for id in ids:
+                    lat, lon = self.__points[id]
+                    if geo.in_box(lat, lon, part):
+                        found.append((id, lat, lon))
+        return found
+
+    def __cell(self, lat, lon):
+        """returns the (row, column) of the cell holding a point"""
+        return (floor(lat / self.cell_deg), floor(lon / self.cell_deg))
+
+
+def _price(entry):
+    """returns the price of a (price, id) entry"""
+    return entry[0]
+
+
+class PriceIndex:
+    """Keeps the (price_by_night, id) of the places sorted per city and
+    over all cities, the None city, for price ranges and percentiles
+    """
+
+    def __init__(self):
+        """Initializes PriceIndex Class"""
+        self.__cities = {}
+        self.__entries = {}
+
+    def __len__(self):
+        """returns the number of indexed places"""
+        return len(self.__entries)
+
+    def add(self, place):
+        """indexes place at its city and price, moving it if they changed,
+        places without a price are removed
+        """
+        entry = (place.city_id, place.price_by_night)
+        old = self.__entries.get(place.id)
+        if old == entry:
+            return
+        if old is not None:
+            self.remove(place.id)
+        if entry[1] is None:
+            return
+        for city_id in {entry[0], None}:
+            insort(self.__cities.setdefault(city_id, []),
+                   (entry[1], place.id))
+        self.__entries[place.id] = entry
+
+    def remove(self, id):
+        """removes the place with the given id from the index"""
+        entry = self.__entries.pop(id, None)
+        if entry is None:
+            return
+        for city_id in {entry[0], None}:
+            prices = self.__cities[city_id]
+            del prices[bisect_left(prices, (entry[1], id))]
+            if not prices:
+                del self.__cities[city_id]
+
+    def range(self, city_id=None, low=None, high=None, limit=None,
+              descending=False):
+        """returns the ids of up to limit places of city_id, all cities
+        for None, priced from low to high included, sorted by (price, id)
+        or the reverse
+        """
+        prices = self.__cities.get(city_id, [])
+        start = 0 if low is None else bisect_left(prices, low, key=_price)
+        stop = len(prices) if high is None else \
+            bisect_right(prices, high, key=_price)
+        if descending:
+            stop, start = start, stop
+            if limit is not None:
+                stop = max(stop, start - limit)
+            return [prices[i][1] for i in range(start - 1, stop - 1, -1)]
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return [entry[1] for entry in prices[start:stop]]
+
+    def count(self, city_id=None):
+        """returns the number of priced places of city_id"""
+        return len(self.__cities.get(city_id, ()))
+
+    def percentile(self, q, city_id=None):
+        """returns the nearest-rank q-th percentile price of city_id, the
+        lowest price for 0, or None without places
+        """
+        prices = self.__cities.get(city_id)
+        if not prices:
+            return None
+        rank = max(1, ceil(q / 100 * len(prices)))
+        return prices[rank - 1][0]
@@ -0,0 +1,244 @@
+#!/usr/bin/python3
+"""Module mapped_store
+This Module contains the record file FileStorage saves to when
+HBNB_FILE_MAPPED is set, and the object store reading it: every object is
+one "<class name>.<id>\\t<JSON>" line, followed by a hash table of the
+offsets of the lines. The file is read through mmap, so looking an object
+up touches its table slot and its line only, and the processes mapping
+the same file share its pages in the page cache
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import threading
+from collections.abc import MutableMapping
+
+MAGIC = b"HBNBREC1"
+SUFFIX = ".rec"
+# table slot: hash of the key, offset of its line, 0 for an empty slot
+ENTRY = struct.Struct("<QQ")
+# end of the file: offset of the table, number of slots and of records
+FOOTER = struct.Struct("<QQQ8s")
+
+
+def key_hash(key):
+    """returns the 64 bits hash stored in the table for key bytes"""
+    return int.from_bytes(
+        hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def is_record_file(path):
+    """tells whether the file at path is a record file"""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write(path, items):
+    """writes a record file
+    Args:
+        path (str): file path
+        items (iterable): ("<class name>.<id>", JSON bytes) pairs, each key
+            once
+    """
+    entries = []
+    with open(path, "wb") as f:
+        f.write(MAGIC + b"\n")
+        offset = len(MAGIC) + 1
+        for key, data in items:
+            key = key.encode()
+            if b"\t" in key or b"\n" in key:
+                raise ValueError("invalid record key: {!r}".format(key))
+            entries.append((key_hash(key), offset))
+            line = b"%s\t%s\n" % (key, data)
+            f.write(line)
+            offset += len(line)
+        # at most half full, so every probe sequence ends on an empty slot
+        slots = 1
+        while slots < 2 * len(entries):
+            slots *= 2
+        table = bytearray(slots * ENTRY.size)
+        for hash, position in entries:
+            slot = hash & (slots - 1)
+            while ENTRY.unpack_from(table, slot * ENTRY.size)[1]:
+                slot = (slot + 1) & (slots - 1)
+            ENTRY.pack_into(table, slot * ENTRY.size, hash, position)
+        f.write(table)
+        f.write(FOOTER.pack(offset, slots, len(entries), MAGIC))
+
+
+class RecordFile:
+    """Read-only mapping of a record file, from keys to the JSON bytes of
+    the records
+    Attributes:
+        path (str): path of the file
+    """
+
+    def __init__(self, path):
+        """Initializes RecordFile Class
+        Args:
+            path (str): path of a file made by write()
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.__map) < len(MAGIC) + 1 + FOOTER.size or \
+                self.__map[:len(MAGIC)] != MAGIC:
+            raise ValueError("{} is not a record file".format(path))
+        self.__table, self.__slots, self.__count, magic = \
+            FOOTER.unpack_from(self.__map, len(self.__map) - FOOTER.size)
+        if magic != MAGIC:
+            raise ValueError("{} is truncated".format(path))
+
+    def __len__(self):
+        """returns the number of records"""
+        return self.__count
+
+    def __contains__(self, key):
+        """tells whether the file holds a record for key"""
+        return self.offset(key) is not None
+
+    def offset(self, key):
+        """returns the offset of the line of key, or None"""
+        key = key.encode()
+        hash = key_hash(key)
+        slot = hash & (self.__slots - 1)
+        while True:
+            found, offset = ENTRY.unpack_from(
+                self.__map, self.__table + slot * ENTRY.size)
+            if not offset:
+                return None
+            if found == hash and \
+                    self.__map[offset:offset + len(key) + 1] == key + b"\t":
+                return offset
+            slot = (slot + 1) & (self.__slots - 1)
+
+    def get(self, key):
+        """returns the JSON bytes of the record of key, or None"""
+        offset = self.offset(key)
+        if offset is None:
+            return None
+        start = offset + len(key.encode()) + 1
+        return self.__map[start:self.__map.find(b"\n", start)]
+
+    def items(self):
+        """yields the (key, JSON bytes) pairs in the order of the file"""
+        start = len(MAGIC) + 1
+        while start < self.__table:
+            end = self.__map.find(b"\n", start)
+            key, _, data = self.__map[start:end].partition(b"\t")
+            yield key.decode(), data
+            start = end + 1
+
+    def keys(self):
+        """yields the keys in the order of the file"""
+        for key, _ in self.items():
+            yield key
+
+    def close(self):
+        """unmaps the file"""
+        self.__map.close()
+
+
+class MappedStore(MutableMapping):
+    """Mapping of "<class name>.<id>" keys to objects backed by a
+    RecordFile: an object is built from its record the first time it is
+    read and kept from then on, so reading it again returns the same
+    instance. Stored and deleted objects are kept aside until map()
+    switches to the file they were saved to
+    """
+
+    def __init__(self, get_class):
+        """Initializes MappedStore Class
+        Args:
+            get_class (callable): returns the class of a class name
+        """
+        self.__get_class = get_class
+        self.__records = None
+        self.__objects = {}
+        self.__deleted = set()
+        self.__lock = threading.Lock()
+
+    @property
+    def records(self):
+        """returns the RecordFile mapped, or None"""
+        return self.__records
+
+    def map(self, records):
+        """switches to a record file holding the objects as they were at
+        some point, a deletion made since then is kept
+        Args:
+            records (RecordFile): the file
+        """
+        with self.__lock:
+            self.__deleted = {k for k in self.__deleted if k in records}
+            self.__records = records
+
+    def json_items(self):
+        """yields the (key, JSON bytes) pairs of all objects, copying the
+        records of the objects never read instead of serializing them
+        """
+        objects = list(self.__objects.items())
+        for key, obj in objects:
+            yield key, obj.to_json()
+        if self.__records is not None:
+            built = dict(objects)
+            for key, data in self.__records.items():
+                if key not in built and key not in self.__deleted:
+                    yield key, data
+
+    def __getitem__(self, key):
+        """returns the object stored under key"""
+        obj = self.__objects.get(key)
+        if obj is not None:
+            return obj
+        if self.__records is None or key in self.__deleted:
+            raise KeyError(key)
+        data = self.__records.get(key)
+        if data is None:
+            raise KeyError(key)
+        record = json.loads(data)
+        obj = self.__get_class(key.partition(".")[0]).from_record(record)
+        return self.__objects.setdefault(key, obj)
+
+    def __contains__(self, key):
+        """tells whether an object is stored under key, without building
+        it
+        """
+        if key in self.__objects:
+            return True
+        return self.__records is not None and \
+            key not in self.__deleted and key in self.__records
+
+    def __setitem__(self, key, obj):
+        """stores obj under key"""
+        with self.__lock:
+            self.__objects[key] = obj
+            self.__deleted.discard(key)
+
+    def __delitem__(self, key):
+        """removes the object stored under key"""
+        with self.__lock:
+            if key not in self:
+                raise KeyError(key)
+            self.__objects.pop(key, None)
+            if self.__records is not None and key in self.__records:
+                self.__deleted.add(key)
+
+    def __iter__(self):
+        """yields the keys of the stored objects"""
+        objects = list(self.__objects)
+        yield from objects
+        if self.__records is not None:
+            built = set(objects)
+            for key in self.__records.keys():
+                if key not in built and key not in self.__deleted:
+                    yield key
+
+    def __len__(self):
+        """returns the number of stored objects"""
+        if self.__records is None:
+            return len(self.__objects)
+        added = sum(1 for key in self.__objects if key not in self.__records)
+        return len(self.__records) - len(self.__deleted) + added
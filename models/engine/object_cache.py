@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+"""Module object_cache
+This Module contains a definition for ObjectCache Class
+"""
+
+import sys
+import time
+from collections import OrderedDict
+
+
+def object_size(obj):
+    """returns the approximate memory used by obj and its attributes"""
+    attrs = vars(obj)
+    return sys.getsizeof(obj) + sys.getsizeof(attrs) + sum(
+        sys.getsizeof(v) for v in attrs.values())
+
+
+class ObjectCache:
+    """Bounded LRU set of the objects loaded by the storage sessions.
+    Objects of pinned classes are never evicted for size, the others are
+    evicted least recently used first once max_objects or max_bytes is
+    exceeded, and every object is evicted ttl seconds after being loaded
+    Attributes:
+        max_objects (int): maximum number of objects, 0 disables the cache
+        max_bytes (int): maximum approximate size of the objects, 0 for
+            no limit
+        ttl (float): seconds an object stays cached after being loaded
+        pinned (frozenset): names of the classes kept resident
+        evictions (int): number of objects evicted so far
+    """
+
+    def __init__(self, max_objects=0, max_bytes=0, ttl=300, pinned=(),
+                 on_evict=None):
+        """Initializes ObjectCache Class
+        Args:
+            max_objects (int): maximum number of objects
+            max_bytes (int): maximum approximate size of the objects
+            ttl (float): seconds an object stays cached
+            pinned (iterable): names of the classes kept resident
+            on_evict (callable): called with every evicted object
+        """
+        self.max_objects = max_objects
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.pinned = frozenset(pinned)
+        self.evictions = 0
+        self.__on_evict = on_evict
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+
+    @property
+    def enabled(self):
+        """tells whether objects are tracked at all"""
+        return self.max_objects > 0
+
+    def touch(self, objs):
+        """marks objs as the most recently used, then evicts the least
+        recently used objects over the limits
+        """
+        now = time.monotonic()
+        for obj in objs:
+            key = "{}.{}".format(type(obj).__name__, obj.id)
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] is obj:
+                self.__entries.move_to_end(key)
+                continue
+            if entry is not None:
+                self.__drop(key)
+            size = object_size(obj)
+            self.__entries[key] = (obj, size, now)
+            self.__bytes += size
+        self.__shrink()
+
+    def lookup(self, name, id):
+        """returns the cached object of class name with the given id,
+        or None
+        """
+        key = "{}.{}".format(name, id)
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] + self.ttl < time.monotonic():
+            self.__evict(key)
+            return None
+        self.__entries.move_to_end(key)
+        return entry[0]
+
+    def discard(self, obj):
+        """stops tracking obj without calling on_evict"""
+        key = "{}.{}".format(type(obj).__name__, obj.id)
+        entry = self.__entries.get(key)
+        if entry is not None and entry[0] is obj:
+            self.__drop(key)
+
+    def sweep(self):
+        """evicts every object loaded more than ttl seconds ago"""
+        expired = time.monotonic() - self.ttl
+        for key, entry in list(self.__entries.items()):
+            if entry[2] < expired:
+                self.__evict(key)
+
+    def stats(self):
+        """returns the size and counters of the cache as a dictionary"""
+        pinned = sum(1 for key in self.__entries
+                     if key.split(".")[0] in self.pinned)
+        return {
+            "objects": len(self.__entries), "pinned": pinned,
+            "bytes": self.__bytes, "evictions": self.evictions,
+            "max_objects": self.max_objects, "max_bytes": self.max_bytes,
+        }
+
+    def __shrink(self):
+        """evicts unpinned objects, least recently used first, until the
+        cache is within its limits
+        """
+        for key in list(self.__entries):
+            if len(self.__entries) <= self.max_objects and (
+                    not self.max_bytes or self.__bytes <= self.max_bytes):
+                return
+            if key.split(".")[0] not in self.pinned:
+                self.__evict(key)
+
+    def __evict(self, key):
+        """drops an entry and hands its object to on_evict"""
+        obj = self.__drop(key)
+        self.evictions += 1
+        if self.__on_evict is not None:
+            self.__on_evict(obj)
+
+    def __drop(self, key):
+        """removes an entry and returns its object"""
+        obj, size, _ = self.__entries.pop(key)
+        self.__bytes -= size
+        return obj
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+"""Module pagination
+This Module contains the helpers shared by the keyset pagination of the
+storage engines: pages are ordered by (order_by, id) and a cursor records
+the (order_by, id) values of the last object of a page
+"""
+
+import base64
+import json
+from datetime import datetime
+
+ORDERS = ("created_at", "name")
+
+
+def check_order(order_by, cls=None):
+    """raises a ValueError for orders the storage cannot page by, or
+    that the table of the model class cls has no column for
+    """
+    if order_by not in ORDERS:
+        raise ValueError("cannot paginate by {}".format(order_by))
+    table = getattr(cls, "__table__", None)
+    if table is not None and order_by not in table.columns:
+        raise ValueError("cannot paginate {} by {}".format(
+            cls.__name__, order_by))
+
+
+def sort_value(value):
+    """returns a key sorting None before any value, as SQL does"""
+    return (value is not None, "" if value is None else value)
+
+
+def encode_cursor(obj, order_by):
+    """returns the opaque cursor pointing right after obj"""
+    value = getattr(obj, order_by, None)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    data = json.dumps([value, obj.id]).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii")
+
+
+def decode_cursor(cursor, order_by):
+    """returns the (value, id) pair stored in a cursor, or None
+    Raises:
+        ValueError: if the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        value, id = json.loads(base64.urlsafe_b64decode(cursor))
+        if order_by == "created_at" and value is not None:
+            value = datetime.fromisoformat(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
+    return value, id
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""Module query_cache
+This Module contains a definition for QueryCache Class
+"""
+
+import time
+from collections import OrderedDict
+
+
+class QueryCache:
+    """LRU cache of storage query results with a time to live
+    Attributes:
+        ttl (float): seconds an entry stays valid, 0 disables the cache
+        max_size (int): maximum number of entries kept
+        hits (int): number of lookups answered from the cache
+        misses (int): number of lookups that had to run the query
+    """
+
+    def __init__(self, ttl=0, max_size=128, on_evict=None):
+        """Initializes QueryCache Class
+        Args:
+            ttl (float): seconds an entry stays valid
+            max_size (int): maximum number of entries kept
+            on_evict (callable): called with the value of dropped entries
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__on_evict = on_evict
+        self.__entries = OrderedDict()
+
+    @property
+    def enabled(self):
+        """tells whether results are cached at all"""
+        return self.ttl > 0 and self.max_size > 0
+
+    def lookup(self, key):
+        """returns a (found, value) tuple for key"""
+        entry = self.__entries.get(key)
+        if entry is not None and entry[0] < time.monotonic():
+            self.__drop(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[2]
+
+    def put(self, key, class_names, value):
+        """stores value under key until the ttl expires or one of the
+        classes in class_names is invalidated
+        """
+        if key in self.__entries:
+            self.__drop(key)
+        self.__entries[key] = (
+            time.monotonic() + self.ttl, frozenset(class_names), value)
+        while len(self.__entries) > self.max_size:
+            self.__drop(next(iter(self.__entries)))
+
+    def invalidate(self, class_names):
+        """drops every entry that depends on one of class_names"""
+        class_names = set(class_names)
+        for key, entry in list(self.__entries.items()):
+            if entry[1] & class_names:
+                self.__drop(key)
+
+    def clear(self):
+        """drops every entry"""
+        for key in list(self.__entries):
+            self.__drop(key)
+
+    def values(self):
+        """yields the values of the entries, expired ones included"""
+        for entry in list(self.__entries.values()):
+            yield entry[2]
+
+    def stats(self):
+        """returns the cache counters as a dictionary"""
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "size": len(self.__entries),
+            "ttl": self.ttl, "max_size": self.max_size,
+        }
+
+    def __drop(self, key):
+        """removes an entry and hands its value to on_evict"""
+        entry = self.__entries.pop(key)
+        if self.__on_evict is not None:
+            self.__on_evict(entry[2])
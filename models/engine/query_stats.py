@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+"""Module query_stats
+This Module contains a definition for QueryStats Class
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+
+class QueryStats:
+    """Times the SQL statements run by a storage engine
+    Statements are grouped by the public storage method that issued them,
+    statements run outside of one (lazy loads) are grouped under None.
+    Attributes:
+        slow_ms (float): statements slower than this many milliseconds
+            are logged and kept in the slow query log
+    """
+
+    def __init__(self, owner, slow_ms=100, slow_log_size=100):
+        """Initializes QueryStats Class
+        Args:
+            owner (type): storage class whose public methods are reported
+            slow_ms (float): threshold of the slow query log
+            slow_log_size (int): number of slow statements kept
+        """
+        self.slow_ms = slow_ms
+        self.__methods = {
+            func.__code__: name for name, func in vars(owner).items()
+            if not name.startswith("_") and hasattr(func, "__code__")
+        }
+        self.__lock = threading.Lock()
+        self.__slow = deque(maxlen=slow_log_size)
+        self.__histograms = {}
+
+    def attach(self, engine):
+        """starts timing the statements run on engine"""
+        event.listen(engine, "before_cursor_execute", self.__before)
+        event.listen(engine, "after_cursor_execute", self.__after)
+
+    def record(self, statement, elapsed_ms, rows=None, method=None):
+        """adds one statement to the histogram of method"""
+        with self.__lock:
+            histogram = self.__histograms.get(method)
+            if histogram is None:
+                histogram = self.__histograms[method] = {
+                    "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0,
+                    "buckets": [0] * (len(BUCKETS_MS) + 1),
+                }
+            histogram["count"] += 1
+            histogram["total_ms"] += elapsed_ms
+            histogram["max_ms"] = max(histogram["max_ms"], elapsed_ms)
+            histogram["rows"] += rows or 0
+            bucket = 0
+            while bucket < len(BUCKETS_MS) and \
+                    elapsed_ms > BUCKETS_MS[bucket]:
+                bucket += 1
+            histogram["buckets"][bucket] += 1
+            if elapsed_ms >= self.slow_ms:
+                self.__slow.append({
+                    "method": method, "statement": statement,
+                    "ms": elapsed_ms, "rows": rows,
+                })
+        if elapsed_ms >= self.slow_ms:
+            logger.warning("slow query in %s (%.1f ms, %s rows): %s",
+                           method, elapsed_ms, rows, statement)
+
+    def report(self):
+        """returns the histograms by method and the slow query log"""
+        labels = ["<={}ms".format(ms) for ms in BUCKETS_MS]
+        labels.append(">{}ms".format(BUCKETS_MS[-1]))
+        with self.__lock:
+            methods = {}
+            for method, histogram in self.__histograms.items():
+                methods[method] = dict(
+                    histogram,
+                    avg_ms=histogram["total_ms"] / histogram["count"],
+                    buckets=dict(zip(labels, histogram["buckets"])),
+                )
+            return {"methods": methods, "slow": list(self.__slow)}
+
+    def reset(self):
+        """forgets every recorded statement"""
+        with self.__lock:
+            self.__histograms.clear()
+            self.__slow.clear()
+
+    def __caller(self):
+        """returns the name of the storage method running the statement"""
+        frame = sys._getframe(2)
+        while frame is not None:
+            method = self.__methods.get(frame.f_code)
+            if method is not None:
+                return method
+            frame = frame.f_back
+        return None
+
+    def __before(self, conn, cursor, statement, parameters, context,
+                 executemany):
+        """notes the start time of a statement"""
+        context._query_start = time.perf_counter()
+
+    def __after(self, conn, cursor, statement, parameters, context,
+                executemany):
+        """records the duration of a statement"""
+        elapsed_ms = (time.perf_counter() - context._query_start) * 1000
+        rows = cursor.rowcount if cursor.rowcount >= 0 else None
+        self.record(statement, elapsed_ms, rows, self.__caller())
@@ -0,0 +1,150 @@
+#!/usr/bin/python3
+"""Module read_model
+This Module contains a definition for HbnbReadModel Class, the data of
+the /hbnb page kept ready to render by the storage engines
+"""
+
+
+def by_name(entries):
+    """returns entries sorted by (name, id), unnamed entries first"""
+    return sorted(entries, key=lambda e: (e["name"] or "", e["id"]))
+
+
+class HbnbReadModel:
+    """Denormalized copy of what the /hbnb page shows: the states with
+    their cities and the amenities sorted by name, and for every place its
+    owner, amenity names and reviews with their authors. The storage
+    calls changed() for every object it writes or deletes, which drops the
+    parts depending on it; they are built again on the next read. The
+    reviews are kept by place, so building a place again reads none
+    """
+
+    def __init__(self, storage):
+        """Initializes HbnbReadModel Class
+        Args:
+            storage: FileStorage or DBStorage the data is read from
+        """
+        self.__storage = storage
+        self.__states = None
+        self.__amenities = None
+        self.__places = {}
+        self.__dependents = {}
+        self.__reviews = None
+        self.__review_places = {}
+
+    def changed(self, obj, deleted=False):
+        """drops the parts of the model showing obj, written or deleted"""
+        name = obj.__class__.__name__
+        if name in ("State", "City"):
+            self.__states = None
+        elif name == "Amenity":
+            self.__amenities = None
+        elif name == "Place":
+            self.__drop(obj.id)
+        elif name == "Review" and self.__reviews is not None:
+            self.__drop(self.__review_places.get(obj.id))
+            self.__forget_review(obj.id)
+            if not deleted:
+                self.__add_review(obj)
+                self.__drop(obj.place_id)
+        for place_id in self.__dependents.pop(obj.id, ()):
+            self.__drop(place_id)
+
+    def states(self):
+        """returns the states sorted by name, each with its cities sorted
+        by name, as {"id", "name", "cities": [{"id", "name"}]} dictionaries
+        """
+        if self.__states is None:
+            cities = {}
+            for city in self.__storage.iter("City"):
+                cities.setdefault(city.state_id, []).append(
+                    {"id": city.id, "name": city.name})
+            self.__states = by_name(
+                {"id": state.id, "name": state.name,
+                 "cities": by_name(cities.get(state.id, []))}
+                for state in self.__storage.iter("State"))
+        return self.__states
+
+    def amenities(self):
+        """returns the amenities sorted by name as {"id", "name"}
+        dictionaries
+        """
+        if self.__amenities is None:
+            self.__amenities = by_name(
+                {"id": amenity.id, "name": amenity.name}
+                for amenity in self.__storage.iter("Amenity"))
+        return self.__amenities
+
+    def places(self, places):
+        """returns the entries of places sorted by name, see __entry"""
+        if self.__reviews is None:
+            self.__reviews = {}
+            for review in self.__storage.iter("Review"):
+                self.__add_review(review)
+        entries = []
+        for place in places:
+            entry = self.__places.get(place.id)
+            if entry is None:
+                entry = self.__places[place.id] = self.__entry(place)
+            entries.append(entry)
+        return by_name(entries)
+
+    def __entry(self, place):
+        """returns the dictionary of a place with the names of its owner
+        and amenities and its reviews, sorted by date, recording the
+        objects it depends on
+        """
+        amenities = [self.__storage.get("Amenity", getattr(a, "id", a))
+                     for a in place.amenities]
+        reviews = sorted(self.__reviews.get(place.id, {}).values())
+        entry = {
+            "id": place.id,
+            "owner": self.__full_name(place.user_id),
+            "amenities": sorted(a.name for a in amenities if a is not None),
+            "reviews": [{"author": self.__first_name(user_id),
+                         "date": created_at.date().isoformat(),
+                         "text": text}
+                        for created_at, _, user_id, text in reviews],
+        }
+        for attr in ("name", "price_by_night", "max_guest", "number_rooms",
+                     "number_bathrooms", "description"):
+            entry[attr] = getattr(place, attr, None)
+        depends = [place.user_id] + [a.id for a in amenities if a] + \
+            [review[2] for review in reviews]
+        for id in depends:
+            self.__dependents.setdefault(id, set()).add(place.id)
+        return entry
+
+    def __full_name(self, user_id):
+        """returns the first and last names of a user"""
+        user = self.__storage.get("User", user_id)
+        if user is None:
+            return ""
+        names = (user.first_name, user.last_name)
+        return " ".join(name for name in names if name)
+
+    def __first_name(self, user_id):
+        """returns the first name of a user"""
+        user = self.__storage.get("User", user_id)
+        return (user.first_name or "") if user is not None else ""
+
+    def __add_review(self, review):
+        """records the (created_at, id, user_id, text) of a review under
+        its place
+        """
+        self.__review_places[review.id] = review.place_id
+        self.__reviews.setdefault(review.place_id, {})[review.id] = (
+            review.created_at, review.id, review.user_id, review.text)
+
+    def __forget_review(self, id):
+        """removes a review from its place"""
+        place_id = self.__review_places.pop(id, None)
+        reviews = self.__reviews.get(place_id)
+        if reviews is not None:
+            reviews.pop(id, None)
+            if not reviews:
+                del self.__reviews[place_id]
+
+    def __drop(self, place_id):
+        """drops the entry of a place, it is built again when read"""
+        self.__places.pop(place_id, None)
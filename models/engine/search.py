@@ -0,0 +1,172 @@
+#!/usr/bin/python3
+"""Module search
+This Module contains a definition for PlaceSearch Class, the faceted
+place search both storage engines keep up to date
+"""
+
+FACETS = ("state", "city", "amenity")
+RANGES = ("price_by_night", "max_guest", "number_rooms")
+
+
+def rows_of(bits):
+    """returns the positions of the bits set in bits, in order"""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    return [i * 8 + j for i, byte in enumerate(data) if byte
+            for j in range(8) if byte >> j & 1]
+
+
+class PlaceSearch:
+    """Postings of the places by facet value, kept as int bitsets of
+    rows: one row per place, one bitset per city, amenity and value of
+    price_by_night, max_guest and number_rooms. States are the union of
+    their cities. A search ANDs the bitsets of the filters and counts
+    every facet value in the same pass
+    """
+
+    def __init__(self):
+        """Initializes PlaceSearch Class"""
+        self.__ids = []
+        self.__rows = {}
+        self.__free = []
+        self.__live = 0
+        self.__values = {}
+        self.__postings = {facet: {} for facet in FACETS[1:] + RANGES}
+        self.__states = {}
+
+    def __len__(self):
+        """returns the number of indexed places"""
+        return len(self.__rows)
+
+    def add(self, place, amenity_ids=None):
+        """indexes place, replacing the values it was indexed under
+        Args:
+            place: object with the id, city_id and RANGES attributes
+            amenity_ids (iterable): ids of its amenities, by default
+                place.amenity_ids
+        """
+        if amenity_ids is None:
+            amenity_ids = getattr(place, "amenity_ids", None) or ()
+        values = {"city": [place.city_id],
+                  "amenity": list(dict.fromkeys(amenity_ids))}
+        for facet in RANGES:
+            values[facet] = [getattr(place, facet, None)]
+        row = self.__rows.get(place.id)
+        if row is None:
+            row = self.__free.pop() if self.__free else len(self.__ids)
+            if row == len(self.__ids):
+                self.__ids.append(None)
+            self.__ids[row] = place.id
+            self.__rows[place.id] = row
+            self.__live |= 1 << row
+        else:
+            self.__unpost(row)
+        for facet, facet_values in values.items():
+            postings = self.__postings[facet]
+            for value in facet_values:
+                if value is not None:
+                    postings[value] = postings.get(value, 0) | 1 << row
+        self.__values[row] = values
+
+    def remove(self, id):
+        """removes the place with the given id from the index"""
+        row = self.__rows.pop(id, None)
+        if row is None:
+            return
+        self.__unpost(row)
+        del self.__values[row]
+        self.__ids[row] = None
+        self.__live &= ~(1 << row)
+        self.__free.append(row)
+
+    def set_city(self, city_id, state_id):
+        """records the state of a city, None to forget the city"""
+        if state_id is None:
+            self.__states.pop(city_id, None)
+        else:
+            self.__states[city_id] = state_id
+
+    def search(self, filters=None):
+        """returns the (ids, facets) of the places matching filters.
+        facets maps every facet to the number of places per value that
+        also match the filters of the other facets, amenities counting
+        the places that match every filter
+        Args:
+            filters (dict): ids for state, city and amenity (places
+                having all the amenities), (min, max) for the RANGES,
+                None for no bound. Empty filters are ignored
+        """
+        masks = {}
+        for facet, wanted in (filters or {}).items():
+            if facet not in FACETS + RANGES:
+                raise ValueError("unknown facet: {}".format(facet))
+            if not wanted or facet in RANGES and \
+                    tuple(wanted) == (None, None):
+                continue
+            masks[facet] = self.__mask(facet, wanted)
+        matched = self.__and(masks)
+        facets = {}
+        for facet in FACETS + RANGES:
+            base = matched if facet == "amenity" else self.__and(
+                {f: mask for f, mask in masks.items() if f != facet})
+            counts = {}
+            for value, bits in self.__facet_postings(facet).items():
+                count = (base & bits).bit_count()
+                if count:
+                    counts[value] = count
+            facets[facet] = counts
+        return [self.__ids[row] for row in rows_of(matched)], facets
+
+    def __mask(self, facet, wanted):
+        """returns the bitset of the places matching one filter"""
+        if facet in RANGES:
+            low, high = wanted
+            return self.__or(
+                bits for value, bits in self.__postings[facet].items()
+                if (low is None or value >= low) and
+                (high is None or value <= high))
+        postings = self.__facet_postings(facet)
+        if facet == "amenity":
+            mask = self.__live
+            for value in wanted:
+                mask &= postings.get(value, 0)
+            return mask
+        return self.__or(postings.get(value, 0) for value in wanted)
+
+    def __facet_postings(self, facet):
+        """returns the bitsets of a facet by value"""
+        if facet != "state":
+            return self.__postings[facet]
+        states = {}
+        for city_id, bits in self.__postings["city"].items():
+            state_id = self.__states.get(city_id)
+            if state_id is not None:
+                states[state_id] = states.get(state_id, 0) | bits
+        return states
+
+    def __and(self, masks):
+        """returns the live places matching every mask"""
+        matched = self.__live
+        for mask in masks.values():
+            matched &= mask
+        return matched
+
+    @staticmethod
+    def __or(masks):
+        """returns the union of masks"""
+        union = 0
+        for mask in masks:
+            union |= mask
+        return union
+
+    def __unpost(self, row):
+        """removes a row from the bitsets of its values"""
+        for facet, facet_values in self.__values[row].items():
+            postings = self.__postings[facet]
+            for value in facet_values:
+                if value is None:
+                    continue
+                bits = postings[value] & ~(1 << row)
+                if bits:
+                    postings[value] = bits
+                else:
+                    del postings[value]
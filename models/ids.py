@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+"""Module ids
+This Module contains the generators of the object ids.
+
+Three schemes are available, selected with HBNB_ID_SCHEME:
+    uuid4 (default): random 36 character UUIDs
+    uuid7: 36 character UUIDs starting with a millisecond timestamp
+    ulid: 26 character Crockford base32 ids starting with the same timestamp
+uuid7 and ulid ids sort in creation order, including ids created during
+the same millisecond by one process, so they are appended at the end of
+primary key indexes instead of being scattered across them.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+SCHEMES = ("uuid4", "uuid7", "ulid")
+DEFAULT_SCHEME = os.getenv("HBNB_ID_SCHEME", "uuid4")
+
+CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_PAIRS = [a + b for a in CROCKFORD for b in CROCKFORD]
+
+_lock = threading.Lock()
+_last = {}
+
+
+def _reserve(count, bits):
+    """returns a (milliseconds, random) pair starting count consecutive
+    ids. Within the same millisecond the random part keeps increasing
+    from the last id, so the ids stay ordered
+    """
+    now = time.time_ns() // 1000000
+    with _lock:
+        last = _last.setdefault(bits, [0, 0])
+        if now > last[0]:
+            # the top bit stays clear to leave room for the increments
+            rand = int.from_bytes(os.urandom((bits + 7) // 8), "big")
+            last[0], last[1] = now, rand & ((1 << (bits - 1)) - 1)
+        else:
+            last[1] += 1
+        start = tuple(last)
+        last[1] += count - 1
+    return start
+
+
+def _uuid7(ms, rand):
+    """formats a UUIDv7 from its timestamp and 74 random bits"""
+    value = (ms << 80) | (0x7 << 76) | ((rand >> 62) << 64) | \
+        (0x2 << 62) | (rand & ((1 << 62) - 1))
+    h = "{:032x}".format(value)
+    return "{}-{}-{}-{}-{}".format(h[:8], h[8:12], h[12:16], h[16:20], h[20:])
+
+
+def _ulid(ms, rand):
+    """formats a ULID from its timestamp and 80 random bits"""
+    value = (ms << 80) | rand
+    return "".join([_PAIRS[(value >> shift) & 1023]
+                    for shift in range(120, -10, -10)])
+
+
+def new_id(scheme=None):
+    """returns a new id of the given scheme, HBNB_ID_SCHEME by default"""
+    return batch_ids(1, scheme)[0]
+
+
+def batch_ids(count, scheme=None):
+    """returns a list of count new ids of the given scheme, in creation
+    order, reserving them all at once
+    """
+    scheme = scheme or DEFAULT_SCHEME
+    if scheme == "uuid4":
+        return [str(uuid.uuid4()) for _ in range(count)]
+    if scheme == "uuid7":
+        ms, rand = _reserve(count, 74)
+        return [_uuid7(ms, rand + i) for i in range(count)]
+    if scheme == "ulid":
+        ms, rand = _reserve(count, 80)
+        return [_ulid(ms, rand + i) for i in range(count)]
+    raise ValueError("unknown id scheme: {}".format(scheme))
@@ -5,7 +5,8 @@ This Module contains a definition for Place Class
 
 from os import getenv
 
-from sqlalchemy import Column, Float, ForeignKey, Integer, String, Table
+from sqlalchemy import (Column, Float, ForeignKey, Index, Integer, String,
+                        Table)
 from sqlalchemy.orm import backref, relationship
 
 import models
@@ -28,9 +29,75 @@ place_amenity = Table(
         primary_key=True,
         nullable=False,
     ),
+    Index('ix_place_amenity_amenity_id', 'amenity_id'),
 )
 
 
+class AmenityIds(list):
+    """A list of Amenity ids keeping a set of them, so that telling whether
+    an id is already in it does not scan the list. It is serialized as a
+    list
+    """
+
+    def __init__(self, ids=()):
+        """Initializes AmenityIds Class
+        Args:
+            ids (iterable): Amenity ids
+        """
+        super().__init__(ids)
+        self.__ids = set(self)
+
+    def __contains__(self, id):
+        """tells whether id is in the list"""
+        return id in self.__ids
+
+    def append(self, id):
+        """appends id to the list"""
+        super().append(id)
+        self.__ids.add(id)
+
+    def extend(self, ids):
+        """appends the ids of an iterable to the list"""
+        super().extend(ids)
+        self.__ids = set(self)
+
+    def __iadd__(self, ids):
+        """appends the ids of an iterable to the list"""
+        self.extend(ids)
+        return self
+
+    def insert(self, index, id):
+        """inserts id before index"""
+        super().insert(index, id)
+        self.__ids.add(id)
+
+    def remove(self, id):
+        """removes the first occurrence of id"""
+        super().remove(id)
+        self.__ids = set(self)
+
+    def pop(self, index=-1):
+        """removes and returns the id at index"""
+        id = super().pop(index)
+        self.__ids = set(self)
+        return id
+
+    def clear(self):
+        """removes every id"""
+        super().clear()
+        self.__ids = set()
+
+    def __setitem__(self, index, ids):
+        """replaces the id, or the slice of ids, at index"""
+        super().__setitem__(index, ids)
+        self.__ids = set(self)
+
+    def __delitem__(self, index):
+        """removes the id, or the slice of ids, at index"""
+        super().__delitem__(index)
+        self.__ids = set(self)
+
+
 class Place(BaseModel, Base):
     """A class that represents a place
     Attributes:
@@ -44,12 +111,25 @@ class Place(BaseModel, Base):
         price_by_night (int): The price by night of the place.
         latitude (float): The latitude of the place.
         longitude (float): The longitude of the place.
-        amenity_ids (list): A list of Amenity ids.
+        amenity_ids (list): A list of Amenity ids, set per instance and
+            made an AmenityIds by the amenities setter. The class default
+            is an empty tuple so it can not be shared and appended to by
+            every place
     """
 
     __tablename__ = "places"
+    __table_args__ = (
+        Index("ix_places_city_id_price", "city_id", "price_by_night", "id"),
+        Index("ix_places_price_id", "price_by_night", "id"),
+        Index("ix_places_created_at_id", "created_at", "id"),
+        Index("ix_places_name_id", "name", "id"),
+        Index("ix_places_latitude_longitude", "latitude", "longitude"),
+        Index("ft_places_description", "description",
+              mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
     city_id = Column(String(60), ForeignKey("cities.id"), nullable=False)
-    user_id = Column(String(60), ForeignKey("users.id"), nullable=False)
+    user_id = Column(String(60), ForeignKey("users.id"), nullable=False,
+                     index=True)
 
     name = Column(String(128), nullable=False)
     description = Column(String(1024), nullable=True)
@@ -59,14 +139,14 @@ class Place(BaseModel, Base):
     price_by_night = Column(Integer, default=0, nullable=False)
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
-    amenity_ids = []
+    amenity_ids = ()
 
     if getenv("HBNB_TYPE_STORAGE") != "db":
         @property
         def reviews(self):
             """Get list of reviews that match this place id"""
             return [
-                v for _, v in models.storage.all(Review).items()
+                v for _, v in models.storage.snapshot(Review).items()
                 if v.place_id == self.id
             ]
 
@@ -77,10 +157,20 @@ class Place(BaseModel, Base):
 
         @amenities.setter
         def amenities(self, value=None):
-            """appends aminity id"""
-            type_name = type(value).__name__
-            if type_name == 'Amenity' and value.id not in self.amenity_ids:
-                self.amenity_ids.append(value.id)
+            """appends aminity id to amenity_ids, turning it into an
+            AmenityIds the first time, and sets it again so that cached
+            serialized forms see the change
+            """
+            from models.amenity import Amenity
+
+            if not isinstance(value, Amenity):
+                return
+            ids = self.amenity_ids
+            if not isinstance(ids, AmenityIds):
+                ids = self.amenity_ids = AmenityIds(ids)
+            if value.id not in ids:
+                ids.append(value.id)
+                self.amenity_ids = ids
     else:
         reviews = relationship(
             "Review",
@@ -3,7 +3,7 @@
 This Module contains a definition for Amenity Class
 """
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 
 from models.base_model import Base, BaseModel
 
@@ -16,6 +16,13 @@ class Review(BaseModel, Base):
         text (str): The text of the review.
     """
     __tablename__ = "reviews"
-    place_id = Column(String(60), ForeignKey("places.id"), nullable=False)
-    user_id = Column(String(60), ForeignKey("users.id"), nullable=False)
+    __table_args__ = (
+        Index("ix_reviews_created_at_id", "created_at", "id"),
+        Index("ft_reviews_text", "text",
+              mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
+    place_id = Column(String(60), ForeignKey("places.id"), nullable=False,
+                      index=True)
+    user_id = Column(String(60), ForeignKey("users.id"), nullable=False,
+                     index=True)
     text = Column(String(1024), nullable=False)
@@ -5,7 +5,7 @@ This Module contains a definition for State Class
 
 from os import getenv
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlalchemy.orm import backref, relationship
 
 import models
@@ -18,7 +18,11 @@ class State(BaseModel, Base):
     Attribute:
         name : the name of the state
     """
-    __table_args__ = ({'mysql_default_charset': 'latin1'})
+    __table_args__ = (
+        Index("ix_states_created_at_id", "created_at", "id"),
+        Index("ix_states_name_id", "name", "id"),
+        {'mysql_default_charset': 'latin1'},
+    )
     __tablename__ = "states"
     name = Column(String(128), nullable=False)
 
@@ -28,7 +32,7 @@ class State(BaseModel, Base):
         def cities(self):
             """Get list of cities that match this state id"""
             return [
-                v for _, v in models.storage.all(City).items()
+                v for _, v in models.storage.snapshot(City).items()
                 if v.state_id == self.id
             ]
     else:
@@ -3,7 +3,7 @@
 This Module contains a definition for User Class
 """
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlalchemy.orm import relationship
 
 from models.base_model import Base, BaseModel
@@ -18,6 +18,9 @@ class User(BaseModel, Base):
         last_name (str): The last name of the user.
     """
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     email = Column(String(128), nullable=False)
     password = Column(String(128), nullable=False)
     first_name = Column(String(128), nullable=True)
@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+"""restore_backup module
+Rebuilds a store from the checkpoints storage.checkpoint() wrote to a
+backup directory: the last full checkpoint up to the one asked for, then
+the increments following it.
+
+Usage: ./restore_backup.py <backup directory> <target> [checkpoint]
+The target is a JSON file FileStorage reads for a FileStorage backup and
+a SQLite database for a DBStorage one. The checkpoint number defaults to
+the last one.
+"""
+import sys
+
+from models.engine import backup
+
+
+def main(directory, target, upto=None):
+    """restores the backup of directory to target and prints the
+    checkpoints replayed
+    """
+    paths = backup.restore(directory, target, upto)
+    for path in paths:
+        print("replayed {}".format(path))
+    print("restored {} checkpoint(s) to {}".format(len(paths), target))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print(__doc__.split("\n\n")[1].splitlines()[0], file=sys.stderr)
+        sys.exit(2)
+    main(sys.argv[1], sys.argv[2],
+         int(sys.argv[3]) if len(sys.argv) > 3 else None)
@@ -148,6 +148,31 @@ class TestConsoleBasic(unittest.TestCase):
             self.assertIn("BaseModel", output.getvalue())
             self.assertGreaterEqual(output.getvalue().count("BaseModel"), 2)
 
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     'FileStorage Not In Use')
+    def test_stats_without_database(self):
+        """tests the stats command on file storage"""
+        with patch('sys.stdout', new=StringIO()) as output:
+            self.cmd.onecmd('stats')
+            self.assertEqual("** no query stats for this storage **\n",
+                             output.getvalue())
+
+    @unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                     'FileStorage Not In Use')
+    def test_rebuild_aggregates(self):
+        """tests rebuild_aggregates reports the aggregates it fixed"""
+        with patch('sys.stdout', new=StringIO()) as output:
+            self.cmd.onecmd('create Place city_id="c1" price_by_night=10')
+            self.cmd.onecmd('rebuild_aggregates')
+            self.assertIn("aggregates are consistent\n", output.getvalue())
+            places = console.storage.all("Place").values()
+            self.assertEqual(
+                console.storage.aggregate("City", "c1")["places"],
+                len([p for p in places if p.city_id == "c1"]))
+            self.cmd.onecmd('rebuild_aggregates')
+            self.assertTrue(output.getvalue().endswith(
+                "aggregates are consistent\n"))
+
     def test_all_displays_class_instance_objects(self):
         """tests the all shows instance objects"""
         with patch('sys.stdout', new=StringIO()) as output:
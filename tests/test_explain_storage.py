@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""Module test_explain_storage
+This Module contains tests for the explain_storage script
+"""
+
+import inspect
+import unittest
+
+import pycodestyle
+from sqlalchemy import create_engine
+
+import explain_storage
+from models.base_model import Base
+
+
+class TestExplainStorageDocsAndStyle(unittest.TestCase):
+    """Tests explain_storage for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            ["explain_storage.py", "tests/test_explain_storage.py"])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(explain_storage.__doc__) >= 1)
+
+    def test_functions_docstring(self):
+        """Tests whether the functions are documented"""
+        funcs = inspect.getmembers(explain_storage, inspect.isfunction)
+        for func in funcs:
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestExplainStorage(unittest.TestCase):
+    """Test cases for the explain_storage script"""
+
+    def test_storage_queries_use_indexes_on_sqlite(self):
+        """none of the storage queries scans a whole table"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        report = explain_storage.explain_queries(engine)
+        self.assertEqual(len(report), len(explain_storage.queries))
+        for name, _, rows, full_scan in report:
+            self.assertTrue(rows)
+            self.assertFalse(full_scan, name)
+
+    def test_is_full_scan(self):
+        """full scans are told apart from index scans and searches"""
+        self.assertTrue(explain_storage.is_full_scan(
+            "sqlite", {"detail": "SCAN places"}))
+        self.assertFalse(explain_storage.is_full_scan(
+            "sqlite", {"detail": "SCAN places USING INDEX ix_places_name"}))
+        self.assertTrue(explain_storage.is_full_scan(
+            "mysql", {"type": "ALL"}))
+        self.assertFalse(explain_storage.is_full_scan(
+            "mysql", {"type": "ref"}))
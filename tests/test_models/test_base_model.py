@@ -171,6 +171,83 @@ class TestBaseModel(unittest.TestCase):
         for k, v in self.test_obj.__dict__.items():
             self.assertEqual(v, temp_obj_2.__dict__[k])
 
+    def test_changed_fields(self):
+        """changed_fields returns the attributes set since the last call
+        while an event stream gathers changes, nothing otherwise
+        """
+        from models.engine.events import EventStream
+
+        stream = EventStream()
+        callback = stream.subscribe(lambda batch: None)
+        obj = BaseModel(name="a")
+        self.assertEqual(base_model.changed_fields(obj),
+                         ("created_at", "id", "name", "updated_at"))
+        obj.name = "b"
+        obj.size = 3
+        self.assertEqual(base_model.changed_fields(obj), ("name", "size"))
+        self.assertEqual(base_model.changed_fields(obj), ())
+        self.assertIsNone(base_model.changed_fields(object()))
+
+        stream.unsubscribe(callback)
+        obj.name = "c"
+        self.assertEqual(base_model.changed_fields(obj), ())
+        self.assertNotIn(BaseModel(), base_model._changed)
+
+    def test_from_record_matches_init_with_kwargs(self):
+        """from_record builds the same object as the kwargs constructor"""
+        record = self.test_obj.to_dict()
+        temp_obj_2 = BaseModel.from_record(record)
+
+        self.assertEqual(temp_obj_2.__dict__, self.test_obj.__dict__)
+        self.assertEqual(temp_obj_2.to_dict(), record)
+        self.assertIn("__class__", record)
+
+    def test_from_record_works_for_mapped_classes(self):
+        """from_record gives mapped classes their SQLAlchemy state"""
+        from models.state import State
+
+        state = State(name="California")
+        temp_state = State.from_record(state.to_dict())
+
+        self.assertEqual(temp_state.to_dict(), state.to_dict())
+        self.assertIsInstance(temp_state.created_at, datetime)
+        temp_state.name = "Nevada"
+        self.assertEqual(temp_state.name, "Nevada")
+
+    def test_to_dict_is_cached_until_an_attribute_changes(self):
+        """to_dict reuses its result until an attribute is set"""
+        first = self.test_obj.to_dict()
+        first["name"] = "changed"
+        self.assertNotIn("name", self.test_obj.to_dict())
+
+        self.test_obj.name = "Betty"
+        self.assertEqual(self.test_obj.to_dict()["name"], "Betty")
+        self.test_obj.__dict__["number"] = 89
+        self.assertEqual(self.test_obj.to_dict()["number"], 89)
+
+    def test_to_dict_sees_changes_inside_lists(self):
+        """objects holding lists are serialized on every call"""
+        self.test_obj.tags = ["a"]
+        self.test_obj.to_dict()
+        self.test_obj.tags.append("b")
+        self.assertEqual(self.test_obj.to_dict()["tags"], ["a", "b"])
+
+    def test_to_json_encodes_to_dict(self):
+        """to_json returns to_dict as JSON bytes, following changes"""
+        self.assertEqual(json.loads(self.test_obj.to_json()),
+                         self.test_obj.to_dict())
+        self.test_obj.name = "Betty"
+        self.assertEqual(json.loads(self.test_obj.to_json())["name"],
+                         "Betty")
+
+    def test_parse_datetime_is_cached(self):
+        """parse_datetime returns the same object for the same string"""
+        value = datetime.utcnow().isoformat()
+
+        parsed = base_model.parse_datetime(value)
+        self.assertEqual(parsed, datetime.fromisoformat(value))
+        self.assertIs(base_model.parse_datetime(value), parsed)
+
 
 if __name__ == "__main__":
     unittest.main()
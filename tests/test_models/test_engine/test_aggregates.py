@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+""" Module for testing the maintained aggregates"""
+import inspect
+import unittest
+
+import pycodestyle
+
+from models.city import City
+from models.engine import aggregates
+from models.place import Place
+from models.review import Review
+
+Aggregates = aggregates.Aggregates
+
+
+class TestAggregatesDocsAndStyle(unittest.TestCase):
+    """Tests aggregates module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/aggregates.py",
+                "tests/test_models/test_engine/test_aggregates.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module and its functions are documented"""
+        self.assertTrue(len(aggregates.__doc__) >= 1)
+        self.assertTrue(len(aggregates.differences.__doc__) >= 1)
+
+    def test_class_docstring(self):
+        """Tests whether the class and its methods are documented"""
+        self.assertTrue(len(Aggregates.__doc__) >= 1)
+        for func in inspect.getmembers(Aggregates, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestAggregates(unittest.TestCase):
+    """Test cases for Aggregates Class"""
+
+    def setUp(self):
+        """counts three places in two cities of one state and their
+        reviews
+        """
+        self.totals = Aggregates()
+        self.cities = [City(state_id="LA"), City(state_id="LA")]
+        self.places = [Place(city_id=self.cities[i].id, price_by_night=p)
+                       for i, p in ((0, 100), (0, 200), (1, 60))]
+        self.reviews = [Review(place_id=self.places[i].id)
+                        for i in (0, 0, 2)]
+        for obj in self.cities + self.places + self.reviews:
+            self.totals.add(obj)
+
+    def test_city_state_and_place(self):
+        """cities and states count places, reviews and the average price
+        """
+        self.assertEqual(self.totals.get("City", self.cities[0].id),
+                         {"places": 2, "reviews": 2, "average_price": 150})
+        self.assertEqual(self.totals.get("State", "LA"),
+                         {"places": 3, "reviews": 3, "average_price": 120})
+        self.assertEqual(self.totals.get("Place", self.places[0].id),
+                         {"reviews": 2})
+        self.assertEqual(self.totals.get("State", "NY"),
+                         {"places": 0, "reviews": 0, "average_price": None})
+        with self.assertRaises(ValueError):
+            self.totals.get("Review", self.reviews[0].id)
+
+    def test_updates_move_the_totals(self):
+        """changed places, reviews and cities move their counts"""
+        self.places[0].city_id = self.cities[1].id
+        self.places[1].price_by_night = 100
+        self.reviews[2].place_id = self.places[1].id
+        self.cities[1].state_id = "NY"
+        for obj in self.places + self.reviews + self.cities:
+            self.totals.add(obj)
+        self.assertEqual(self.totals.get("City", self.cities[0].id),
+                         {"places": 1, "reviews": 1, "average_price": 100})
+        self.assertEqual(self.totals.get("State", "NY"),
+                         {"places": 2, "reviews": 2, "average_price": 80})
+        self.assertEqual(self.totals.get("State", "LA")["places"], 1)
+
+    def test_remove(self):
+        """removed objects are no longer counted"""
+        self.totals.remove(self.reviews[0])
+        self.totals.remove(self.places[2])
+        self.assertEqual(self.totals.get("State", "LA"),
+                         {"places": 2, "reviews": 1, "average_price": 150})
+        self.totals.remove(self.cities[0])
+        self.assertEqual(self.totals.get("State", "LA")["places"], 0)
+
+    def test_reviews_before_their_place(self):
+        """reviews of a place counted later are added to its city"""
+        place = Place(city_id=self.cities[1].id, price_by_night=10)
+        self.totals.add(Review(place_id=place.id))
+        self.assertEqual(self.totals.get("City", self.cities[1].id)
+                         ["reviews"], 1)
+        self.totals.add(place)
+        self.assertEqual(self.totals.get("City", self.cities[1].id)
+                         ["reviews"], 2)
+
+    def test_differences(self):
+        """differences() lists the aggregates that do not match"""
+        rebuilt = Aggregates()
+        for obj in self.cities + self.places + self.reviews:
+            rebuilt.add(obj)
+        self.assertEqual(aggregates.differences(self.totals, rebuilt), [])
+        rebuilt.remove(self.reviews[2])
+        self.assertEqual(aggregates.differences(self.totals, rebuilt), [
+            "City.{}".format(self.cities[1].id), "Place.{}".format(
+                self.places[2].id), "State.LA"])
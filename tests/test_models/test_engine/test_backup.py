@@ -0,0 +1,231 @@
+#!/usr/bin/python3
+""" Module for testing checkpoints and restores of the storage engines"""
+import inspect
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import pycodestyle
+
+from models.amenity import Amenity
+from models.engine import backup
+from models.engine.db_storage import DBStorage
+from models.engine.file_storage import FileStorage
+from models.place import Place, place_amenity
+from models.state import State
+
+
+class TestBackupDocsAndStyle(unittest.TestCase):
+    """Tests backup module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/backup.py",
+                "tests/test_models/test_engine/test_backup.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module and its functions are documented"""
+        self.assertTrue(len(backup.__doc__) >= 1)
+        for func in inspect.getmembers(backup, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestCheckpoints(unittest.TestCase):
+    """Test cases for the checkpoint files"""
+
+    def setUp(self):
+        """uses a temporary backup directory"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = os.path.join(tmp.name, "backups")
+
+    def take(self, kind, *lines):
+        """writes a checkpoint of lines and returns its path"""
+        return backup.write(backup.next_path(self.dir, kind), "file", lines)
+
+    def test_numbering_and_chain(self):
+        """the chain starts at the last full checkpoint up to upto"""
+        self.assertEqual(backup.checkpoints(self.dir), [])
+        with self.assertRaises(ValueError):
+            backup.chain(self.dir)
+        paths = [self.take(backup.FULL), self.take(backup.INCREMENT),
+                 self.take(backup.FULL), self.take(backup.INCREMENT)]
+        self.assertEqual(os.path.basename(paths[1]), "000002-incr.jsonl.gz")
+        self.assertEqual([c[0] for c in backup.checkpoints(self.dir)],
+                         [1, 2, 3, 4])
+        self.assertEqual(backup.chain(self.dir), paths[2:])
+        self.assertEqual(backup.chain(self.dir, 2), paths[:2])
+
+    def test_restore_records(self):
+        """increments replace and delete the records of the base"""
+        self.take(backup.FULL, backup.entry("State.1", b'{"name": "A"}'),
+                  backup.entry("State.2", b'{"name": "B"}'))
+        self.take(backup.INCREMENT, backup.entry("State.1", None),
+                  backup.entry("State.2", b'{"name": "C"}', table="x"))
+        header, lines = backup.read(backup.checkpoints(self.dir)[1][2])
+        self.assertEqual((header["kind"], header["engine"]),
+                         (backup.INCREMENT, "file"))
+        self.assertEqual(next(lines), {"key": "State.1", "deleted": True})
+        self.assertEqual(backup.restore_records(backup.chain(self.dir)),
+                         {"State.2": {"name": "C"}})
+        self.assertEqual(backup.restore_records(backup.chain(self.dir, 1)),
+                         {"State.1": {"name": "A"}, "State.2": {"name": "B"}})
+
+
+class TestFileStorageCheckpoint(unittest.TestCase):
+    """Test cases for FileStorage.checkpoint"""
+
+    def setUp(self):
+        """creates a storage writing to a temporary directory"""
+        objects = patch.object(FileStorage, "_FileStorage__objects", {})
+        objects.start()
+        self.addCleanup(objects.stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        self.dir = os.path.join(tmp.name, "backups")
+        self.storage = FileStorage()
+        self.storage._FileStorage__file_path = os.path.join(
+            tmp.name, "file.json")
+
+    def test_increments_hold_the_changes(self):
+        """a full checkpoint, then increments, restore every state"""
+        states = [State(name=name) for name in ("Lagos", "Kano", "Oyo")]
+        for state in states:
+            self.storage.new(state)
+        full = self.storage.checkpoint(self.dir)
+        self.assertTrue(full.endswith("000001-full.jsonl.gz"))
+
+        states[0].name = "Eko"
+        self.storage.new(states[0])
+        self.storage.delete(states[1])
+        incr = self.storage.checkpoint(self.dir)
+        self.assertTrue(incr.endswith("000002-incr.jsonl.gz"))
+        self.assertEqual(len(list(backup.read(incr)[1])), 2)
+        self.assertEqual(list(backup.read(
+            self.storage.checkpoint(self.dir))[1]), [])
+
+        target = os.path.join(self.tmp, "restored.json")
+        self.assertEqual(len(backup.restore(self.dir, target)), 3)
+        restored = FileStorage()
+        restored._FileStorage__objects = {}
+        restored._FileStorage__file_path = target
+        restored.reload()
+        self.assertEqual(
+            sorted(s.name for s in restored.all(State).values()),
+            ["Eko", "Oyo"])
+        backup.restore(self.dir, target, 1)
+        with open(target) as f:
+            self.assertEqual(len(json.load(f)), 3)
+
+    def test_concurrent_checkpoints_get_their_own_number(self):
+        """checkpoints taken at once by two threads never share a path"""
+        listed = backup.checkpoints
+
+        def slow_checkpoints(directory):
+            """lists the checkpoints, then gives the other thread time"""
+            found = listed(directory)
+            time.sleep(0.05)
+            return found
+        self.storage.new(State(name="Lagos"))
+        self.storage.checkpoint(self.dir)
+        paths = []
+        with patch.object(backup, "checkpoints", slow_checkpoints):
+            threads = [threading.Thread(target=lambda: paths.append(
+                self.storage.checkpoint(self.dir))) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(set(paths)), 2)
+        self.assertEqual(len(backup.checkpoints(self.dir)), 3)
+
+    def test_reload_takes_a_full_checkpoint(self):
+        """the first checkpoint after a reload is a full one"""
+        self.storage.new(State(name="Lagos"))
+        self.storage.save()
+        self.storage.checkpoint(self.dir)
+        self.storage.reload()
+        self.assertTrue(self.storage.checkpoint(self.dir).endswith(
+            "000002-full.jsonl.gz"))
+        self.assertTrue(self.storage.checkpoint(self.dir, full=True)
+                        .endswith("000003-full.jsonl.gz"))
+
+
+class TestDBStorageCheckpoint(unittest.TestCase):
+    """Test cases for DBStorage.checkpoint on SQLite"""
+
+    def setUp(self):
+        """creates a storage bound to a temporary SQLite database"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        self.dir = os.path.join(tmp.name, "backups")
+        url = "sqlite:///{}".format(os.path.join(tmp.name, "hbnb.db"))
+        with patch.dict(os.environ, {"HBNB_DB_URL": url}):
+            self.storage = DBStorage()
+        self.storage.reload()
+        self.addCleanup(self.storage.close)
+
+    def test_backup_and_increments(self):
+        """a database copy, then increments, restore every row"""
+        state = State(name="Lagos")
+        wifi = Amenity(name="Wifi")
+        pool = Amenity(name="Pool")
+        for obj in (state, wifi, pool):
+            self.storage.new(obj)
+        self.storage.save()
+        full = self.storage.checkpoint(self.dir)
+        self.assertTrue(full.endswith("000001-full.sqlite"))
+
+        state.name = "Eko"
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.delete(pool)
+        place = Place(name="Villa", city_id="c", user_id="u")
+        self.storage.new(place)
+        self.storage._DBStorage__session.execute(place_amenity.insert(), [
+            {"place_id": place.id, "amenity_id": wifi.id}])
+        self.storage.new(State(name="Uncommitted"))
+        incr = self.storage.checkpoint(self.dir)
+        self.storage.save()
+        self.assertEqual(len(list(backup.read(incr)[1])), 2)
+
+        target = os.path.join(self.tmp, "restored.db")
+        backup.restore(self.dir, target)
+        with sqlite3.connect(target) as db:
+            self.assertEqual(list(db.execute("SELECT name FROM states")),
+                             [("Eko",)])
+            self.assertEqual(list(db.execute("SELECT name FROM amenities")),
+                             [("Wifi",)])
+        db.close()
+
+        self.storage.checkpoint(self.dir)
+        backup.restore(self.dir, target)
+        db = sqlite3.connect(target)
+        self.addCleanup(db.close)
+        self.assertEqual(list(db.execute(
+            "SELECT place_id, amenity_id FROM place_amenity")),
+            [(place.id, wifi.id)])
+        self.assertEqual(len(list(db.execute("SELECT * FROM states"))), 2)
+
+    def test_mysql_is_refused(self):
+        """checkpoints need a SQLite database"""
+        engine = self.storage._DBStorage__engine
+        with patch.object(engine.dialect, "name", "mysql"), \
+                self.assertRaises(ValueError):
+            self.storage.checkpoint(self.dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
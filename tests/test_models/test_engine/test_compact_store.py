@@ -0,0 +1,281 @@
+#!/usr/bin/python3
+""" Module for testing the compact file storage representation"""
+import inspect
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pycodestyle
+
+from models.engine import compact_store
+from models.engine.file_storage import FileStorage
+from models.city import City
+from models.state import State
+
+CompactStore = compact_store.CompactStore
+RowProxy = compact_store.RowProxy
+Table = compact_store.Table
+
+
+class TestCompactStoreDocsAndStyle(unittest.TestCase):
+    """Tests compact_store module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/compact_store.py",
+                "tests/test_models/test_engine/test_compact_store.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(compact_store.__doc__) >= 1)
+
+    def test_classes_docstring(self):
+        """Tests whether the classes and their methods are documented"""
+        for _, cls in inspect.getmembers(compact_store, inspect.isclass):
+            if cls.__module__ != compact_store.__name__:
+                continue
+            self.assertTrue(len(cls.__doc__) >= 1)
+            for func in vars(cls).values():
+                if inspect.isfunction(func):
+                    self.assertTrue(len(func.__doc__) >= 1)
+
+
+class TestTable(unittest.TestCase):
+    """Test cases for Table Class"""
+
+    def setUp(self):
+        """stores two states with different attributes"""
+        self.table = Table(State)
+        self.table.insert({"id": "a", "name": "Alabama"})
+        self.table.insert({"id": "b", "motto": "Gold"})
+
+    def test_objects_keep_their_own_attributes(self):
+        """record returns only the attributes an object was given"""
+        self.assertEqual(self.table.record("a"),
+                         {"id": "a", "name": "Alabama"})
+        self.assertEqual(self.table.record("b"), {"id": "b", "motto": "Gold"})
+        self.assertIs(self.table.get("b", "name"), compact_store.MISSING)
+
+    def test_insert_replaces_an_object(self):
+        """inserting an existing id replaces all its attributes"""
+        self.table.insert({"id": "a", "motto": "Audemus"})
+        self.assertEqual(self.table.record("a"),
+                         {"id": "a", "motto": "Audemus"})
+
+    def test_deleted_rows_are_reused(self):
+        """a row freed by delete holds the next inserted object"""
+        row = self.table.rows["a"]
+        self.table.delete("a")
+        self.assertNotIn("a", self.table.rows)
+        self.table.insert({"id": "c"})
+        self.assertEqual(self.table.rows["c"], row)
+        self.assertEqual(self.table.record("c"), {"id": "c"})
+
+
+class TestRowProxy(unittest.TestCase):
+    """Test cases for RowProxy Class"""
+
+    def setUp(self):
+        """stores a state and returns a proxy of it"""
+        self.date = datetime(2024, 1, 2, 3, 4, 5)
+        self.table = Table(State)
+        self.table.insert({"id": "a", "name": "Alabama",
+                           "created_at": self.date})
+        self.proxy = RowProxy(self.table, "a")
+
+    def test_proxy_looks_like_the_object(self):
+        """the proxy has the class, attributes and dict of the object"""
+        self.assertIsInstance(self.proxy, State)
+        self.assertIs(self.proxy.__class__, State)
+        self.assertEqual(self.proxy.name, "Alabama")
+        self.assertIsNone(self.proxy.updated_at)
+        self.assertEqual(self.proxy.to_dict(), {
+            "id": "a", "name": "Alabama", "created_at": self.date.isoformat(),
+            "__class__": "State"})
+        self.assertEqual(str(self.proxy), "[State] (a) {}".format(
+            self.proxy.to_dict()))
+        with self.assertRaises(AttributeError):
+            self.proxy.nothing
+
+    def test_proxy_writes_to_the_table(self):
+        """setting an attribute changes the column"""
+        self.proxy.name = "Alaska"
+        self.assertEqual(self.table.get("a", "name"), "Alaska")
+        self.assertEqual(RowProxy(self.table, "a"), self.proxy)
+        with self.assertRaises(AttributeError):
+            self.proxy.id = "b"
+
+    def test_proxy_has_no_dict(self):
+        """the proxy only holds its table and id"""
+        self.assertFalse(hasattr(self.proxy, "__dict__"))
+
+    def test_detach_returns_an_instance(self):
+        """detach builds a regular instance from the row"""
+        state = self.proxy.detach()
+        self.assertIs(type(state), State)
+        self.assertEqual(state.to_dict(), self.proxy.to_dict())
+
+
+class TestCompactStore(unittest.TestCase):
+    """Test cases for CompactStore Class"""
+
+    def setUp(self):
+        """stores a state instance"""
+        self.store = CompactStore()
+        self.state = State(name="Alabama")
+        self.key = "State.{}".format(self.state.id)
+        self.store[self.key] = self.state
+
+    def test_instances_are_kept_until_compact(self):
+        """new instances are served as is, then as proxies"""
+        self.assertIs(self.store[self.key], self.state)
+        self.state.name = "Alaska"
+        self.store.compact()
+        proxy = self.store[self.key]
+        self.assertIsInstance(proxy, RowProxy)
+        self.assertEqual(proxy.name, "Alaska")
+        self.assertEqual(proxy.to_dict(), self.state.to_dict())
+
+    def test_mapping_interface(self):
+        """len, iteration, get and pop behave like a dictionary"""
+        self.store.compact()
+        city = City(name="Mobile", state_id=self.state.id)
+        self.store["City.{}".format(city.id)] = city
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(set(self.store),
+                         {self.key, "City.{}".format(city.id)})
+        self.assertIsNone(self.store.get("State.nothing"))
+        popped = self.store.pop(self.key)
+        self.assertIs(type(popped), State)
+        self.assertEqual(popped.name, "Alabama")
+        self.assertEqual(len(self.store), 1)
+        self.assertIsNone(self.store.pop(self.key, None))
+
+    def test_load_parses_dates(self):
+        """load stores a record with datetime objects"""
+        record = self.state.to_dict()
+        record["id"] = "other"
+        self.store.load(State, record)
+        proxy = self.store["State.other"]
+        self.assertEqual(proxy.created_at, self.state.created_at)
+
+
+class TestCompactFileStorage(unittest.TestCase):
+    """Test cases for FileStorage with HBNB_FILE_COMPACT set"""
+
+    def setUp(self):
+        """creates a compact storage writing to a temporary file"""
+        objects = patch.object(FileStorage, "_FileStorage__objects", {})
+        objects.start()
+        self.addCleanup(objects.stop)
+        with patch.dict(os.environ, {"HBNB_FILE_COMPACT": "1"}):
+            self.storage = FileStorage()
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.storage._FileStorage__file_path = self.path
+
+    def tearDown(self):
+        """removes the temporary file"""
+        os.remove(self.path)
+
+    def test_save_and_reload(self):
+        """objects survive a save and reload as proxies"""
+        state = State(name="Alabama")
+        city = City(name="Mobile", state_id=state.id)
+        self.storage.new(state)
+        self.storage.new(city)
+        self.storage.save()
+        self.storage.reload()
+
+        loaded = self.storage.get(State, state.id)
+        self.assertIsInstance(loaded, RowProxy)
+        self.assertEqual(loaded.to_dict(), state.to_dict())
+        self.assertEqual(list(self.storage.all(City)),
+                         ["City.{}".format(city.id)])
+        self.assertEqual(self.storage.count(), 2)
+
+        loaded.name = "Alaska"
+        self.storage.save()
+        self.storage.reload()
+        self.assertEqual(self.storage.get(State, state.id).name, "Alaska")
+
+    def test_delete(self):
+        """delete removes a reloaded object"""
+        state = State(name="Alabama")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.reload()
+        self.storage.delete(self.storage.get(State, state.id))
+        self.assertEqual(self.storage.count(State), 0)
+
+    def test_snapshot_survives_a_delete(self):
+        """views taken before a delete still show the deleted objects"""
+        states = [State(name=name) for name in ("Alabama", "Alaska")]
+        for state in states:
+            self.storage.new(state)
+        self.storage.save()
+        self.storage.reload()
+
+        view = self.storage.snapshot(State)
+        every = self.storage.snapshot()
+        for obj in view.values():
+            self.storage.delete(obj)
+        self.assertEqual(sorted(obj.name for obj in view.values()),
+                         ["Alabama", "Alaska"])
+        self.assertEqual(len([obj.name for obj in every.values()]), 2)
+        self.assertEqual(len(self.storage.snapshot(State)), 0)
+
+    def test_save_and_delete_through_proxies(self):
+        """reloaded objects are saved with save() and deleted with the
+        amenities their places list
+        """
+        from models.amenity import Amenity
+        from models.place import Place
+
+        state = State(name="Alabama")
+        amenity = Amenity(name="Wifi")
+        place = Place(name="Villa", amenity_ids=[amenity.id])
+        for obj in (state, amenity, place):
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.reload()
+
+        with patch("models.storage", self.storage):
+            loaded = self.storage.get(State, state.id)
+            loaded.name = "Alaska"
+            loaded.save()
+            self.storage.get(Amenity, amenity.id).delete()
+        self.storage.save()
+        self.storage.reload()
+        self.assertEqual(self.storage.get(State, state.id).name, "Alaska")
+        self.assertIsNone(self.storage.get(Amenity, amenity.id))
+        self.assertEqual(
+            list(self.storage.get(Place, place.id).amenity_ids), [])
+
+    def test_stored_amenities_link_to_places(self):
+        """the amenities setter takes the proxies of stored amenities"""
+        from models.amenity import Amenity
+        from models.place import Place
+
+        amenity = Amenity(name="Wifi")
+        place = Place(name="Villa")
+        for obj in (amenity, place):
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.reload()
+
+        loaded = self.storage.get(Place, place.id)
+        loaded.amenities = self.storage.get(Amenity, amenity.id)
+        loaded.amenities = self.storage.get(Amenity, amenity.id)
+        self.assertEqual(list(loaded.amenity_ids), [amenity.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+""" Module for testing the compressed file formats"""
+import inspect
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pycodestyle
+
+from models.engine import compression
+
+
+class TestCompressionDocsAndStyle(unittest.TestCase):
+    """Tests compression module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/compression.py",
+                "tests/test_models/test_engine/test_compression.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module and its functions are documented"""
+        self.assertTrue(len(compression.__doc__) >= 1)
+        for func in inspect.getmembers(compression, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestCompression(unittest.TestCase):
+    """Test cases for the compressed file formats"""
+
+    def setUp(self):
+        """uses a temporary directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.data = b'{"State.1": {"name": "Lagos"}}' * 100
+
+    def round_trip(self, codec, level=None):
+        """writes data with codec, returns the path"""
+        path = os.path.join(self.tmp.name, "file.json" +
+                            compression.suffix(codec))
+        with compression.open_file(path, "wb", codec, level) as f:
+            f.write(self.data[:10])
+            f.write(self.data[10:])
+        self.assertEqual(compression.detect(path), codec)
+        with compression.open_file(path, "rb", codec) as f:
+            self.assertEqual(f.read(), self.data)
+        return path
+
+    def test_codec_of(self):
+        """none means no compression, unknown names are refused"""
+        self.assertIsNone(compression.codec_of(None))
+        self.assertIsNone(compression.codec_of("none"))
+        self.assertEqual(compression.codec_of("xz"), "xz")
+        with self.assertRaises(ValueError):
+            compression.codec_of("rar")
+        with patch.object(compression, "zstandard", None):
+            self.assertEqual(compression.codec_of("zstd"), "gzip")
+
+    def test_stdlib_formats(self):
+        """gzip, bz2 and xz files read back what was written"""
+        plain = os.path.getsize(self.round_trip(None))
+        for codec in ("gzip", "bz2", "xz"):
+            self.assertLess(os.path.getsize(self.round_trip(codec)), plain)
+        self.assertEqual(compression.suffix("bz2"), ".bz2")
+
+    def test_levels(self):
+        """a higher level compresses at least as well"""
+        low = os.path.getsize(self.round_trip("gzip", 1))
+        self.assertLessEqual(os.path.getsize(self.round_trip("gzip", 9)),
+                             low)
+
+    @unittest.skipIf(compression.zstandard is None,
+                     "zstandard is not installed")
+    def test_zstd(self):
+        """zstd files read back what was written"""
+        self.round_trip("zstd", 19)
@@ -1,14 +1,24 @@
 #!/usr/bin/python3
 """ Module for testing db storage"""
+import asyncio
 import inspect
+import os
+import shutil
+import tempfile
 import unittest
 from os import getenv
+from unittest.mock import patch
 
 import MySQLdb
 import pycodestyle
 
 import console
+from models.city import City
 from models.engine import db_storage
+from models.place import Place, place_amenity
+from models.review import Review
+from models.state import State
+from models.user import User
 
 HBNBCommand = console.HBNBCommand
 DBStorage = db_storage.DBStorage
@@ -90,3 +100,678 @@ class TestDBStorage(unittest.TestCase):
         self.cmd.onecmd('destroy State %s', [id])
         self.cur.execute("SELECT * FROM states")
         self.assertEqual(len(self.cur.fetchall()), len(rows) - 1)
+
+
+class TestDBStorageSQLite(unittest.TestCase):
+    """Test cases for DBStorage Class backed by a local SQLite file"""
+
+    def setUp(self):
+        """creates a storage bound to a temporary SQLite database"""
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = "sqlite:///{}".format(self.db_path)
+        with patch.dict(os.environ, {"HBNB_DB_URL": url}):
+            self.storage = DBStorage()
+        self.storage.reload()
+
+    def tearDown(self):
+        """closes the session and removes the database file"""
+        self.storage.close()
+        os.remove(self.db_path)
+
+    def test_iter_streams_all_rows_in_batches(self):
+        """iter yields every row of a class across several batches"""
+        ids = set()
+        for i in range(25):
+            state = State(name="State{}".format(i))
+            self.storage.new(state)
+            ids.add(state.id)
+        self.storage.save()
+        streamed = [obj.id for obj in self.storage.iter(State, batch_size=4)]
+        self.assertEqual(len(streamed), 25)
+        self.assertEqual(set(streamed), ids)
+
+    def test_places_with_amenities(self):
+        """places_with_amenities keeps the places linked to them all"""
+        places = [Place(name="P{}".format(i), city_id="c", user_id="u")
+                  for i in range(3)]
+        for place in places:
+            self.storage.new(place)
+        self.storage.save()
+        links = [(0, "a"), (0, "b"), (1, "b"), (2, "a"), (2, "b"), (2, "c")]
+        self.storage._DBStorage__session.execute(place_amenity.insert(), [
+            {"place_id": places[i].id, "amenity_id": amenity_id}
+            for i, amenity_id in links])
+        self.storage.save()
+
+        found = self.storage.places_with_amenities(["a", "b"])
+        self.assertEqual({p.id for p in found}, {places[0].id, places[2].id})
+        found = self.storage.places_with_amenities(["c", "b", "a"])
+        self.assertEqual([p.id for p in found], [places[2].id])
+        self.assertEqual(self.storage.places_with_amenities(["d"]), [])
+        self.assertEqual(len(self.storage.places_with_amenities([])), 3)
+
+    def test_places_within_and_in_box(self):
+        """geographic queries read the box and sort by distance"""
+        coords = ((6.45, 3.39), (6.60, 3.35), (7.38, 3.90), (0.0, 179.9),
+                  (0.0, -179.9), (None, None))
+        places = [Place(name="P", city_id="c", user_id="u",
+                        latitude=lat, longitude=lon) for lat, lon in coords]
+        for place in places:
+            self.storage.new(place)
+        self.storage.save()
+
+        found = self.storage.places_within(6.52, 3.38, 20)
+        self.assertEqual([p.id for p in found], [places[0].id, places[1].id])
+        found = self.storage.places_in_box(6.0, 3.0, 8.0, 4.0)
+        self.assertEqual(len(found), 3)
+        found = self.storage.places_within(0.0, 179.95, 50)
+        self.assertEqual({p.id for p in found}, {places[3].id, places[4].id})
+
+    def test_places_by_price_and_price_stats(self):
+        """price queries read the (city_id, price_by_night) index"""
+        places = [Place(name="P", city_id=city_id, user_id="u",
+                        price_by_night=price)
+                  for city_id, price in (("a", 30), ("a", 10), ("a", 20),
+                                         ("a", 40), ("b", 25))]
+        for place in places:
+            self.storage.new(place)
+        self.storage.save()
+
+        found = self.storage.places_by_price("a", 15, 35)
+        self.assertEqual([p.id for p in found], [places[2].id, places[0].id])
+        found = self.storage.places_by_price(limit=2, descending=True)
+        self.assertEqual([p.id for p in found], [places[3].id, places[0].id])
+        stats = self.storage.price_stats("a", (50, 75))
+        self.assertEqual(stats, {"count": 4, "min": 10, "max": 40,
+                                 "percentiles": {50: 20, 75: 30}})
+        self.assertEqual(self.storage.price_stats(None)["percentiles"],
+                         {50: 25})
+        self.assertEqual(self.storage.price_stats("c")["count"], 0)
+
+    def test_aggregates(self):
+        """aggregates are read once then follow the flushes"""
+        state = State(name="Lagos")
+        city = City(name="Ikeja", state_id=state.id)
+        place = Place(name="P", city_id=city.id, user_id="u",
+                      price_by_night=80)
+        for obj in (state, city, place):
+            self.storage.new(obj)
+        self.storage.save()
+        self.assertEqual(self.storage.aggregate(State, state.id),
+                         {"places": 1, "reviews": 0, "average_price": 80})
+
+        review = Review(text="ok", place_id=place.id, user_id="u")
+        other = Place(name="Q", city_id=city.id, user_id="u",
+                      price_by_night=40)
+        self.storage.new(review)
+        self.storage.new(other)
+        self.storage.save()
+        self.assertEqual(self.storage.aggregate("Place", place.id),
+                         {"reviews": 1})
+        self.storage.delete(place)
+        self.storage.save()
+        self.assertEqual(self.storage.aggregate(City, city.id),
+                         {"places": 1, "reviews": 0, "average_price": 40})
+        self.assertEqual(self.storage.rebuild_aggregates(), [])
+
+        self.storage._DBStorage__session.execute(
+            Place.__table__.update().values(price_by_night=60))
+        self.assertEqual(self.storage.rebuild_aggregates(),
+                         ["City.{}".format(city.id),
+                          "State.{}".format(state.id)])
+
+    def test_hbnb_read_model(self):
+        """the read model resolves names and follows flushed writes"""
+        user = User(email="a@b.c", password="pwd", first_name="Ada")
+        state = State(name="Lagos")
+        city = City(name="Ikeja", state_id=state.id)
+        place = Place(name="Villa", city_id=city.id, user_id=user.id)
+        for obj in (user, state, city, place):
+            self.storage.new(obj)
+        self.storage.save()
+        page = self.storage.hbnb_read_model()
+        self.assertEqual(page.states()[0]["cities"][0]["name"], "Ikeja")
+        self.assertEqual(page.places([place])[0]["owner"], "Ada")
+
+        user.last_name = "Obi"
+        self.storage.new(Review(text="ok", place_id=place.id,
+                                user_id=user.id))
+        self.storage.save()
+        entry = page.places([place])[0]
+        self.assertEqual(entry["owner"], "Ada Obi")
+        self.assertEqual([r["text"] for r in entry["reviews"]], ["ok"])
+
+    def test_hbnb_read_model_sees_other_writers_after_close(self):
+        """close() drops the read model once it is HBNB_READ_MODEL_TTL
+        seconds old, so the writes of another storage show up
+        """
+        self.storage.new(State(name="A"))
+        self.storage.save()
+        url = "sqlite:///{}".format(self.db_path)
+        with patch.dict(os.environ, {"HBNB_DB_URL": url,
+                                     "HBNB_READ_MODEL_TTL": "60"}):
+            cached = DBStorage()
+        cached.reload()
+        self.addCleanup(cached.close)
+        for storage in (self.storage, cached):
+            self.assertEqual(len(storage.hbnb_read_model().states()), 1)
+        with patch.dict(os.environ, {"HBNB_DB_URL": url}):
+            other = DBStorage()
+        other.reload()
+        other.new(State(name="B"))
+        other.save()
+        other.close()
+        for storage in (self.storage, cached):
+            storage.close()
+        self.assertEqual(
+            [s["name"] for s in self.storage.hbnb_read_model().states()],
+            ["A", "B"])
+        self.assertEqual(len(cached.hbnb_read_model().states()), 1)
+
+    def test_search_places_sees_other_writers_after_close(self):
+        """close() drops the search postings once they are
+        HBNB_SEARCH_TTL seconds old, so the places of another storage
+        are found
+        """
+        user = User(email="a@b.c", password="pwd")
+        city = City(name="Ikeja", state_id=State(name="Lagos").id)
+        for obj in (user, city, Place(name="A", city_id=city.id,
+                                      user_id=user.id)):
+            self.storage.new(obj)
+        self.storage.save()
+        url = "sqlite:///{}".format(self.db_path)
+        with patch.dict(os.environ, {"HBNB_DB_URL": url,
+                                     "HBNB_SEARCH_TTL": "60"}):
+            cached = DBStorage()
+        cached.reload()
+        self.addCleanup(cached.close)
+        for storage in (self.storage, cached):
+            self.assertEqual(len(storage.search_places({})[0]), 1)
+        with patch.dict(os.environ, {"HBNB_DB_URL": url}):
+            other = DBStorage()
+        other.reload()
+        other.new(Place(name="B", city_id=city.id, user_id=user.id))
+        other.save()
+        other.close()
+        for storage in (self.storage, cached):
+            storage.close()
+        self.assertEqual(
+            sorted(p.name for p in self.storage.search_places({})[0]),
+            ["A", "B"])
+        self.assertEqual(len(cached.search_places({})[0]), 1)
+
+    def test_events_are_published_on_commit(self):
+        """flushed changes are published on commit, dropped on rollback"""
+        batches = []
+        self.storage.events().subscribe(batches.append)
+        state = State(name="Lagos")
+        self.storage.new(state)
+        self.storage.save()
+        self.assertEqual([(e.op, e.cls, e.id) for e in batches[0]],
+                         [("create", "State", state.id)])
+        self.assertIn("name", batches[0][0].changed_fields)
+
+        state.name = "Eko"
+        self.storage._DBStorage__session.flush()
+        self.storage._DBStorage__session.rollback()
+        self.assertEqual(len(batches), 1)
+        state = self.storage.get(State, state.id)
+        state.name = "Eko"
+        self.storage.save()
+        self.storage.delete(state)
+        self.storage.save()
+        self.assertEqual([(e.op, e.changed_fields) for e in batches[1]],
+                         [("update", ("name",))])
+        self.assertEqual([(e.op, e.seq) for e in batches[2]],
+                         [("delete", 3)])
+
+    def test_snapshot(self):
+        """snapshot returns a read-only view of all()"""
+        state = State(name="Lagos")
+        self.storage.new(state)
+        self.storage.save()
+        view = self.storage.snapshot(State)
+        self.assertEqual(dict(view), {"State.{}".format(state.id): state})
+        with self.assertRaises(TypeError):
+            view["State.x"] = state
+
+    def test_search_places(self):
+        """search_places reads the postings and follows flushed writes"""
+        state = State(name="Lagos")
+        city = City(name="Ikeja", state_id=state.id)
+        places = [Place(name="P", city_id=city.id, user_id="u",
+                        price_by_night=price) for price in (50, 150)]
+        for obj in [state, city] + places:
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage._DBStorage__session.execute(place_amenity.insert(), [
+            {"place_id": places[1].id, "amenity_id": "wifi"}])
+        self.storage.save()
+
+        found, facets = self.storage.search_places({"state": [state.id]})
+        self.assertEqual([p.id for p in found], [p.id for p in places])
+        self.assertEqual(facets["amenity"], {"wifi": 1})
+
+        places[0].price_by_night = 200
+        other = Place(name="Q", city_id=city.id, user_id="u",
+                      price_by_night=300)
+        self.storage.new(other)
+        self.storage.delete(places[1])
+        self.storage.save()
+        found, facets = self.storage.search_places(
+            {"price_by_night": (100, None)})
+        self.assertEqual({p.id for p in found}, {places[0].id, other.id})
+        self.assertEqual(facets["amenity"], {})
+        self.assertEqual(facets["state"], {state.id: 2})
+
+    def test_search_text(self):
+        """search_text ranks the rows through the FTS5 tables"""
+        from models.review import Review
+
+        reviews = [Review(text=text, place_id="p", user_id="u")
+                   for text in ("Fast wifi and a pool", "Lovely host",
+                                "Wifi, wifi, wifi")]
+        for review in reviews:
+            self.storage.new(review)
+        self.storage.save()
+        found = self.storage.search_text(Review, "WiFi!")
+        self.assertEqual([r.id for r in found],
+                         [reviews[2].id, reviews[0].id])
+
+        reviews[1].text = "No wifi"
+        self.storage.delete(reviews[2])
+        self.storage.save()
+        found = self.storage.search_text("Review", "wifi", limit=5)
+        self.assertEqual({r.id for r in found},
+                         {reviews[0].id, reviews[1].id})
+        self.assertEqual(self.storage.search_text(Review, "?"), [])
+
+    def test_vacuum_rebuilds_the_fts_tables(self):
+        """vacuum() rebuilds the FTS5 tables from the rows"""
+        reviews = [Review(text=text, place_id="p", user_id="u")
+                   for text in ("Fast wifi and a pool", "Lovely host")]
+        for review in reviews:
+            self.storage.new(review)
+        self.storage.save()
+        with self.storage._DBStorage__engine.begin() as conn:
+            rowid = conn.exec_driver_sql(
+                "SELECT rowid FROM reviews WHERE id = ?",
+                (reviews[1].id,)).scalar()
+            conn.exec_driver_sql(
+                "INSERT INTO reviews_fts(rowid, text) VALUES (?, 'pool')",
+                (rowid,))
+        self.assertEqual(len(self.storage.search_text(Review, "pool")), 2)
+        self.storage.vacuum()
+        self.assertEqual([r.id for r in self.storage.search_text(
+            Review, "pool")], [reviews[0].id])
+        with patch.object(self.storage._DBStorage__engine.dialect, "name",
+                          "mysql"), self.assertRaises(ValueError):
+            self.storage.vacuum()
+
+    def test_search_text_without_words_builds_no_mysql_match(self):
+        """a query without words returns before MATCH is built"""
+        engine = self.storage._DBStorage__engine
+        with patch.object(engine.dialect, "name", "mysql"), \
+                patch.object(db_storage, "match") as match:
+            self.assertEqual(self.storage.search_text(Review, "?!"), [])
+        match.assert_not_called()
+
+    def test_to_dict_follows_refreshed_rows(self):
+        """to_dict is rebuilt once the session reloads an object"""
+        state = State(name="Old")
+        self.storage.new(state)
+        self.storage.save()
+        session = self.storage._DBStorage__session
+        session.refresh(state)
+        self.assertEqual(state.to_dict()["name"], "Old")
+        session.execute(State.__table__.update().values(name="New"))
+        session.refresh(state)
+        self.assertEqual(state.to_dict()["name"], "New")
+
+    def test_page_walks_a_table_with_cursors(self):
+        """page returns every row once, in (order_by, id) order"""
+        for i in range(7):
+            self.storage.new(State(name="State{}".format(i % 3)))
+        self.storage.save()
+        for order_by in ("created_at", "name"):
+            seen, cursor = [], None
+            while True:
+                objs, cursor = self.storage.page(
+                    State, limit=3, cursor=cursor, order_by=order_by)
+                seen += objs
+                if cursor is None:
+                    break
+            self.assertEqual(len({s.id for s in seen}), 7)
+            keys = [(getattr(s, order_by), s.id) for s in seen]
+            self.assertEqual(keys, sorted(keys))
+
+    def test_page_rejects_missing_columns(self):
+        """page raises a ValueError for classes without the column"""
+        for cls in (User, "Review"):
+            with self.assertRaises(ValueError):
+                self.storage.page(cls, order_by="name")
+        with self.assertRaises(ValueError):
+            self.storage.page(State, order_by="email")
+
+    def test_async_reads(self):
+        """aall, aget and acount read through the asyncio engine"""
+        state = State(name="Lagos")
+        self.storage.new(state)
+        self.storage.save()
+
+        async def run():
+            objs = await self.storage.aall(State)
+            self.assertEqual(list(objs), ["State.{}".format(state.id)])
+            got = await self.storage.aget("State", state.id)
+            self.assertEqual(got.name, "Lagos")
+            self.assertIsNone(await self.storage.aget(State, "missing"))
+            self.assertEqual(await self.storage.acount(), 1)
+            counts = await asyncio.gather(
+                *[self.storage.acount(State) for _ in range(5)])
+            self.assertEqual(counts, [1] * 5)
+        asyncio.run(run())
+
+    def test_async_engines_follow_the_event_loop(self):
+        """each event loop reads through engines of its own, close()
+        disposes of them
+        """
+        self.storage.new(State(name="Lagos"))
+        self.storage.save()
+        engines = []
+
+        async def run():
+            self.assertEqual(await self.storage.acount(State), 1)
+            engines.append(self.storage._DBStorage__async_engines)
+        asyncio.run(run())
+        asyncio.run(run())
+        self.assertIsNot(engines[0], engines[1])
+        self.assertEqual(engines[0][-1].sync_engine.pool.checkedin(), 0)
+        self.assertEqual(engines[1][-1].sync_engine.pool.checkedin(), 1)
+        self.storage.close()
+        self.assertIsNone(self.storage._DBStorage__async_engines)
+        self.assertEqual(engines[1][-1].sync_engine.pool.checkedin(), 0)
+        asyncio.run(run())
+
+    def test_asave_commits_pending_objects(self):
+        """asave commits what new added"""
+        self.storage.new(State(name="Kano"))
+        asyncio.run(self.storage.asave())
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 1)
+
+    def test_async_url(self):
+        """async_url swaps in the asyncio driver of the database"""
+        self.assertEqual(
+            db_storage.async_url("sqlite:///file.db").drivername,
+            "sqlite+aiosqlite")
+        self.assertEqual(
+            db_storage.async_url("mysql+mysqldb://u:p@h/db").drivername,
+            "mysql+aiomysql")
+
+    def test_query_stats_group_statements_by_method(self):
+        """query_stats reports the statements of each storage method"""
+        self.storage.reset_query_stats()
+        self.storage.new(State(name="Lagos"))
+        self.storage.save()
+        self.storage.all(State)
+        self.storage.count(State)
+        methods = self.storage.query_stats()["methods"]
+        self.assertEqual(methods["save"]["count"], 1)
+        self.assertEqual(methods["all"]["count"], 1)
+        self.assertEqual(methods["count"]["count"], 1)
+
+    def test_iter_accepts_a_class_name(self):
+        """iter resolves class names the same way as classes"""
+        self.storage.new(State(name="Lagos"))
+        self.storage.save()
+        self.assertEqual(len(list(self.storage.iter("State"))), 1)
+
+
+class TestDBStorageReplicas(unittest.TestCase):
+    """Test cases for DBStorage read routing with a SQLite replica"""
+
+    def sqlite_storage(self, primary, replica=None, **settings):
+        """returns a reloaded storage on the given SQLite files, with the
+        other settings given as environment variables
+        """
+        env = dict(settings, HBNB_DB_URL="sqlite:///{}".format(primary))
+        if replica is not None:
+            env["HBNB_DB_REPLICA_URLS"] = "sqlite:///{}".format(replica)
+        with patch.dict(os.environ, env):
+            storage = DBStorage()
+        storage.reload()
+        return storage
+
+    def setUp(self):
+        """creates a primary and a replica holding one extra state"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.primary = os.path.join(self.tmp_dir, "primary.db")
+        self.replica = os.path.join(self.tmp_dir, "replica.db")
+        storage = self.sqlite_storage(self.primary)
+        self.state = State(name="Primary")
+        storage.new(self.state)
+        storage.save()
+        storage.close()
+        shutil.copyfile(self.primary, self.replica)
+        storage = self.sqlite_storage(self.replica)
+        self.replica_only = State(name="Replica")
+        storage.new(self.replica_only)
+        storage.save()
+        storage.close()
+        self.storage = self.sqlite_storage(self.primary, self.replica)
+
+    def tearDown(self):
+        """closes the sessions and removes the database files"""
+        self.storage.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_reads_are_served_by_the_replica(self):
+        """all, get, count and iter read from the replica"""
+        self.assertEqual(self.storage.count(State), 2)
+        self.assertIn("State.{}".format(self.replica_only.id),
+                      self.storage.all(State))
+        self.assertIsNotNone(self.storage.get(State, self.replica_only.id))
+        self.assertEqual(len(list(self.storage.iter(State))), 2)
+
+    def test_reads_stick_to_the_primary_after_a_write(self):
+        """a session that wrote reads its own writes from the primary"""
+        state = State(name="Fresh")
+        self.storage.new(state)
+        self.storage.save()
+        self.assertIsNotNone(self.storage.get("State", state.id))
+        self.assertIsNone(self.storage.get("State", self.replica_only.id))
+        self.storage.close()
+        self.assertIsNone(self.storage.get("State", state.id))
+
+    def test_objects_read_from_a_replica_are_saved_to_the_primary(self):
+        """objects loaded from a replica are written to the primary"""
+        state = self.storage.get(State, self.state.id)
+        state.name = "Renamed"
+        self.storage.new(state)
+        self.storage.save()
+        primary = self.sqlite_storage(self.primary)
+        self.assertEqual(primary.get(State, self.state.id).name, "Renamed")
+        primary.close()
+
+    def test_cache_misses_are_served_by_the_replica(self):
+        """with the query cache on, misses still read from the replica
+        until this session writes
+        """
+        storage = self.sqlite_storage(self.primary, self.replica,
+                                      HBNB_CACHE_TTL="60")
+        self.addCleanup(storage.close)
+        self.assertEqual(storage.count(State), 2)
+        self.assertIsNotNone(storage.get(State, self.replica_only.id))
+        self.assertEqual(storage.cache_stats()["misses"], 2)
+        storage.new(State(name="Fresh"))
+        storage.save()
+        self.assertEqual(storage.count(State), 2)
+        self.assertIsNone(storage.get(State, self.replica_only.id))
+
+        failing = self.sqlite_storage(self.primary, self.tmp_dir,
+                                      HBNB_CACHE_TTL="60")
+        self.addCleanup(failing.close)
+        self.assertEqual(failing.count(State), 2)
+
+    def test_async_reads_follow_the_read_order(self):
+        """async reads use the replica until the session writes, and the
+        primary when the replica is unavailable
+        """
+        self.assertIsNotNone(asyncio.run(
+            self.storage.aget(State, self.replica_only.id)))
+        self.storage.new(State(name="Fresh"))
+        self.storage.save()
+        self.assertIsNone(asyncio.run(
+            self.storage.aget(State, self.replica_only.id)))
+
+        failing = self.sqlite_storage(self.primary, self.tmp_dir)
+        self.addCleanup(failing.close)
+        self.assertEqual(asyncio.run(failing.acount(State)), 2)
+
+    def test_failing_replica_falls_back_to_the_primary(self):
+        """reads go to the primary when the replica is unavailable"""
+        storage = self.sqlite_storage(self.primary, self.tmp_dir)
+        self.assertEqual(storage.count(State), 1)
+        self.assertEqual(len(storage.all(State)), 1)
+        self.assertEqual(len(list(storage.iter(State))), 1)
+        storage.close()
+
+
+class TestDBStorageQueryCache(unittest.TestCase):
+    """Test cases for the DBStorage query cache"""
+
+    def setUp(self):
+        """creates a storage with the query cache enabled"""
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        env = {"HBNB_DB_URL": "sqlite:///{}".format(self.db_path),
+               "HBNB_CACHE_TTL": "60"}
+        with patch.dict(os.environ, env):
+            self.storage = DBStorage()
+        self.storage.reload()
+        self.storage.new(State(name="Lagos"))
+        self.storage.save()
+
+    def tearDown(self):
+        """closes the session and removes the database file"""
+        self.storage.close()
+        os.remove(self.db_path)
+
+    def test_repeated_reads_are_cache_hits(self):
+        """the same query is answered from the cache"""
+        first = self.storage.all("State")
+        self.assertEqual(self.storage.all(State), first)
+        self.assertEqual(self.storage.count(State), 1)
+        self.assertEqual(self.storage.count(State), 1)
+        stats = self.storage.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+
+    def test_writes_invalidate_the_class(self):
+        """new, delete and save drop the cached results of the class"""
+        self.assertEqual(len(self.storage.all(State)), 1)
+        state = State(name="Kano")
+        self.storage.new(state)
+        self.storage.save()
+        self.assertEqual(len(self.storage.all(State)), 2)
+        self.storage.delete(state)
+        self.assertEqual(len(self.storage.all(State)), 1)
+        self.assertIsNone(self.storage.get(State, state.id))
+
+    def test_cached_objects_outlive_the_session(self):
+        """relationships of cached objects load after close()"""
+        state = list(self.storage.all(State).values())[0]
+        user = User(email="a@b.c", password="pwd")
+        city = City(name="Ikeja", state_id=state.id)
+        self.storage.new(user)
+        self.storage.new(city)
+        self.storage.save()
+        city = self.storage.get(City, city.id)
+        self.storage.close()
+        self.assertEqual(city.places, [])
+        place = Place(name="Home", city_id=city.id, user_id=user.id)
+        self.storage.new(place)
+        self.storage.save()
+        city = self.storage.get(City, city.id)
+        self.assertEqual([p.id for p in city.places], [place.id])
+
+    def test_lazy_loads_hold_no_connection(self):
+        """cached objects give the connection of a lazy load back"""
+        state = list(self.storage.all(State).values())[0]
+        cities = [City(name="C{}".format(i), state_id=state.id)
+                  for i in range(20)]
+        for city in cities:
+            self.storage.new(city)
+        self.storage.save()
+        self.storage.close()
+        pool = self.storage._DBStorage__engine.pool
+        for city in cities:
+            self.assertEqual(self.storage.get(City, city.id).places, [])
+            self.assertEqual(pool.checkedout(), 0)
+        self.storage.get(City, cities[0].id).places
+        self.storage.close()
+        self.assertEqual(pool.checkedout(), 0)
+
+
+class TestDBStorageObjectCache(unittest.TestCase):
+    """Test cases for the DBStorage bounded object cache"""
+
+    def setUp(self):
+        """creates a storage caching three objects"""
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        env = {"HBNB_DB_URL": "sqlite:///{}".format(self.db_path),
+               "HBNB_OBJECT_CACHE_SIZE": "3",
+               "HBNB_OBJECT_CACHE_PINNED": "State"}
+        with patch.dict(os.environ, env):
+            self.storage = DBStorage()
+        self.storage.reload()
+
+    def tearDown(self):
+        """closes the session and removes the database file"""
+        self.storage.close()
+        os.remove(self.db_path)
+
+    def test_session_holds_a_bounded_number_of_objects(self):
+        """cold objects are expunged from the session"""
+        users = [User(email="{}@b.c".format(i), password="pwd")
+                 for i in range(10)]
+        for user in users:
+            self.storage.new(user)
+        self.storage.save()
+        self.storage.close()
+        streamed = list(self.storage.iter(User, batch_size=2))
+        self.assertEqual(len(streamed), 10)
+        stats = self.storage.object_cache_stats()
+        self.assertEqual(stats["objects"], 3)
+        self.assertEqual(stats["identity_map"], 3)
+        self.assertEqual(stats["evictions"], 7)
+        self.assertGreater(stats["bytes"], 0)
+
+    def test_pinned_objects_are_served_without_sql(self):
+        """get of a hot pinned object does not query the database"""
+        state = State(name="Lagos")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.all(State)
+        self.storage.close()
+        self.storage.reset_query_stats()
+        got = self.storage.get(State, state.id)
+        self.assertEqual(got.name, "Lagos")
+        self.assertEqual(self.storage.query_stats()["methods"], {})
+        got.name = "Lagos State"
+        self.storage.new(got)
+        self.storage.save()
+        self.storage.close()
+        self.assertEqual(self.storage.get(State, state.id).name,
+                         "Lagos State")
+
+    def test_deleted_objects_leave_the_cache(self):
+        """delete drops the object from the cache"""
+        state = State(name="Lagos")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.get(State, state.id)
+        self.storage.delete(state)
+        self.assertEqual(self.storage.object_cache_stats()["objects"], 0)
+        self.assertIsNone(self.storage.get(State, state.id))
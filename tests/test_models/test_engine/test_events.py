@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+""" Module for testing the change data capture event stream"""
+import inspect
+import os
+import tempfile
+import unittest
+
+import pycodestyle
+
+from models.engine import events
+
+Event = events.Event
+EventStream = events.EventStream
+
+
+class TestEventsDocsAndStyle(unittest.TestCase):
+    """Tests events module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/events.py",
+                "tests/test_models/test_engine/test_events.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module and its functions are documented"""
+        self.assertTrue(len(events.__doc__) >= 1)
+        for func in inspect.getmembers(events, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+    def test_class_docstring(self):
+        """Tests whether the classes and their methods are documented"""
+        self.assertTrue(len(Event.__doc__) >= 1)
+        self.assertTrue(len(EventStream.__doc__) >= 1)
+        for func in inspect.getmembers(EventStream, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestEventStream(unittest.TestCase):
+    """Test cases for EventStream Class"""
+
+    def setUp(self):
+        """subscribes a list to a stream without file"""
+        self.stream = EventStream()
+        self.batches = []
+        self.stream.subscribe(self.batches.append)
+
+    def test_publish_numbers_the_batch(self):
+        """events are published once, in order, with increasing seq"""
+        self.stream.record("create", "State", "a", ["name", "id"])
+        self.stream.record("update", "City", "b", ["name"])
+        self.assertEqual(self.batches, [])
+        published = self.stream.publish()
+        self.assertEqual(self.batches, [published])
+        self.assertEqual(published, [
+            Event(1, "create", "State", "a", ("id", "name")),
+            Event(2, "update", "City", "b", ("name",))])
+        self.stream.record("delete", "State", "a")
+        self.assertEqual(self.stream.publish(),
+                         [Event(3, "delete", "State", "a", None)])
+        self.assertEqual(self.stream.publish(), [])
+        self.assertEqual(self.stream.seq, 3)
+
+    def test_changes_of_an_object_are_merged(self):
+        """a batch holds one event per object"""
+        self.stream.record("create", "State", "a", ["id"])
+        self.stream.record("update", "State", "a", ["name"])
+        self.stream.record("update", "City", "b", ["name"])
+        self.stream.record("update", "City", "b", None)
+        self.stream.record("create", "City", "c", ["id"])
+        self.stream.record("delete", "City", "c")
+        self.stream.record("update", "User", "d", ["email"])
+        self.stream.record("delete", "User", "d")
+        self.assertEqual(self.stream.publish(), [
+            Event(1, "create", "State", "a", ("id", "name")),
+            Event(2, "update", "City", "b", None),
+            Event(3, "delete", "User", "d", None)])
+
+    def test_discard_and_take(self):
+        """discarded changes are never published, taken ones later"""
+        self.stream.record("create", "State", "a")
+        self.stream.discard()
+        self.stream.record("create", "State", "b")
+        batch = self.stream.take()
+        self.stream.record("create", "State", "c")
+        self.assertEqual([e.id for e in self.stream.publish(batch)], ["b"])
+        self.assertEqual([e.id for e in self.stream.publish()], ["c"])
+
+    def test_idle_stream_gathers_nothing(self):
+        """without subscriber nor file, changes are dropped"""
+        self.stream.unsubscribe(self.batches.append)
+        self.assertFalse(self.stream.active)
+        self.stream.record("create", "State", "a")
+        self.assertEqual(self.stream.publish(), [])
+        with self.assertRaises(ValueError):
+            self.stream.record("upsert", "State", "a")
+
+    def test_gathering_counts_the_active_streams(self):
+        """the module counts the streams with a subscriber or a file"""
+        count = events.gathering
+        self.stream.unsubscribe(self.batches.append)
+        self.assertEqual(events.gathering, count - 1)
+        self.stream.unsubscribe(self.batches.append)
+        self.assertEqual(events.gathering, count - 1)
+        other = EventStream()
+        other.subscribe(self.batches.append)
+        self.assertEqual(events.gathering, count)
+        del other
+        self.assertEqual(events.gathering, count - 1)
+
+    def test_failing_subscriber(self):
+        """a failing subscriber does not stop the others"""
+        def fail(batch):
+            raise RuntimeError("boom")
+        self.stream.unsubscribe(self.batches.append)
+        self.stream.subscribe(fail)
+        self.stream.subscribe(self.batches.append)
+        self.stream.record("create", "State", "a")
+        with self.assertLogs(events.logger, "ERROR"):
+            self.stream.publish()
+        self.assertEqual(len(self.batches), 1)
+
+
+class TestEventFile(unittest.TestCase):
+    """Test cases for the event file sink"""
+
+    def setUp(self):
+        """uses a file in a temporary directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "events.jsonl")
+
+    def test_tail_the_file(self):
+        """read_events resumes from the returned offset"""
+        stream = EventStream(self.path)
+        self.assertTrue(stream.active)
+        self.assertEqual(events.read_events(self.path), ([], 0))
+        stream.record("create", "State", "a", ["id"])
+        stream.publish()
+        found, offset = events.read_events(self.path)
+        self.assertEqual(found, [Event(1, "create", "State", "a", ("id",))])
+        stream.record("delete", "State", "a")
+        stream.publish()
+        with open(self.path, "ab") as f:
+            f.write(b'{"seq": 3')
+        found, offset = events.read_events(self.path, offset)
+        self.assertEqual(found, [Event(2, "delete", "State", "a", None)])
+        self.assertEqual(events.read_events(self.path, offset),
+                         ([], offset))
+
+    def test_seq_continues_the_file(self):
+        """a new stream on the same file numbers after its last event"""
+        self.assertEqual(events.last_seq(self.path), 0)
+        stream = EventStream(self.path)
+        for id in range(300):
+            stream.record("create", "State", str(id) * 20)
+        stream.publish()
+        self.assertEqual(events.last_seq(self.path), 300)
+        stream = EventStream(self.path)
+        stream.record("create", "City", "b")
+        self.assertEqual(stream.publish()[0].seq, 301)
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 """ Module for testing file storage"""
+import asyncio
 import inspect
 import json
 import os
@@ -84,6 +85,7 @@ class TestFileStorage(unittest.TestCase):
         self.assertIsInstance(self.storage.all(), dict)
         self.assertGreaterEqual(len(self.storage.all(User)), 1)
         self.assertIsInstance(list(self.storage.all(User).values())[0], User)
+        self.assertEqual(self.storage.all("User"), self.storage.all(User))
 
     def test_new_adds_instance_obj_to_dict_of_objects(self):
         """tests wether the instance method 'new' adds new object"""
@@ -127,6 +129,296 @@ class TestFileStorage(unittest.TestCase):
         saved_objects_dict = {k: v.to_dict() for k, v in saved_objects.items()}
         self.assertEqual(expected_objects, saved_objects_dict)
 
+    def test_save_writes_the_objects_as_json(self):
+        """save writes a JSON object mapping every key to to_dict"""
+        user = User(email="a@b.c", first_name='say "hi"')
+        self.storage.new(user)
+        self.storage.save()
+
+        with open(self.file_path) as f:
+            saved = json.load(f)
+        self.assertEqual(saved, {k: v.to_dict()
+                                 for k, v in self.storage.all().items()})
+
+    def test_places_with_amenities(self):
+        """places_with_amenities returns the places having them all"""
+        from models.place import Place
+
+        places = [Place(amenity_ids=ids)
+                  for ids in (["a", "b"], ["b"], ["a", "b", "c"])]
+        for place in places:
+            self.storage.new(place)
+        found = self.storage.places_with_amenities(["a", "b"])
+        self.assertEqual({p.id for p in found}, {places[0].id, places[2].id})
+
+        places[1].amenity_ids = ["a", "b"]
+        self.storage.new(places[1])
+        self.storage.delete(places[2])
+        found = self.storage.places_with_amenities(["a", "b"])
+        self.assertEqual({p.id for p in found}, {places[0].id, places[1].id})
+        self.assertEqual(len(self.storage.places_with_amenities([])), 2)
+
+    def test_places_within_and_in_box(self):
+        """geographic queries find the indexed places, nearest first"""
+        from models.place import Place
+
+        coords = ((6.45, 3.39), (6.60, 3.35), (7.38, 3.90), (-1.29, 36.82))
+        places = [Place(latitude=lat, longitude=lon) for lat, lon in coords]
+        for place in places:
+            self.storage.new(place)
+        found = self.storage.places_within(6.52, 3.38, 20)
+        self.assertEqual([p.id for p in found], [places[0].id, places[1].id])
+        found = self.storage.places_in_box(6.0, 3.0, 8.0, 4.0)
+        self.assertEqual(len(found), 3)
+
+        places[1].latitude = 7.38
+        self.storage.new(places[1])
+        self.storage.delete(places[0])
+        self.assertEqual(self.storage.places_within(6.52, 3.38, 20), [])
+        found = self.storage.places_within(7.38, 3.90, 100)
+        self.assertEqual([p.id for p in found], [places[2].id, places[1].id])
+
+    def test_places_by_price_and_price_stats(self):
+        """price queries use the index and follow new and delete"""
+        from models.place import Place
+
+        places = [Place(city_id="a", price_by_night=price)
+                  for price in (30, 10, 20, 40)]
+        for place in places:
+            self.storage.new(place)
+        found = self.storage.places_by_price("a", 15, 35)
+        self.assertEqual(found, [places[2], places[0]])
+        found = self.storage.places_by_price("a", limit=1, descending=True)
+        self.assertEqual(found, [places[3]])
+        stats = self.storage.price_stats("a", (50, 90))
+        self.assertEqual(stats, {"count": 4, "min": 10, "max": 40,
+                                 "percentiles": {50: 20, 90: 40}})
+
+        places[3].price_by_night = 5
+        self.storage.new(places[3])
+        self.storage.delete(places[1])
+        self.assertEqual(self.storage.places_by_price("a", limit=1),
+                         [places[3]])
+        self.assertEqual(self.storage.price_stats("a")["percentiles"],
+                         {50: 20})
+
+    def test_aggregates(self):
+        """aggregates follow new and delete and rebuild reports drift"""
+        from models.city import City
+        from models.place import Place
+        from models.review import Review
+
+        city = City(state_id="LA")
+        place = Place(city_id=city.id, price_by_night=80)
+        for obj in (city, place, Review(place_id=place.id)):
+            self.storage.new(obj)
+        self.assertEqual(self.storage.aggregate("State", "LA"),
+                         {"places": 1, "reviews": 1, "average_price": 80})
+        other = Place(city_id=city.id, price_by_night=40)
+        self.storage.new(other)
+        self.storage.delete(place)
+        self.assertEqual(self.storage.aggregate(City, city.id),
+                         {"places": 1, "reviews": 0, "average_price": 40})
+        self.assertEqual(self.storage.rebuild_aggregates(), [])
+
+        other.price_by_night = 60
+        self.assertEqual(self.storage.rebuild_aggregates(),
+                         ["City.{}".format(city.id), "State.LA"])
+        self.assertEqual(self.storage.aggregate(City, city.id)
+                         ["average_price"], 60)
+
+    def test_events_are_published_by_save(self):
+        """changes are published with their fields once saved"""
+        from models.state import State
+
+        batches = []
+        stream = self.storage.events()
+        stream.subscribe(batches.append)
+        self.addCleanup(stream.unsubscribe, batches.append)
+        state = State(name="Lagos")
+        other = State(name="Abuja")
+        self.storage.new(state)
+        self.storage.new(other)
+        self.assertEqual(batches, [])
+        self.storage.save()
+        self.assertEqual([(e.op, e.id) for e in batches[0]],
+                         [("create", state.id), ("create", other.id)])
+        self.assertIn("name", batches[0][0].changed_fields)
+
+        state.name = "Eko"
+        self.storage.new(state)
+        self.storage.delete(other)
+        self.storage.save()
+        self.assertEqual([(e.op, e.id, e.changed_fields) for e in batches[1]],
+                         [("update", state.id, ("name",)),
+                          ("delete", other.id, None)])
+        self.assertEqual(batches[1][1].seq - batches[0][0].seq, 3)
+
+    def test_delete_cascades(self):
+        """deleting an object deletes what depends on it, like the
+        database relationships do
+        """
+        from models.amenity import Amenity
+        from models.city import City
+        from models.place import Place
+        from models.review import Review
+        from models.state import State
+        from models.user import User
+
+        state, user, amenity = State(), User(), Amenity()
+        cities = [City(state_id=state.id), City(state_id="other")]
+        places = [Place(city_id=city.id, user_id="u",
+                        amenity_ids=[amenity.id]) for city in cities]
+        reviews = [Review(place_id=places[0].id, user_id="u"),
+                   Review(place_id=places[1].id, user_id=user.id)]
+        objs = [state, user, amenity] + cities + places + reviews
+        for obj in objs:
+            self.storage.new(obj)
+        self.storage.delete(state)
+        kept = set(self.storage.all().values())
+        self.assertEqual(kept, set(objs) - {state, cities[0], places[0],
+                                            reviews[0]})
+
+        moved = City(state_id=state.id)
+        self.storage.new(moved)
+        moved.state_id = "other"
+        self.storage.new(moved)
+        self.storage.delete(user)
+        self.storage.delete(amenity)
+        self.assertNotIn(reviews[1], self.storage.all().values())
+        self.assertIn(moved, self.storage.all().values())
+        self.assertEqual(list(places[1].amenity_ids), [])
+        self.assertEqual(self.storage.places_with_amenities([amenity]), [])
+
+    def test_snapshot(self):
+        """snapshot views are read-only, shared until a write and never
+        changed by later writes
+        """
+        from models.city import City
+        from models.state import State
+
+        state = State(name="Lagos")
+        self.storage.new(state)
+        view = self.storage.snapshot()
+        states = self.storage.snapshot(State)
+        self.assertEqual(dict(view), self.storage.all())
+        self.assertIs(self.storage.snapshot(), view)
+        self.assertIs(self.storage.snapshot("State"), states)
+        with self.assertRaises(TypeError):
+            view["State.x"] = state
+
+        state.name = "Eko"
+        self.storage.new(state)
+        self.assertIs(self.storage.snapshot(), view)
+        cities = self.storage.snapshot(City)
+        for _ in view.values():
+            self.storage.new(State())
+            self.storage.delete(state)
+        self.assertEqual(list(view.values()), [state])
+        self.assertIs(self.storage.snapshot(City), cities)
+        self.assertEqual(len(self.storage.snapshot(State)), 1)
+        self.assertNotIn(state, self.storage.snapshot().values())
+
+    def test_snapshot_built_during_a_write_is_not_kept(self):
+        """a view built while another thread writes is not kept"""
+        from unittest.mock import patch
+        from models.state import State
+
+        all_objects = self.storage.all
+        late = State(name="Late")
+
+        def racing_all(cls=None):
+            """builds the objects, then lets a writer store a state"""
+            objs = all_objects(cls)
+            self.storage.new(late)
+            return objs
+        with patch.object(self.storage, "all", side_effect=racing_all):
+            view = self.storage.snapshot(State)
+        self.assertNotIn(late, view.values())
+        self.assertIn(late, self.storage.snapshot(State).values())
+
+    def test_compressed_file(self):
+        """with HBNB_FILE_COMPRESSION the file is saved compressed, in
+        place of the plain one, and reloaded from it
+        """
+        from unittest.mock import patch
+        from models.state import State
+
+        state = State(name="Lagos")
+        self.storage.new(state)
+        env = {"HBNB_FILE_COMPRESSION": "gzip",
+               "HBNB_FILE_COMPRESSION_LEVEL": "1"}
+        with patch.dict(os.environ, env):
+            self.addCleanup(lambda: os.path.exists("file.json.gz") and
+                            os.remove("file.json.gz"))
+            self.storage.save()
+            self.assertFalse(os.path.exists(self.file_path))
+            with open("file.json.gz", "rb") as f:
+                self.assertEqual(f.read(2), b"\x1f\x8b")
+            self.storage.reload()
+        self.assertEqual(self.storage.get(State, state.id).name, "Lagos")
+        self.storage.reload()
+        self.assertIsNotNone(self.storage.get(State, state.id))
+        self.storage.save()
+        self.assertTrue(os.path.exists(self.file_path))
+        self.assertFalse(os.path.exists("file.json.gz"))
+
+    def test_search_places(self):
+        """search_places filters the places and follows new and delete"""
+        from models.city import City
+        from models.place import Place
+
+        city = City(name="Lagos", state_id="LA")
+        places = [Place(city_id=city.id, price_by_night=price)
+                  for price in (50, 150)]
+        for obj in [city] + places:
+            self.storage.new(obj)
+        found, facets = self.storage.search_places(
+            {"state": ["LA"], "price_by_night": (100, None)})
+        self.assertEqual(found, [places[1]])
+        self.assertEqual(facets["price_by_night"], {50: 1, 150: 1})
+
+        places[0].price_by_night = 120
+        self.storage.new(places[0])
+        self.storage.delete(places[1])
+        found, facets = self.storage.search_places(
+            {"price_by_night": (100, None)})
+        self.assertEqual(found, [places[0]])
+        self.assertEqual(facets["state"], {"LA": 1})
+
+    def test_search_text(self):
+        """search_text ranks the reviews mentioning the words"""
+        from models.review import Review
+
+        reviews = [Review(text=text) for text in (
+            "Fast wifi and a pool", "Lovely host", "Wifi, wifi, wifi")]
+        for review in reviews:
+            self.storage.new(review)
+        found = self.storage.search_text(Review, "WiFi")
+        self.assertEqual(found, [reviews[2], reviews[0]])
+
+        reviews[1].text = "No wifi"
+        self.storage.new(reviews[1])
+        self.storage.delete(reviews[2])
+        found = self.storage.search_text("Review", "wifi", limit=5)
+        self.assertEqual({r.id for r in found},
+                         {reviews[0].id, reviews[1].id})
+        with self.assertRaises(ValueError):
+            self.storage.search_text(User, "wifi")
+
+    def test_reload_restores_classes_and_dates(self):
+        """reload rebuilds every object with its class and datetimes"""
+        user = User(email="a@b.c", password="pwd")
+        self.storage.new(user)
+        self.storage.save()
+        self.storage.reload()
+
+        loaded = self.storage.get(User, user.id)
+        self.assertIsNot(loaded, user)
+        self.assertIs(type(loaded), User)
+        self.assertEqual(loaded.created_at, user.created_at)
+        self.assertEqual(loaded.to_dict(), user.to_dict())
+
     def test_reload_method_does_not_do_anything_for_non_existent_file(self):
         """reload does not do anything if the file does not exist"""
         if os.path.exists(self.file_path):
@@ -160,3 +452,87 @@ class TestFileStorage(unittest.TestCase):
     def test_type_path(self):
         """ Confirm __file_path is string """
         self.assertEqual(type(self.storage._FileStorage__file_path), str)
+
+    def test_iter_yields_only_the_class_specified(self):
+        """iter yields the stored objects of the requested class"""
+        temp_obj = BaseModel()
+        temp_usr = User()
+        self.storage.new(temp_obj)
+        self.storage.new(temp_usr)
+        users = list(self.storage.iter(User, batch_size=1))
+        self.assertIn(temp_usr, users)
+        self.assertNotIn(temp_obj, users)
+        self.assertIn(temp_usr, list(self.storage.iter("User")))
+
+    def test_get_and_count(self):
+        """get finds an object by class and id, count counts them"""
+        temp_usr = User()
+        self.storage.new(temp_usr)
+        self.storage.new(BaseModel())
+        self.assertIs(self.storage.get(User, temp_usr.id), temp_usr)
+        self.assertIs(self.storage.get("User", temp_usr.id), temp_usr)
+        self.assertIsNone(self.storage.get(User, "missing"))
+        self.assertEqual(self.storage.count(User),
+                         len(self.storage.all(User)))
+        self.assertEqual(self.storage.count(), len(self.storage.all()))
+
+    def test_page_walks_a_class_with_cursors(self):
+        """page returns every object once, in (order_by, id) order"""
+        from models.state import State
+
+        states = []
+        for i in range(7):
+            state = State(name="state{}".format(6 - i))
+            self.storage.new(state)
+            states.append(state)
+        self.storage.new(BaseModel())
+        for order_by in ("created_at", "name"):
+            seen, cursor = [], None
+            while True:
+                objs, cursor = self.storage.page(
+                    State, limit=3, cursor=cursor, order_by=order_by)
+                seen += objs
+                if cursor is None:
+                    break
+            self.assertEqual(seen, sorted(
+                states, key=lambda s: (getattr(s, order_by), s.id)))
+        objs, _ = self.storage.page("State", limit=7)
+        self.assertEqual(objs, sorted(
+            states, key=lambda s: (s.created_at, s.id)))
+
+    def test_page_follows_new_and_deleted_objects(self):
+        """the sorted index is updated by new and delete"""
+        first = User()
+        self.storage.new(first)
+        self.assertEqual(self.storage.page(User)[0], [first])
+        second = User()
+        self.storage.new(second)
+        self.storage.delete(first)
+        self.assertEqual(self.storage.page(User), ([second], None))
+
+    def test_page_rejects_unindexed_orders(self):
+        """page only orders by created_at or name, and by name only the
+        classes having one
+        """
+        with self.assertRaises(ValueError):
+            self.storage.page(User, order_by="email")
+        for cls in (User, "Review"):
+            with self.assertRaises(ValueError):
+                self.storage.page(cls, order_by="name")
+
+    def test_async_methods(self):
+        """the async methods return what the sync ones do"""
+        temp_usr = User()
+        self.storage.new(temp_usr)
+
+        async def run():
+            self.assertEqual(await self.storage.aall(User),
+                             self.storage.all(User))
+            self.assertIs(await self.storage.aget(User, temp_usr.id),
+                          temp_usr)
+            self.assertEqual(await self.storage.acount(User),
+                             self.storage.count(User))
+            await self.storage.asave()
+        asyncio.run(run())
+        with open(self.file_path, 'r') as f:
+            self.assertIn(f"User.{temp_usr.id}", json.load(f))
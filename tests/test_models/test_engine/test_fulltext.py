@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+""" Module for testing the full-text search helpers"""
+import inspect
+import sqlite3
+import unittest
+
+import pycodestyle
+
+from models.engine import fulltext
+
+InvertedIndex = fulltext.InvertedIndex
+
+
+class TestFulltextDocsAndStyle(unittest.TestCase):
+    """Tests fulltext module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/fulltext.py",
+                "tests/test_models/test_engine/test_fulltext.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(fulltext.__doc__) >= 1)
+
+    def test_docstrings(self):
+        """Tests whether the functions, class and methods are documented"""
+        for _, func in inspect.getmembers(fulltext, inspect.isfunction):
+            self.assertTrue(len(func.__doc__) >= 1)
+        self.assertTrue(len(InvertedIndex.__doc__) >= 1)
+        for func in inspect.getmembers(InvertedIndex, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestTokenize(unittest.TestCase):
+    """Test cases for the tokenizer and the query builders"""
+
+    def test_tokenize(self):
+        """words are lowercased and one letter words dropped"""
+        self.assertEqual(fulltext.tokenize("Fast WiFi, a pool & 2 TVs!"),
+                         ["fast", "wifi", "pool", "tvs"])
+        self.assertEqual(fulltext.tokenize(None), [])
+
+    def test_fts_query(self):
+        """fts_query quotes every distinct word"""
+        self.assertEqual(fulltext.fts_query('wifi "pool" wifi'),
+                         '"wifi" OR "pool"')
+        self.assertIsNone(fulltext.fts_query("- !"))
+
+    def test_sqlite_ddl_keeps_the_index_in_sync(self):
+        """the triggers index inserted, updated and deleted rows"""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE notes (id TEXT PRIMARY KEY, body TEXT)")
+        for statement in fulltext.sqlite_ddl("notes", "body"):
+            conn.execute(statement)
+        conn.execute("INSERT INTO notes VALUES ('a', 'great wifi')")
+        conn.execute("INSERT INTO notes VALUES ('b', 'quiet street')")
+        conn.execute("UPDATE notes SET body = 'wifi too' WHERE id = 'b'")
+        conn.execute("DELETE FROM notes WHERE id = 'a'")
+        found = conn.execute(
+            "SELECT notes.id FROM notes_fts JOIN notes "
+            "ON notes.rowid = notes_fts.rowid WHERE notes_fts MATCH 'wifi'"
+        ).fetchall()
+        self.assertEqual(found, [("b",)])
+
+    def test_sqlite_rebuild_drops_stale_rowids(self):
+        """rebuild indexes the rows again, forgetting renumbered rowids"""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE notes (id TEXT PRIMARY KEY, body TEXT)")
+        for statement in fulltext.sqlite_ddl("notes", "body"):
+            conn.execute(statement)
+        conn.execute("INSERT INTO notes VALUES ('a', 'great wifi')")
+        conn.execute("INSERT INTO notes_fts(rowid, body) VALUES (7, 'wifi')")
+        query = "SELECT rowid FROM notes_fts WHERE notes_fts MATCH 'wifi'"
+        self.assertEqual(len(conn.execute(query).fetchall()), 2)
+        conn.execute(fulltext.sqlite_rebuild("notes"))
+        self.assertEqual(conn.execute(query).fetchall(), [(1,)])
+
+
+class TestInvertedIndex(unittest.TestCase):
+    """Test cases for InvertedIndex Class"""
+
+    def setUp(self):
+        """indexes a few texts"""
+        self.index = InvertedIndex()
+        self.index.add("a", "Great wifi. Wifi everywhere, even the pool")
+        self.index.add("b", "Quiet street close to the beach")
+        self.index.add("c", "The wifi was slow but the beach was near")
+        self.index.add("d", "")
+
+    def test_search_ranks_the_matches(self):
+        """texts using the words more often rank first"""
+        self.assertEqual(self.index.search("wifi"), ["a", "c"])
+        self.assertEqual(self.index.search("beach wifi"), ["c", "a", "b"])
+        self.assertEqual(self.index.search("beach wifi", limit=1), ["c"])
+        self.assertEqual(self.index.search("sauna"), [])
+        self.assertEqual(len(self.index), 3)
+
+    def test_add_replaces_and_remove_forgets(self):
+        """re-adding an id replaces its words, removing drops them"""
+        self.index.add("b", "Fast wifi")
+        self.index.remove("a")
+        self.index.remove("missing")
+        self.assertEqual(self.index.search("wifi"), ["b", "c"])
+        self.assertEqual(self.index.search("street"), [])
+        self.assertEqual(self.index.search("pool"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
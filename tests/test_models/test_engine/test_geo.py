@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+""" Module for testing the geographic helpers of the storage engines"""
+import inspect
+import unittest
+
+import pycodestyle
+
+from models.engine import geo
+
+
+class TestGeoDocsAndStyle(unittest.TestCase):
+    """Tests geo module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/geo.py",
+                "tests/test_models/test_engine/test_geo.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(geo.__doc__) >= 1)
+
+    def test_functions_docstring(self):
+        """Tests whether the functions are documented"""
+        for _, func in inspect.getmembers(geo, inspect.isfunction):
+            if func.__module__ == geo.__name__:
+                self.assertTrue(len(func.__doc__) >= 1)
+
+
+class TestGeo(unittest.TestCase):
+    """Test cases for the geo functions"""
+
+    def test_distance_km(self):
+        """distance_km measures great circle distances"""
+        self.assertEqual(geo.distance_km(6.5, 3.4, 6.5, 3.4), 0)
+        # Lagos to Nairobi is about 3830 km
+        self.assertAlmostEqual(
+            geo.distance_km(6.5244, 3.3792, -1.2921, 36.8219), 3830, delta=20)
+        # one degree of longitude on the equator
+        self.assertAlmostEqual(geo.distance_km(0, 0, 0, 1), 111.19, places=1)
+
+    def test_bounding_box_holds_the_circle(self):
+        """points at radius_km in every direction lie in the box"""
+        box = geo.bounding_box(45.0, 10.0, 100)
+        south, west, north, east = box
+        self.assertAlmostEqual(geo.distance_km(45, 10, north, 10), 100,
+                               places=6)
+        self.assertAlmostEqual(geo.distance_km(45, 10, south, 10), 100,
+                               places=6)
+        self.assertTrue(geo.in_box(45.0, 11.2, box))
+        self.assertFalse(geo.in_box(45.0, 11.5, box))
+        self.assertLess(geo.distance_km(45, 10, 45, east), 101)
+
+    def test_bounding_box_across_the_antimeridian(self):
+        """boxes crossing longitude 180 wrap around"""
+        box = geo.bounding_box(0.0, 179.9, 50)
+        self.assertGreater(box[1], box[3])
+        self.assertTrue(geo.in_box(0.0, -179.9, box))
+        self.assertTrue(geo.in_box(0.0, 179.5, box))
+        self.assertFalse(geo.in_box(0.0, 0.0, box))
+        self.assertEqual(len(geo.split_box(box)), 2)
+
+    def test_bounding_box_near_a_pole(self):
+        """boxes reaching a pole cover every longitude"""
+        box = geo.bounding_box(89.9, 0.0, 50)
+        self.assertEqual((box[1], box[2], box[3]), (-180.0, 90.0, 180.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+#!/usr/bin/python3
+""" Module for testing the in-memory storage indexes"""
+import inspect
+import unittest
+
+import pycodestyle
+
+from models.engine import indexes
+from models.place import Place
+from models.state import State
+
+AmenityIndex = indexes.AmenityIndex
+ForeignKeyIndex = indexes.ForeignKeyIndex
+GridIndex = indexes.GridIndex
+PriceIndex = indexes.PriceIndex
+SortedIndex = indexes.SortedIndex
+
+
+class TestIndexesDocsAndStyle(unittest.TestCase):
+    """Tests indexes module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/indexes.py",
+                "tests/test_models/test_engine/test_indexes.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(indexes.__doc__) >= 1)
+
+    def test_classes_docstring(self):
+        """Tests whether the classes and their methods are documented"""
+        for _, cls in inspect.getmembers(indexes, inspect.isclass):
+            self.assertTrue(len(cls.__doc__) >= 1)
+            for func in inspect.getmembers(cls, inspect.isfunction):
+                self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestSortedIndex(unittest.TestCase):
+    """Test cases for SortedIndex Class"""
+
+    def setUp(self):
+        """indexes a few states by name"""
+        self.index = SortedIndex("name")
+        self.states = [State(name=name) for name in ["b", "c", "a"]]
+        for state in self.states:
+            self.index.add(state)
+
+    def test_ids_are_sorted_by_attribute(self):
+        """after() walks the ids in attribute order"""
+        ids = self.index.after()
+        self.assertEqual(ids, [self.states[i].id for i in (2, 0, 1)])
+        self.assertEqual(len(self.index), 3)
+
+    def test_after_a_position(self):
+        """after() starts right after the given position"""
+        position = self.index.position("a", self.states[2].id)
+        self.assertEqual(self.index.after(position, 1), [self.states[0].id])
+
+    def test_changed_attribute_moves_the_object(self):
+        """adding an object again re-sorts it"""
+        self.states[2].name = "d"
+        self.index.add(self.states[2])
+        self.assertEqual(self.index.after()[-1], self.states[2].id)
+        self.assertEqual(len(self.index), 3)
+
+    def test_remove(self):
+        """removed objects are no longer listed"""
+        self.index.remove(self.states[0].id)
+        self.index.remove("missing")
+        self.assertNotIn(self.states[0].id, self.index.after())
+        self.assertEqual(len(self.index), 2)
+
+
+class TestAmenityIndex(unittest.TestCase):
+    """Test cases for AmenityIndex Class"""
+
+    def setUp(self):
+        """indexes places having some of the amenities a, b and c"""
+        self.index = AmenityIndex()
+        self.places = [Place(amenity_ids=ids)
+                       for ids in (["a", "b"], ["b", "c"], ["a", "b", "c"])]
+        for place in self.places:
+            self.index.add(place)
+
+    def test_places_having_all_amenities(self):
+        """places() intersects the places of every amenity"""
+        ids = [place.id for place in self.places]
+        self.assertEqual(self.index.places(["b"]), set(ids))
+        self.assertEqual(self.index.places(["a", "b"]), {ids[0], ids[2]})
+        self.assertEqual(self.index.places(["a", "c"]), {ids[2]})
+        self.assertEqual(self.index.places(["a", "d"]), set())
+        self.assertEqual(len(self.index), 3)
+
+    def test_changed_amenities_move_the_place(self):
+        """adding a place again replaces its amenities"""
+        self.places[0].amenity_ids = ["c"]
+        self.index.add(self.places[0])
+        self.assertNotIn(self.places[0].id, self.index.places(["a"]))
+        self.assertIn(self.places[0].id, self.index.places(["c"]))
+
+    def test_remove(self):
+        """removed places are no longer found"""
+        self.index.remove(self.places[2].id)
+        self.index.remove("missing")
+        self.assertEqual(self.index.places(["a"]), {self.places[0].id})
+        self.assertEqual(len(self.index), 2)
+
+
+class TestForeignKeyIndex(unittest.TestCase):
+    """Test cases for ForeignKeyIndex Class"""
+
+    def setUp(self):
+        """indexes three places of two cities"""
+        self.index = ForeignKeyIndex("city_id")
+        self.places = [Place(city_id=city_id) for city_id in "aab"]
+        for place in self.places:
+            self.index.add(place)
+
+    def test_children(self):
+        """children() returns the ids of the objects of a parent"""
+        self.assertEqual(sorted(self.index.children("a")),
+                         sorted(p.id for p in self.places[:2]))
+        self.assertEqual(self.index.children("c"), [])
+
+    def test_changed_key_moves_the_object(self):
+        """re-adding an object moves it to its new parent"""
+        self.places[0].city_id = "b"
+        self.index.add(self.places[0])
+        self.assertEqual(self.index.children("a"), [self.places[1].id])
+        self.assertEqual(len(self.index.children("b")), 2)
+
+    def test_remove(self):
+        """removed objects are no longer children"""
+        self.index.remove(self.places[2].id)
+        self.index.remove("missing")
+        self.assertEqual(self.index.children("b"), [])
+        self.assertEqual(len(self.index), 2)
+
+
+class TestGridIndex(unittest.TestCase):
+    """Test cases for GridIndex Class"""
+
+    def setUp(self):
+        """indexes places around Lagos, one in Nairobi and one without
+        coordinates
+        """
+        self.index = GridIndex(0.5)
+        self.places = [Place(latitude=lat, longitude=lon) for lat, lon in (
+            (6.45, 3.39), (6.60, 3.35), (7.10, 3.90), (-1.29, 36.82))]
+        self.places.append(Place())
+        for place in self.places:
+            self.index.add(place)
+
+    def test_within_a_box(self):
+        """within() returns the places in the box only"""
+        found = self.index.within((6.0, 3.0, 7.0, 4.0))
+        self.assertEqual({id for id, _, _ in found},
+                         {self.places[0].id, self.places[1].id})
+        self.assertEqual(len(self.index), 4)
+
+    def test_large_boxes_scan_the_occupied_cells(self):
+        """a box of more cells than the index holds finds the same"""
+        found = self.index.within((-90.0, -180.0, 90.0, 180.0))
+        self.assertEqual(len(found), 4)
+
+    def test_moved_places_follow_their_coordinates(self):
+        """adding a place again moves it to its new cell"""
+        self.places[0].latitude = 7.2
+        self.index.add(self.places[0])
+        found = self.index.within((6.0, 3.0, 7.0, 4.0))
+        self.assertEqual([id for id, _, _ in found], [self.places[1].id])
+        self.places[0].latitude = None
+        self.index.add(self.places[0])
+        self.assertEqual(len(self.index), 3)
+
+    def test_remove(self):
+        """removed places are no longer found"""
+        self.index.remove(self.places[1].id)
+        self.index.remove("missing")
+        found = self.index.within((6.0, 3.0, 7.0, 4.0))
+        self.assertEqual([id for id, _, _ in found], [self.places[0].id])
+
+
+class TestPriceIndex(unittest.TestCase):
+    """Test cases for PriceIndex Class"""
+
+    def setUp(self):
+        """indexes places of two cities and one without a price"""
+        self.index = PriceIndex()
+        self.places = [Place(city_id=city_id, price_by_night=price)
+                       for city_id, price in (("a", 30), ("a", 10),
+                                              ("a", 20), ("a", 40),
+                                              ("b", 25))]
+        self.places.append(Place(city_id="a"))
+        for place in self.places:
+            self.index.add(place)
+
+    def test_range(self):
+        """range() returns the ids in price order within the bounds"""
+        p = [place.id for place in self.places]
+        self.assertEqual(self.index.range("a"), [p[1], p[2], p[0], p[3]])
+        self.assertEqual(self.index.range("a", 15, 30), [p[2], p[0]])
+        self.assertEqual(self.index.range(None, 20, 25), [p[2], p[4]])
+        self.assertEqual(self.index.range("c"), [])
+
+    def test_top_k(self):
+        """limit and descending give the cheapest and dearest places"""
+        p = [place.id for place in self.places]
+        self.assertEqual(self.index.range("a", limit=2), [p[1], p[2]])
+        self.assertEqual(self.index.range("a", limit=2, descending=True),
+                         [p[3], p[0]])
+        self.assertEqual(self.index.range("a", high=30, limit=5,
+                                          descending=True),
+                         [p[0], p[2], p[1]])
+
+    def test_percentile(self):
+        """percentile() uses the nearest rank"""
+        self.assertEqual(self.index.count("a"), 4)
+        self.assertEqual(self.index.percentile(0, "a"), 10)
+        self.assertEqual(self.index.percentile(50, "a"), 20)
+        self.assertEqual(self.index.percentile(75, "a"), 30)
+        self.assertEqual(self.index.percentile(100, "a"), 40)
+        self.assertEqual(self.index.percentile(50), 25)
+        self.assertIsNone(self.index.percentile(50, "c"))
+
+    def test_changed_price_or_city_moves_the_place(self):
+        """re-adding a place moves it to its new price and city"""
+        self.places[3].price_by_night = 5
+        self.places[4].city_id = "a"
+        self.index.add(self.places[3])
+        self.index.add(self.places[4])
+        self.assertEqual(self.index.range("a", limit=1), [self.places[3].id])
+        self.assertEqual(self.index.count("a"), 5)
+        self.assertEqual(self.index.count("b"), 0)
+        self.assertEqual(len(self.index), 5)
+
+    def test_remove(self):
+        """removed places are no longer found"""
+        self.index.remove(self.places[1].id)
+        self.index.remove("missing")
+        self.assertEqual(self.index.percentile(0, "a"), 20)
+        self.assertEqual(self.index.count(), 4)
@@ -0,0 +1,199 @@
+#!/usr/bin/python3
+""" Module for testing the memory-mapped record file storage"""
+import inspect
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pycodestyle
+
+from models.engine import mapped_store
+from models.engine.file_storage import FileStorage
+from models.city import City
+from models.state import State
+
+MappedStore = mapped_store.MappedStore
+RecordFile = mapped_store.RecordFile
+
+
+class TestMappedStoreDocsAndStyle(unittest.TestCase):
+    """Tests mapped_store module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/mapped_store.py",
+                "tests/test_models/test_engine/test_mapped_store.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module and its functions are documented"""
+        self.assertTrue(len(mapped_store.__doc__) >= 1)
+        for func in inspect.getmembers(mapped_store, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+    def test_classes_docstring(self):
+        """Tests whether the classes and their methods are documented"""
+        for cls in (RecordFile, MappedStore):
+            self.assertTrue(len(cls.__doc__) >= 1)
+            for func in vars(cls).values():
+                if inspect.isfunction(func):
+                    self.assertTrue(len(func.__doc__) >= 1)
+
+
+class TestRecordFile(unittest.TestCase):
+    """Test cases for the record file format"""
+
+    def setUp(self):
+        """writes 500 records to a temporary file"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "file.json.rec")
+        self.items = [("State.{}".format(i),
+                       json.dumps({"id": str(i)}).encode())
+                      for i in range(500)]
+        mapped_store.write(self.path, self.items)
+        self.records = RecordFile(self.path)
+        self.addCleanup(self.records.close)
+
+    def test_lookup(self):
+        """every key finds its record, other keys none"""
+        self.assertTrue(mapped_store.is_record_file(self.path))
+        self.assertEqual(len(self.records), 500)
+        for key, data in self.items:
+            self.assertEqual(self.records.get(key), data)
+        self.assertIsNone(self.records.get("City.1"))
+        self.assertNotIn("State.500", self.records)
+        self.assertIn("State.499", self.records)
+
+    def test_items_keep_the_order(self):
+        """items yields the records in the order they were written"""
+        self.assertEqual(list(self.records.items()), self.items)
+
+    def test_empty_and_invalid_files(self):
+        """an empty file holds nothing, other files are refused"""
+        mapped_store.write(self.path + "2", [])
+        empty = RecordFile(self.path + "2")
+        self.assertEqual((len(empty), empty.get("State.1")), (0, None))
+        self.assertEqual(list(empty.items()), [])
+        with open(self.path + "3", "w") as f:
+            json.dump({"State.1": {}}, f)
+        self.assertFalse(mapped_store.is_record_file(self.path + "3"))
+        with self.assertRaises(ValueError):
+            RecordFile(self.path + "3")
+        with self.assertRaises(ValueError):
+            mapped_store.write(self.path + "4", [("State.\t", b"{}")])
+
+
+class TestMappedStore(unittest.TestCase):
+    """Test cases for MappedStore Class"""
+
+    def setUp(self):
+        """maps a file holding a state and a city"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "file.json.rec")
+        self.state = State(name="Lagos")
+        self.city = City(name="Ikeja", state_id=self.state.id)
+        self.keys = ["State." + self.state.id, "City." + self.city.id]
+        mapped_store.write(self.path, [
+            (self.keys[0], self.state.to_json()),
+            (self.keys[1], self.city.to_json())])
+        self.store = MappedStore(FileStorage().get_class)
+        self.store.map(RecordFile(self.path))
+
+    def test_objects_are_built_once(self):
+        """a record is built on first access, then the instance is kept"""
+        state = self.store[self.keys[0]]
+        self.assertIsInstance(state, State)
+        self.assertEqual(state.to_dict(), self.state.to_dict())
+        self.assertIs(self.store[self.keys[0]], state)
+        self.assertEqual(list(self.store), [self.keys[0], self.keys[1]])
+
+    def test_mapping_interface(self):
+        """stored and deleted objects hide the records"""
+        other = State(name="Ogun")
+        self.store["State." + other.id] = other
+        del self.store[self.keys[1]]
+        self.assertEqual(len(self.store), 2)
+        self.assertNotIn(self.keys[1], self.store)
+        self.assertIsNone(self.store.get(self.keys[1]))
+        with self.assertRaises(KeyError):
+            del self.store[self.keys[1]]
+        self.assertEqual(dict(self.store.json_items()), {
+            "State." + other.id: other.to_json(),
+            self.keys[0]: self.state.to_json()})
+
+        mapped_store.write(self.path + "2", self.store.json_items())
+        self.store.map(RecordFile(self.path + "2"))
+        self.store[self.keys[1]] = self.city
+        self.assertEqual(len(self.store), 3)
+
+
+class TestMappedFileStorage(unittest.TestCase):
+    """Test cases for FileStorage with HBNB_FILE_MAPPED set"""
+
+    def setUp(self):
+        """creates a mapped storage writing to a temporary directory"""
+        objects = patch.object(FileStorage, "_FileStorage__objects", {})
+        objects.start()
+        self.addCleanup(objects.stop)
+        with patch.dict(os.environ, {"HBNB_FILE_MAPPED": "1"}):
+            self.storage = FileStorage()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "file.json")
+        self.storage._FileStorage__file_path = self.path
+
+    def test_save_and_reload(self):
+        """reloading maps the file, objects are read when looked up"""
+        state = State(name="Alabama")
+        city = City(name="Mobile", state_id=state.id)
+        self.storage.new(state)
+        self.storage.new(city)
+        self.storage.save()
+        self.assertTrue(os.path.isfile(self.path + ".rec"))
+        self.storage.reload()
+
+        store = self.storage._FileStorage__objects
+        self.assertIsInstance(store, MappedStore)
+        loaded = self.storage.get(State, state.id)
+        self.assertEqual(loaded.to_dict(), state.to_dict())
+        self.assertEqual(list(store._MappedStore__objects),
+                         ["State." + state.id])
+        self.assertEqual(self.storage.count(), 2)
+
+        loaded.name = "Alaska"
+        self.storage.new(loaded)
+        self.storage.delete(self.storage.get(City, city.id))
+        self.storage.save()
+        self.storage.reload()
+        self.assertEqual(self.storage.get(State, state.id).name, "Alaska")
+        self.assertIsNone(self.storage.get(City, city.id))
+        self.assertEqual(self.storage.count(), 1)
+
+    def test_json_file_is_converted(self):
+        """a JSON store is converted on reload, and read back unmapped"""
+        state = State(name="Alabama")
+        with open(self.path, "w") as f:
+            json.dump({"State." + state.id: state.to_dict()}, f)
+        self.storage.reload()
+        self.assertTrue(os.path.isfile(self.path + ".rec"))
+        self.assertEqual(self.storage.get(State, state.id).name, "Alabama")
+        self.storage.save()
+        self.assertFalse(os.path.isfile(self.path))
+
+        plain = FileStorage()
+        plain._FileStorage__objects = {}
+        plain._FileStorage__file_path = self.path
+        plain.reload()
+        self.assertEqual(plain.get(State, state.id).name, "Alabama")
+
+
+if __name__ == "__main__":
+    unittest.main()
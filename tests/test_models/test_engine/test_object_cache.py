@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+""" Module for testing the object cache"""
+import inspect
+import unittest
+from unittest.mock import patch
+
+import pycodestyle
+
+from models.amenity import Amenity
+from models.engine import object_cache
+from models.review import Review
+
+ObjectCache = object_cache.ObjectCache
+
+
+class TestObjectCacheDocsAndStyle(unittest.TestCase):
+    """Tests ObjectCache class for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/object_cache.py",
+                "tests/test_models/test_engine/test_object_cache.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(object_cache.__doc__) >= 1)
+
+    def test_class_docstring(self):
+        """Tests whether the class is documented"""
+        self.assertTrue(len(ObjectCache.__doc__) >= 1)
+
+    def test_methods_docstring(self):
+        """Tests whether the class methods are documented"""
+        funcs = inspect.getmembers(ObjectCache, inspect.isfunction)
+        for func in funcs:
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestObjectCache(unittest.TestCase):
+    """Test cases for ObjectCache Class"""
+
+    def setUp(self):
+        """creates a cache of three objects pinning amenities"""
+        self.evicted = []
+        self.cache = ObjectCache(max_objects=3, pinned=["Amenity"],
+                                 on_evict=self.evicted.append)
+
+    def test_least_recently_used_objects_are_evicted(self):
+        """the cache keeps at most max_objects objects"""
+        reviews = [Review() for _ in range(4)]
+        self.cache.touch(reviews[:3])
+        self.cache.touch(reviews[:1])
+        self.cache.touch(reviews[3:])
+        self.assertEqual(self.evicted, [reviews[1]])
+        self.assertIs(self.cache.lookup("Review", reviews[0].id), reviews[0])
+        self.assertIsNone(self.cache.lookup("Review", reviews[1].id))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_pinned_classes_stay_resident(self):
+        """objects of pinned classes are not evicted for size"""
+        amenities = [Amenity() for _ in range(3)]
+        self.cache.touch(amenities)
+        self.cache.touch([Review(), Review()])
+        for amenity in amenities:
+            self.assertIs(self.cache.lookup("Amenity", amenity.id), amenity)
+        self.assertEqual(self.cache.stats()["pinned"], 3)
+
+    def test_byte_limit(self):
+        """objects are evicted once max_bytes is exceeded"""
+        review = Review()
+        size = object_cache.object_size(review)
+        cache = ObjectCache(max_objects=10, max_bytes=size * 2)
+        cache.touch([review, Review(), Review()])
+        self.assertLessEqual(cache.stats()["bytes"], size * 2)
+        self.assertIsNone(cache.lookup("Review", review.id))
+
+    def test_sweep_evicts_expired_objects(self):
+        """sweep drops every object older than the ttl, pinned or not"""
+        amenity = Amenity()
+        with patch("time.monotonic", return_value=0):
+            self.cache.touch([amenity])
+        with patch("time.monotonic", return_value=self.cache.ttl + 1):
+            self.cache.sweep()
+        self.assertEqual(self.evicted, [amenity])
+
+    def test_discard(self):
+        """discarded objects are dropped without on_evict"""
+        review = Review()
+        self.cache.touch([review])
+        self.cache.discard(review)
+        self.assertIsNone(self.cache.lookup("Review", review.id))
+        self.assertEqual(self.evicted, [])
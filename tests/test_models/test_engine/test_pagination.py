@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+""" Module for testing the pagination helpers"""
+import inspect
+import unittest
+from datetime import datetime
+
+import pycodestyle
+
+from models.engine import pagination
+from models.state import State
+from models.user import User
+
+
+class TestPaginationDocsAndStyle(unittest.TestCase):
+    """Tests pagination module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/pagination.py",
+                "tests/test_models/test_engine/test_pagination.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(pagination.__doc__) >= 1)
+
+    def test_functions_docstring(self):
+        """Tests whether the functions are documented"""
+        funcs = inspect.getmembers(pagination, inspect.isfunction)
+        for func in funcs:
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for the pagination helpers"""
+
+    def test_cursor_round_trip(self):
+        """a cursor decodes to the values of the object it was made of"""
+        state = State(name="Lagos")
+        cursor = pagination.encode_cursor(state, "created_at")
+        self.assertIsInstance(cursor, str)
+        self.assertEqual(pagination.decode_cursor(cursor, "created_at"),
+                         (state.created_at, state.id))
+        cursor = pagination.encode_cursor(state, "name")
+        self.assertEqual(pagination.decode_cursor(cursor, "name"),
+                         ("Lagos", state.id))
+
+    def test_empty_cursor_means_first_page(self):
+        """no cursor decodes to None"""
+        self.assertIsNone(pagination.decode_cursor(None, "name"))
+        self.assertIsNone(pagination.decode_cursor("", "name"))
+
+    def test_malformed_cursor_raises_value_error(self):
+        """garbage cursors raise a ValueError"""
+        for cursor in ["!!!", "bm90IGpzb24=", "WzFd"]:
+            with self.assertRaises(ValueError):
+                pagination.decode_cursor(cursor, "created_at")
+
+    def test_check_order(self):
+        """only indexed orders of columns of the class are accepted"""
+        pagination.check_order("name")
+        with self.assertRaises(ValueError):
+            pagination.check_order("price_by_night")
+        pagination.check_order("name", State)
+        with self.assertRaises(ValueError):
+            pagination.check_order("name", User)
+
+    def test_sort_value_puts_none_first(self):
+        """None sorts before any value"""
+        values = [datetime(2020, 1, 2), None, datetime(2020, 1, 1)]
+        self.assertEqual(sorted(values, key=pagination.sort_value),
+                         [None, datetime(2020, 1, 1), datetime(2020, 1, 2)])
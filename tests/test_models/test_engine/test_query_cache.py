@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+""" Module for testing the query cache"""
+import inspect
+import unittest
+from unittest.mock import patch
+
+import pycodestyle
+
+from models.engine import query_cache
+
+QueryCache = query_cache.QueryCache
+
+
+class TestQueryCacheDocsAndStyle(unittest.TestCase):
+    """Tests QueryCache class for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/query_cache.py",
+                "tests/test_models/test_engine/test_query_cache.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(query_cache.__doc__) >= 1)
+
+    def test_class_docstring(self):
+        """Tests whether the class is documented"""
+        self.assertTrue(len(QueryCache.__doc__) >= 1)
+
+    def test_methods_docstring(self):
+        """Tests whether the class methods are documented"""
+        funcs = inspect.getmembers(QueryCache, inspect.isfunction)
+        for func in funcs:
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test cases for QueryCache Class"""
+
+    def setUp(self):
+        """creates a small cache recording evicted values"""
+        self.evicted = []
+        self.cache = QueryCache(ttl=60, max_size=2,
+                                on_evict=self.evicted.append)
+
+    def test_lookup_counts_hits_and_misses(self):
+        """lookups return stored values and update the counters"""
+        self.assertEqual(self.cache.lookup("a"), (False, None))
+        self.cache.put("a", ["State"], 1)
+        self.assertEqual(self.cache.lookup("a"), (True, 1))
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["size"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """the cache never holds more than max_size entries"""
+        self.cache.put("a", ["State"], 1)
+        self.cache.put("b", ["City"], 2)
+        self.cache.lookup("a")
+        self.cache.put("c", ["User"], 3)
+        self.assertEqual(self.evicted, [2])
+        self.assertTrue(self.cache.lookup("a")[0])
+        self.assertFalse(self.cache.lookup("b")[0])
+
+    def test_invalidate_drops_entries_of_a_class(self):
+        """invalidate drops only the entries depending on the classes"""
+        self.cache.put("a", ["State", "City"], 1)
+        self.cache.put("b", ["Amenity"], 2)
+        self.cache.invalidate(["City"])
+        self.assertFalse(self.cache.lookup("a")[0])
+        self.assertTrue(self.cache.lookup("b")[0])
+        self.assertEqual(self.evicted, [1])
+
+    def test_values_yields_every_entry(self):
+        """values yields the stored values, oldest first"""
+        self.cache.put("a", ["State"], 1)
+        self.cache.put("b", ["City"], 2)
+        self.assertEqual(list(self.cache.values()), [1, 2])
+
+    def test_entries_expire_after_the_ttl(self):
+        """expired entries are reported as misses"""
+        with patch("time.monotonic", return_value=0):
+            self.cache.put("a", ["State"], 1)
+        with patch("time.monotonic", return_value=61):
+            self.assertFalse(self.cache.lookup("a")[0])
+
+    def test_zero_ttl_disables_the_cache(self):
+        """a cache without ttl or size is disabled"""
+        self.assertTrue(self.cache.enabled)
+        self.assertFalse(QueryCache().enabled)
+        self.assertFalse(QueryCache(ttl=5, max_size=0).enabled)
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+""" Module for testing the SQL statement statistics"""
+import inspect
+import unittest
+
+import pycodestyle
+from sqlalchemy import create_engine, text
+
+from models.engine import query_stats
+
+QueryStats = query_stats.QueryStats
+
+
+class Owner:
+    """storage-like class whose methods run statements"""
+
+    def __init__(self, engine):
+        """keeps the engine statements run on"""
+        self.engine = engine
+
+    def run(self, sql):
+        """runs sql through a helper"""
+        return self._execute(sql)
+
+    def _execute(self, sql):
+        """runs sql"""
+        with self.engine.connect() as conn:
+            return conn.execute(text(sql)).fetchall()
+
+
+class TestQueryStatsDocsAndStyle(unittest.TestCase):
+    """Tests QueryStats class for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/query_stats.py",
+                "tests/test_models/test_engine/test_query_stats.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(query_stats.__doc__) >= 1)
+
+    def test_class_docstring(self):
+        """Tests whether the class is documented"""
+        self.assertTrue(len(QueryStats.__doc__) >= 1)
+
+    def test_methods_docstring(self):
+        """Tests whether the class methods are documented"""
+        funcs = inspect.getmembers(QueryStats, inspect.isfunction)
+        for func in funcs:
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestQueryStats(unittest.TestCase):
+    """Test cases for QueryStats Class"""
+
+    def setUp(self):
+        """times the statements of an in-memory SQLite engine"""
+        self.engine = create_engine("sqlite://")
+        self.stats = QueryStats(Owner, slow_ms=1000)
+        self.stats.attach(self.engine)
+        self.owner = Owner(self.engine)
+
+    def test_statements_are_grouped_by_public_method(self):
+        """statements are reported under the method that issued them"""
+        self.owner.run("SELECT 1")
+        self.owner.run("SELECT 2")
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 3"))
+        methods = self.stats.report()["methods"]
+        self.assertEqual(methods["run"]["count"], 2)
+        self.assertEqual(methods[None]["count"], 1)
+        self.assertEqual(sum(methods["run"]["buckets"].values()), 2)
+        self.assertLessEqual(methods["run"]["avg_ms"],
+                             methods["run"]["max_ms"])
+
+    def test_slow_statements_are_logged(self):
+        """statements over the threshold land in the slow query log"""
+        with self.assertLogs(query_stats.logger, "WARNING"):
+            self.stats.record("SELECT slow", 2000, 3, "run")
+        self.stats.record("SELECT fast", 2, 3, "run")
+        slow = self.stats.report()["slow"]
+        self.assertEqual([q["statement"] for q in slow], ["SELECT slow"])
+        self.assertEqual(self.stats.report()["methods"]["run"]["rows"], 6)
+
+    def test_buckets(self):
+        """durations fall in the first bucket they fit"""
+        for ms in (0.5, 3, 3, 5000):
+            self.stats.record("SELECT 1", ms)
+        buckets = self.stats.report()["methods"][None]["buckets"]
+        self.assertEqual(buckets["<=1ms"], 1)
+        self.assertEqual(buckets["<=5ms"], 2)
+        self.assertEqual(buckets[">1000ms"], 1)
+
+    def test_reset(self):
+        """reset clears the histograms and the slow query log"""
+        self.owner.run("SELECT 1")
+        self.stats.reset()
+        self.assertEqual(self.stats.report(), {"methods": {}, "slow": []})
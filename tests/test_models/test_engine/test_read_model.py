@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+""" Module for testing the read model of the /hbnb page"""
+import inspect
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+import pycodestyle
+
+from models.amenity import Amenity
+from models.city import City
+from models.engine import read_model
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+HbnbReadModel = read_model.HbnbReadModel
+
+
+class TestReadModelDocsAndStyle(unittest.TestCase):
+    """Tests read_model module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/read_model.py",
+                "tests/test_models/test_engine/test_read_model.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module and its functions are documented"""
+        self.assertTrue(len(read_model.__doc__) >= 1)
+        self.assertTrue(len(read_model.by_name.__doc__) >= 1)
+
+    def test_class_docstring(self):
+        """Tests whether the class and its methods are documented"""
+        self.assertTrue(len(HbnbReadModel.__doc__) >= 1)
+        for func in inspect.getmembers(HbnbReadModel, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+@unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                 'FileStorage Not In Use')
+class TestHbnbReadModel(unittest.TestCase):
+    """Test cases for HbnbReadModel Class on FileStorage"""
+
+    def setUp(self):
+        """stores a state, two cities, a user, two amenities, two places
+        and a review in an empty storage
+        """
+        self.file_path = "file.json"
+        with open(self.file_path, 'w') as f:
+            json.dump({}, f)
+        self.storage = FileStorage()
+        self.storage.reload()
+        patcher = patch("models.storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.state = State(name="Lagos")
+        self.cities = [City(name=name, state_id=self.state.id)
+                       for name in ("Lekki", "Ikeja")]
+        self.user = User(first_name="Ada", last_name="Obi")
+        self.amenities = [Amenity(name=name) for name in ("Wifi", "Pool")]
+        self.places = [
+            Place(name=name, city_id=self.cities[0].id, user_id=self.user.id,
+                  price_by_night=price)
+            for name, price in (("Villa", 200), ("Flat", 50))]
+        self.places[0].amenity_ids = [a.id for a in self.amenities]
+        self.review = Review(place_id=self.places[0].id,
+                             user_id=self.user.id, text="Lovely")
+        for obj in [self.state, self.user, self.review] + self.cities + \
+                self.amenities + self.places:
+            self.storage.new(obj)
+        self.page = self.storage.hbnb_read_model()
+
+    def tearDown(self):
+        """cleanup test files"""
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+    def test_states_and_amenities_are_sorted(self):
+        """states hold their cities, both sorted by name"""
+        self.assertEqual(self.page.states(), [{
+            "id": self.state.id, "name": "Lagos",
+            "cities": [{"id": self.cities[1].id, "name": "Ikeja"},
+                       {"id": self.cities[0].id, "name": "Lekki"}]}])
+        self.assertEqual([a["name"] for a in self.page.amenities()],
+                         ["Pool", "Wifi"])
+
+    def test_places_hold_what_the_page_shows(self):
+        """place entries carry owner, amenity names and reviews"""
+        flat, villa = self.page.places(self.places)
+        self.assertEqual(flat["name"], "Flat")
+        self.assertEqual(villa["owner"], "Ada Obi")
+        self.assertEqual(villa["amenities"], ["Pool", "Wifi"])
+        self.assertEqual(villa["reviews"], [{
+            "author": "Ada", "text": "Lovely",
+            "date": self.review.created_at.date().isoformat()}])
+        self.assertIs(self.page.places(self.places[:1])[0], villa)
+
+    def test_writes_patch_the_model(self):
+        """writes drop the entries showing the written objects"""
+        self.page.states()
+        self.page.places(self.places)
+        self.user.first_name = "Bola"
+        self.storage.new(self.user)
+        self.storage.new(City(name="Agege", state_id=self.state.id))
+        self.storage.delete(self.review)
+        villa = self.page.places(self.places[:1])[0]
+        self.assertEqual(villa["owner"], "Bola Obi")
+        self.assertEqual(villa["reviews"], [])
+        self.assertEqual(self.page.states()[0]["cities"][0]["name"],
+                         "Agege")
+
+        self.amenities[0].name = "Fast wifi"
+        self.storage.new(self.amenities[0])
+        self.assertEqual(self.page.places(self.places[:1])[0]["amenities"],
+                         ["Fast wifi", "Pool"])
+        self.assertEqual(self.page.amenities()[0]["name"], "Fast wifi")
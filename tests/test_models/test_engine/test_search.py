@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+""" Module for testing the faceted place search"""
+import inspect
+import unittest
+
+import pycodestyle
+
+from models.engine import search
+from models.place import Place
+
+PlaceSearch = search.PlaceSearch
+
+
+class TestSearchDocsAndStyle(unittest.TestCase):
+    """Tests search module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            [
+                "models/engine/search.py",
+                "tests/test_models/test_engine/test_search.py"
+            ])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(search.__doc__) >= 1)
+
+    def test_class_docstring(self):
+        """Tests whether the class and its methods are documented"""
+        self.assertTrue(len(PlaceSearch.__doc__) >= 1)
+        for func in inspect.getmembers(PlaceSearch, inspect.isfunction):
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestPlaceSearch(unittest.TestCase):
+    """Test cases for PlaceSearch Class"""
+
+    def setUp(self):
+        """indexes four places in three cities of two states"""
+        self.index = PlaceSearch()
+        self.index.set_city("lagos", "LA")
+        self.index.set_city("ikeja", "LA")
+        self.index.set_city("abuja", "FC")
+        rows = (("lagos", 100, 2, ["wifi", "pool"]),
+                ("lagos", 250, 4, ["wifi"]),
+                ("ikeja", 80, 2, []),
+                ("abuja", 120, 6, ["wifi", "pool"]))
+        self.places = [
+            Place(city_id=city_id, price_by_night=price, max_guest=guests,
+                  number_rooms=1, amenity_ids=amenity_ids)
+            for city_id, price, guests, amenity_ids in rows]
+        for place in self.places:
+            self.index.add(place)
+        self.ids = [place.id for place in self.places]
+
+    def test_no_filter_counts_everything(self):
+        """without filters every place matches and is counted"""
+        ids, facets = self.index.search()
+        self.assertEqual(ids, self.ids)
+        self.assertEqual(facets["state"], {"LA": 3, "FC": 1})
+        self.assertEqual(facets["city"],
+                         {"lagos": 2, "ikeja": 1, "abuja": 1})
+        self.assertEqual(facets["amenity"], {"wifi": 3, "pool": 2})
+        self.assertEqual(facets["number_rooms"], {1: 4})
+        self.assertEqual(len(self.index), 4)
+
+    def test_filters_combine(self):
+        """filters of different facets are ANDed"""
+        ids, facets = self.index.search({
+            "state": ["LA"], "amenity": ["wifi"],
+            "price_by_night": (None, 200)})
+        self.assertEqual(ids, [self.ids[0]])
+        # other states still count the places matching the other filters
+        self.assertEqual(facets["state"], {"LA": 1, "FC": 1})
+        self.assertEqual(facets["amenity"], {"wifi": 1, "pool": 1})
+        self.assertEqual(facets["price_by_night"], {100: 1, 250: 1})
+
+    def test_values_of_one_facet_are_ored(self):
+        """several cities match places of any of them"""
+        ids, _ = self.index.search({"city": ["ikeja", "abuja"],
+                                    "max_guest": (3, None)})
+        self.assertEqual(ids, [self.ids[3]])
+        ids, _ = self.index.search({"city": [], "max_guest": (None, None)})
+        self.assertEqual(ids, self.ids)
+
+    def test_updates_and_removals(self):
+        """added places move between postings, removed ones vanish"""
+        self.places[2].amenity_ids = ["pool"]
+        self.index.add(self.places[2])
+        self.index.remove(self.ids[3])
+        self.index.remove("missing")
+        ids, facets = self.index.search({"amenity": ["pool"]})
+        self.assertEqual(ids, [self.ids[0], self.ids[2]])
+        self.assertEqual(facets["state"], {"LA": 2})
+        other = Place(city_id="abuja", price_by_night=90)
+        self.index.add(other)
+        ids, _ = self.index.search({"state": ["FC"]})
+        self.assertEqual(ids, [other.id])
+
+    def test_unknown_facet(self):
+        """searching on an unknown facet raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.index.search({"color": ["red"]})
+
+    def test_rows_of(self):
+        """rows_of lists the set bits"""
+        self.assertEqual(search.rows_of(0), [])
+        self.assertEqual(search.rows_of(0b1000000101), [0, 2, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+"""Module test_ids
+This Module contains tests for the id generators
+"""
+
+import inspect
+import unittest
+from unittest.mock import patch
+from uuid import UUID
+
+import pycodestyle
+
+from models import ids
+
+
+class TestIdsDocsAndStyle(unittest.TestCase):
+    """Tests ids module for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            ["models/ids.py", "tests/test_models/test_ids.py"])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(ids.__doc__) >= 1)
+
+    def test_functions_docstring(self):
+        """Tests whether the functions are documented"""
+        funcs = inspect.getmembers(ids, inspect.isfunction)
+        for func in funcs:
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestIds(unittest.TestCase):
+    """Test cases for the id generators"""
+
+    def test_uuid4_ids(self):
+        """uuid4 ids are version 4 UUID strings"""
+        self.assertEqual(UUID(ids.new_id("uuid4")).version, 4)
+
+    def test_uuid7_ids(self):
+        """uuid7 ids are version 7 UUID strings in creation order"""
+        batch = ids.batch_ids(100, "uuid7")
+        singles = [ids.new_id("uuid7") for _ in range(100)]
+        for id in batch + singles:
+            self.assertEqual(UUID(id).version, 7)
+            self.assertEqual(len(id), 36)
+        self.assertEqual(batch + singles, sorted(batch + singles))
+        self.assertEqual(len(set(batch + singles)), 200)
+
+    def test_ulid_ids(self):
+        """ulid ids are 26 base32 characters in creation order"""
+        batch = ids.batch_ids(100, "ulid")
+        later = ids.batch_ids(3, "ulid")
+        for id in batch + later:
+            self.assertEqual(len(id), 26)
+            self.assertTrue(set(id) <= set(ids.CROCKFORD))
+        self.assertEqual(batch + later, sorted(batch + later))
+
+    def test_ids_keep_their_order_across_milliseconds(self):
+        """ids made in a later millisecond sort after earlier ones"""
+        with patch.dict(ids._last, clear=True):
+            with patch("time.time_ns", return_value=2000000000000000000):
+                first = ids.new_id("uuid7")
+            with patch("time.time_ns", return_value=2000000000001000000):
+                second = ids.new_id("uuid7")
+        self.assertLess(first, second)
+        self.assertEqual(first[:13], "01d1a94a-2000")
+
+    def test_unknown_scheme(self):
+        """unknown schemes raise a ValueError"""
+        with self.assertRaises(ValueError):
+            ids.new_id("uuid1")
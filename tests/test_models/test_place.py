@@ -3,6 +3,7 @@
 This Module contains a tests for Place Class
 """
 
+import json
 import sys
 import unittest
 import uuid
@@ -87,6 +88,41 @@ class TestPlace(unittest.TestCase):
 
         self.assertTrue(type(getattr(self.test_obj, "amenity_ids")), list)
 
+    def test_amenity_ids_are_per_instance(self):
+        """adding an amenity to a place does not change other places"""
+        from models.amenity import Amenity
+
+        place, other = Place(), Place()
+        amenity = Amenity(name="Wifi")
+        place.amenities = amenity
+        place.amenities = amenity
+        self.assertEqual(place.amenity_ids, [amenity.id])
+        self.assertEqual(list(other.amenity_ids), [])
+        self.assertEqual(place.to_dict()["amenity_ids"], [amenity.id])
+
+    def test_amenity_ids_keep_a_set(self):
+        """amenity_ids find ids through a set and serialize as a list"""
+        from models.amenity import Amenity
+        from models.place import AmenityIds
+
+        wifi, pool = Amenity(name="Wifi"), Amenity(name="Pool")
+        place = Place(amenity_ids=[wifi.id])
+        place.amenities = wifi
+        place.amenities = pool
+        ids = place.amenity_ids
+        self.assertIsInstance(ids, AmenityIds)
+        self.assertEqual(ids, [wifi.id, pool.id])
+        self.assertIn(pool.id, ids)
+        self.assertEqual(json.loads(place.to_json())["amenity_ids"],
+                         [wifi.id, pool.id])
+        ids.remove(wifi.id)
+        self.assertNotIn(wifi.id, ids)
+        place.amenities = wifi
+        self.assertIs(place.amenity_ids, ids)
+        self.assertEqual(ids, [pool.id, wifi.id])
+        del ids[:]
+        self.assertNotIn(pool.id, ids)
+
     def test_bas_str_should_print_formatted_output(self):
         """__str__ should print [<class name>] (<self.id>) <self.__dict__>"""
         self.test_obj.my_number = 89
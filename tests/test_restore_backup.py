@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Module test_restore_backup
+This Module contains tests for the restore_backup script
+"""
+
+import contextlib
+import inspect
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import pycodestyle
+
+import restore_backup
+from models.engine import backup
+
+
+class TestRestoreBackupDocsAndStyle(unittest.TestCase):
+    """Tests restore_backup for documentation and style conformance"""
+
+    def test_pycodestyle(self):
+        """Tests compliance with pycodestyle"""
+        style = pycodestyle.StyleGuide(quiet=False)
+        result = style.check_files(
+            ["restore_backup.py", "tests/test_restore_backup.py"])
+        self.assertEqual(result.total_errors, 0)
+
+    def test_module_docstring(self):
+        """Tests whether the module is documented"""
+        self.assertTrue(len(restore_backup.__doc__) >= 1)
+
+    def test_functions_docstring(self):
+        """Tests whether the functions are documented"""
+        funcs = inspect.getmembers(restore_backup, inspect.isfunction)
+        for func in funcs:
+            self.assertTrue(len(func[1].__doc__) >= 1)
+
+
+class TestRestoreBackup(unittest.TestCase):
+    """Test cases for the restore_backup script"""
+
+    def test_main_restores_a_file_storage_backup(self):
+        """main writes the JSON file of the chain and lists it"""
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = os.path.join(tmp, "backups")
+            for kind, line in ((backup.FULL, b'{"name": "A"}'),
+                               (backup.INCREMENT, b'{"name": "B"}')):
+                backup.write(backup.next_path(directory, kind), "file",
+                             [backup.entry("State.1", line)])
+            target = os.path.join(tmp, "file.json")
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                restore_backup.main(directory, target)
+            with open(target) as f:
+                self.assertEqual(json.load(f), {"State.1": {"name": "B"}})
+            self.assertIn("restored 2 checkpoint(s)", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,8 +14,8 @@ app = Flask(__name__)
 @app.route("/hbnb_filters", strict_slashes=False)
 def hbnb_filters():
     """Displays the main HBnB filters HTML page."""
-    states = storage.all("State")
-    amenities = storage.all("Amenity")
+    states = storage.snapshot("State")
+    amenities = storage.snapshot("Amenity")
     return render_template("10-hbnb_filters.html",
                            states=states, amenities=amenities)
 
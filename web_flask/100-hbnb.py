@@ -2,23 +2,56 @@
 """Starts a Flask web application.
 The application listens on 0.0.0.0, port 5000.
 Routes:
-    /hbnb: HBnB home page.
+    /hbnb: HBnB home page, filtered by the query string.
+    /hbnb/search: places and facet counts matching the query string,
+        as JSON.
+Query string: states, cities and amenities ids (repeated), price_min,
+price_max, guests_min and rooms_min.
+With a database storage, the page data and the search index see the
+writes of other processes once they are HBNB_READ_MODEL_TTL and
+HBNB_SEARCH_TTL seconds old, by default on every request.
 """
 from models import storage
 from flask import Flask
-from flask import render_template
+from flask import jsonify, render_template, request
 
 app = Flask(__name__)
 
 
+def search_filters(args):
+    """Builds the search_places filters from a query string."""
+    def bound(name):
+        value = args.get(name, "")
+        return int(value) if value.isdigit() else None
+
+    return {
+        "state": args.getlist("states"),
+        "city": args.getlist("cities"),
+        "amenity": args.getlist("amenities"),
+        "price_by_night": (bound("price_min"), bound("price_max")),
+        "max_guest": (bound("guests_min"), None),
+        "number_rooms": (bound("rooms_min"), None),
+    }
+
+
 @app.route("/hbnb", strict_slashes=False)
 def hbnb():
     """Displays the main HBnB filters HTML page."""
-    states = storage.all("State")
-    amenities = storage.all("Amenity")
-    places = storage.all("Place")
+    filters = search_filters(request.args)
+    places, facets = storage.search_places(filters)
+    page = storage.hbnb_read_model()
     return render_template("100-hbnb.html",
-                           states=states, amenities=amenities, places=places)
+                           states=page.states(), amenities=page.amenities(),
+                           places=page.places(places),
+                           facets=facets, filters=filters)
+
+
+@app.route("/hbnb/search", strict_slashes=False)
+def hbnb_search():
+    """Returns the matching places and the facet counts as JSON."""
+    places, facets = storage.search_places(search_filters(request.args))
+    return jsonify(places=[place.to_dict() for place in places],
+                   facets=facets)
 
 
 @app.teardown_appcontext
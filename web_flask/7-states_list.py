@@ -24,7 +24,7 @@ def states_list():
     Returns:
         string: simple message
     """
-    states = list(storage.all(State).values())
+    states = list(storage.snapshot(State).values())
     return render_template("7-states_list.html", states=states)
 
 
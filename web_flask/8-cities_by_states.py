@@ -16,7 +16,7 @@ def cities_by_states():
     """Displays an HTML page with a list of all states and related cities.
     States/cities are sorted by name.
     """
-    states = storage.all("State")
+    states = storage.snapshot("State")
     return render_template("8-cities_by_states.html", states=states)
 
 
@@ -17,17 +17,17 @@ def states():
     """Displays an HTML page with a list of all States.
     States are sorted by name.
     """
-    states = storage.all("State")
+    states = storage.snapshot("State")
     return render_template("9-states.html", state=states)
 
 
 @app.route("/states/<id>", strict_slashes=False)
 def states_id(id):
     """Displays an HTML page with info about <id>, if it exists."""
-    for state in storage.all("State").values():
-        if state.id == id:
-            return render_template("9-states.html", state=state)
-    return render_template("9-states.html")
+    state = storage.get("State", id)
+    if state is None:
+        return render_template("9-states.html")
+    return render_template("9-states.html", state=state)
 
 
 @app.teardown_appcontext